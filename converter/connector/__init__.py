@@ -1,11 +1,15 @@
 from .base import BaseConnector
 from .csv import CsvConnector
 from .db import PostgresConnector, SQLiteConnector, SQLServerConnector
+from .feather import FeatherConnector
+from .parquet import ParquetConnector
 
 
 __all__ = [
     "BaseConnector",
     "CsvConnector",
+    "FeatherConnector",
+    "ParquetConnector",
     "SQLiteConnector",
     "PostgresConnector",
     "SQLServerConnector",
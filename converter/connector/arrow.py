@@ -0,0 +1,142 @@
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional
+
+import pandas as pd
+import pyarrow as pa
+
+from converter.types.notset import NotSetType
+
+
+def column_to_array(
+    values: pd.Series, data_type: Optional[pa.DataType] = None
+) -> pa.Array:
+    """
+    Converts the column to an arrow array. ``None``, ``NotSet`` and ``nan``
+    values are stored as nulls and object columns that don't have a single
+    arrow type are stored as strings.
+
+    :param values: The values of the column
+    :param data_type: The type to store the values as, if not set the type
+        is inferred from the values
+
+    :return: The created array
+    """
+    try:
+        return pa.array(values, type=data_type, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # the values include ``NotSet``, mixed types or values that don't
+        # match the type so need to be cleaned first
+        pass
+
+    if values.dtype.kind == "O":
+        values = pd.Series(
+            [None if isinstance(v, NotSetType) else v for v in values],
+            dtype="object",
+            name=values.name,
+        )
+
+    if data_type is None:
+        try:
+            return pa.array(values, from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            data_type = pa.string()
+
+    if pa.types.is_string(data_type):
+        return pa.array(
+            values.map(str, na_action="ignore"),
+            type=data_type,
+            from_pandas=True,
+        )
+
+    try:
+        return pa.array(values, type=data_type, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        raise ValueError(
+            f"Column {values.name} has values that can't be written as "
+            f"{data_type}: {e}"
+        )
+
+
+def dataframe_to_table(
+    data: pd.DataFrame, schema: Optional[pa.Schema] = None
+) -> pa.Table:
+    """
+    Converts the dataframe to an arrow table. If the schema isn't set it's
+    inferred from the data with columns that only contain nulls stored as
+    strings.
+
+    :param data: The dataframe to convert
+    :param schema: The schema of the table
+
+    :return: The created table
+    """
+    names = [str(c) for c in data.columns]
+    arrays = []
+    for i, name in enumerate(names):
+        array = column_to_array(
+            data.iloc[:, i].rename(name),
+            schema.field(name).type if schema else None,
+        )
+        if schema is None and pa.types.is_null(array.type):
+            array = array.cast(pa.string())
+
+        arrays.append(array)
+
+    if schema:
+        return pa.Table.from_arrays(arrays, schema=schema)
+
+    return pa.Table.from_arrays(arrays, names=names)
+
+
+def select_columns(
+    path: str,
+    names: List[str],
+    selected: Optional[List[str]],
+    used: Optional[List[str]],
+) -> List[str]:
+    """
+    Gets the columns to read from a file, these are the selected columns
+    that are used by the caller.
+
+    :param path: The path to the file
+    :param names: The columns in the file
+    :param selected: The columns selected in the connectors options, if not
+        set all columns are selected
+    :param used: The columns used by the caller, if not set all columns are
+        used
+
+    :return: The names of the columns to read
+    """
+    columns = selected or names
+    missing = set(columns).difference(names)
+    if missing:
+        raise ValueError(
+            f"Columns {', '.join(sorted(missing))} are not in {path}"
+        )
+
+    if used is not None:
+        used_set = set(used)
+        columns = [c for c in columns if c in used_set]
+
+    return columns
+
+
+def row_batches(
+    rows: Iterable[Dict[str, Any]], batch_size: int
+) -> Iterable[pd.DataFrame]:
+    """
+    Collects the rows into dataframes of objects of at most ``batch_size``
+    rows.
+
+    :param rows: The rows to collect
+    :param batch_size: The maximum number of rows in each batch
+
+    :return: An iterable of the non empty batches
+    """
+    rows = iter(rows)
+    while True:
+        batch = pd.DataFrame(list(islice(rows, batch_size)), dtype="object")
+        if len(batch) == 0:
+            return
+
+        yield batch
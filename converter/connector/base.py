@@ -1,8 +1,108 @@
-from typing import Any, AsyncIterable, Dict, Iterable
+import datetime
+from itertools import chain, islice
+from typing import Any, AsyncIterable, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+from pandas.core.dtypes.cast import find_common_type, maybe_box_native
 
 from converter.config.config import TransformationConfig
 
 
+#: The types of values that pandas may convert when building the series for
+#: a row of objects
+DATETIMELIKE_TYPES = (
+    datetime.date,
+    datetime.timedelta,
+    np.datetime64,
+    np.timedelta64,
+    pd.Period,
+    pd.Interval,
+    type(pd.NaT),
+)
+
+
+def has_datetimelike_values(values: np.ndarray) -> bool:
+    """
+    Checks if any of the values are datetime like
+
+    :param values: The values to check
+
+    :return: True if any value is datetime like
+    """
+    return any(
+        issubclass(t, DATETIMELIKE_TYPES) for t in set(map(type, values.flat))
+    )
+
+
+def dataframe_values(data: pd.DataFrame) -> Iterable[List[Any]]:
+    """
+    Generates a list of the values in each row of the dataframe. The values
+    match calling ``to_dict`` on each row from ``iterrows`` without building
+    a series for every row.
+
+    :param data: The dataframe to split into rows
+
+    :return: An iterable of the values in each row
+    """
+    values = data.values
+
+    if values.dtype == object and not has_datetimelike_values(values):
+        for row in values:
+            yield list(map(maybe_box_native, row))
+    elif values.dtype.kind in "biuf":
+        yield from values.tolist()
+    else:
+        yield from (list(r.to_dict().values()) for _, r in data.iterrows())
+
+
+def dataframe_columns(data: pd.DataFrame) -> List[List[Any]]:
+    """
+    Builds a list of the values in each column of the dataframe. The
+    values match those generated by ``dataframe_values`` so the rows can be
+    rebuilt with ``zip(*columns)``.
+
+    :param data: The dataframe to split into columns
+
+    :return: A list of the values in each column
+    """
+    dtype = find_common_type(list(data.dtypes)) if len(data.columns) else None
+
+    if isinstance(dtype, np.dtype) and dtype.kind in "biuf":
+        # the values of numeric dataframes are upcast to the common type
+        return [
+            data.iloc[:, i].to_numpy(dtype=dtype).tolist()
+            for i in range(len(data.columns))
+        ]
+
+    columns = []
+    for i in range(len(data.columns)):
+        values = data.iloc[:, i].to_numpy(dtype=object)
+        types = set(map(type, values))
+        if any(issubclass(t, DATETIMELIKE_TYPES) for t in types):
+            # the rows are built by pandas so the values match
+            return [list(col) for col in zip(*dataframe_values(data))]
+        elif any(issubclass(t, np.generic) for t in types):
+            columns.append(list(map(maybe_box_native, values)))
+        else:
+            columns.append(values.tolist())
+
+    return columns
+
+
+def dataframe_rows(data: pd.DataFrame) -> Iterable[Dict[str, Any]]:
+    """
+    Generates a dictionary for each row of the dataframe matching calling
+    ``to_dict`` on each row from ``iterrows``.
+
+    :param data: The dataframe to split into rows
+
+    :return: An iterable of the rows
+    """
+    columns = list(data.columns)
+    return (dict(zip(columns, row)) for row in dataframe_values(data))
+
+
 class BaseConnector:
     """
     Connects to the the data source
@@ -31,6 +131,44 @@ class BaseConnector:
         """
         raise NotImplementedError()
 
+    def extract_batches(
+        self,
+        batch_size: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+    ) -> Iterable[pd.DataFrame]:
+        """
+        Extracts the data from the connected source as dataframes of at
+        most ``batch_size`` rows, if ``batch_size`` isn't set the batches can
+        be any size. Connectors that can read columnar data directly should
+        override this, by default the rows from ``extract`` are collected
+        into dataframes of objects. The batches are owned by the caller so
+        may be modified.
+
+        :param batch_size: The maximum number of rows in each batch
+        :param columns: The columns used by the caller, connectors that can
+            skip reading columns may leave out any others. Columns that
+            aren't in the source are ignored. If not set all columns are
+            used
+
+        :return: An iterable of the extracted batches
+        """
+        if not batch_size:
+            yield pd.DataFrame(self.extract(), dtype="object")
+            return
+
+        rows = iter(self.extract())
+        while True:
+            batch = pd.DataFrame(
+                list(islice(rows, batch_size)), dtype="object"
+            )
+            if len(batch) == 0:
+                return
+
+            yield batch
+
+            if len(batch) < batch_size:
+                return
+
     async def aextract(self) -> AsyncIterable[Dict[str, Any]]:
         """
         Extracts the data from the connected source and returns
@@ -50,6 +188,17 @@ class BaseConnector:
         """
         raise NotImplementedError()
 
+    def load_batches(self, batches: Iterable[pd.DataFrame]):
+        """
+        Loads batches of data into the connected data object. Connectors
+        that can write columnar data directly should override this, by
+        default each batch is split into rows and passed to ``load``.
+
+        :param batches: An iterable of dataframes representing the data to
+            push to the connected source, each batch has the same columns.
+        """
+        self.load(chain.from_iterable(map(dataframe_rows, batches)))
+
     async def aload(self, data: AsyncIterable[Dict[str, Any]]):
         """
         Loads the data into the connected data object.
@@ -1,17 +1,227 @@
 import csv
-from typing import Any, Dict, Iterable
+import locale
+import mmap
+import os
+from collections import deque
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from functools import partial
+from io import StringIO
+from itertools import chain
+from typing import (
+    IO,
+    Any,
+    Callable,
+    ContextManager,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
 
-from converter.connector.base import BaseConnector
+import pandas as pd
+
+from converter.connector.base import BaseConnector, dataframe_columns
+from converter.connector.multifile import (
+    expand_paths,
+    output_path,
+    path_list,
+    read_files,
+)
+from converter.files.compression import (
+    CONCATENABLE_COMPRESSIONS,
+    compress,
+    infer_compression,
+    open_compressed,
+)
 from converter.types.notset import NotSetType
 
 
+#: The types of the values that are written as empty strings
+NULL_TYPES = {type(None), NotSetType}
+
+
+def format_batch(batch: pd.DataFrame, quoting: int) -> str:
+    """
+    Formats the batch as csv. The output is identical to writing each row
+    with ``csv.writer`` after replacing ``None`` and ``NotSet`` values with
+    empty strings.
+
+    :param batch: The batch to format
+    :param quoting: The quoting to use when formatting the values
+
+    :return: The formatted rows
+    """
+    buffer = StringIO()
+    writer = csv.writer(buffer, quoting=quoting)
+
+    if not len(batch.columns):
+        writer.writerows([] for _ in range(len(batch)))
+        return buffer.getvalue()
+
+    columns = []
+    for dtype, values in zip(batch.dtypes, dataframe_columns(batch)):
+        if dtype.kind not in "biuf" and not NULL_TYPES.isdisjoint(
+            map(type, values)
+        ):
+            values = [
+                "" if v is None or isinstance(v, NotSetType) else v
+                for v in values
+            ]
+
+        columns.append(values)
+
+    writer.writerows(zip(*columns))
+    return buffer.getvalue()
+
+
+def record_end(
+    data: mmap.mmap,
+    position: int,
+    quotechar: Optional[bytes],
+    quotes: int = 0,
+) -> int:
+    """
+    Finds the end of the record containing ``position``. Newlines inside
+    quoted values are skipped by counting the quote characters before each
+    newline, this relies on quote characters only appearing in quoted values
+    as they do in files written by the csv module.
+
+    :param data: The contents of the file
+    :param position: The position to search from
+    :param quotechar: The quote character, ``None`` if values aren't quoted
+    :param quotes: The number of quote characters between the start of the
+        record and ``position``
+
+    :return: The position after the newline ending the record
+    """
+    while position < len(data):
+        newline = data.find(b"\n", position)
+        if newline == -1:
+            return len(data)
+
+        if quotechar:
+            quotes += data[position:newline].count(quotechar)
+
+        position = newline + 1
+        if quotes % 2 == 0:
+            break
+
+    return position
+
+
+def split_records(
+    data: mmap.mmap, start: int, range_size: int, quotechar: Optional[bytes]
+) -> List[Tuple[int, int]]:
+    """
+    Splits the file from ``start`` into byte ranges of whole records, each
+    range ends at the end of the record containing its ``range_size``th
+    byte.
+
+    :param data: The contents of the file
+    :param start: The position of the first record
+    :param range_size: The number of bytes to include in each range before
+        moving to the end of the record
+    :param quotechar: The quote character, ``None`` if values aren't quoted
+
+    :return: The start and end positions of each range
+    """
+    ranges = []
+    while start < len(data):
+        target = min(start + max(range_size, 1), len(data))
+        quotes = data[start:target].count(quotechar) if quotechar else 0
+        end = record_end(data, target, quotechar, quotes)
+
+        ranges.append((start, end))
+        start = end
+
+    return ranges
+
+
+def read_csv_range(
+    byte_range: Tuple[int, int], path: str, encoding: str, **read_options
+) -> pd.DataFrame:
+    """
+    Parses a byte range of whole records from a csv file. Newlines are
+    translated as they are when the file is opened in text mode.
+
+    :param byte_range: The position of the first record in the range and
+        the position after the last record
+    :param path: The path to the csv file
+    :param encoding: The encoding of the file
+    :param read_options: The keyword arguments for ``pd.read_csv``
+
+    :return: The records in the range
+    """
+    start, end = byte_range
+    with open(path, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode(encoding)
+
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return pd.read_csv(StringIO(text), header=None, **read_options)
+
+
+def split_batch(
+    batch: pd.DataFrame, batch_size: int
+) -> Iterable[pd.DataFrame]:
+    """
+    Splits the batch into batches of at most ``batch_size`` rows.
+
+    :param batch: The batch to split
+    :param batch_size: The maximum number of rows in each batch
+
+    :return: An iterable of the non empty batches
+    """
+    for start in range(0, len(batch), batch_size):
+        end = start + batch_size
+        yield batch.iloc[start:end]
+
+
+def map_in_order(
+    executor: Executor,
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_pending: int,
+) -> Iterable[Any]:
+    """
+    Applies the function to each item in the executor. The results are
+    yielded in the order of the items and at most ``max_pending`` results
+    are computed ahead of the consumer to limit the memory used.
+
+    :param executor: The executor to run the function in
+    :param fn: The function to apply
+    :param items: The items to apply the function to
+    :param max_pending: The maximum number of results computed ahead
+
+    :return: An iterable of the results
+    """
+    pending: Deque[Future] = deque()
+    for item in items:
+        pending.append(executor.submit(fn, item))
+        if len(pending) > max_pending:
+            yield pending.popleft().result()
+
+    while pending:
+        yield pending.popleft().result()
+
+
 class CsvConnector(BaseConnector):
     """
     Connects to a csv file on the local machine for reading and writing data.
 
     **Options:**
 
-    * `path` - The path to the csv file to read/write
+    * `path` - The path to the csv file to read/write. When reading this
+      can also be a glob pattern or a list of paths, the files are read as a
+      single stream in the order given with the files matching each pattern
+      sorted by name. All files must have the same columns.
     * `write_header` - Flag whether the header row should be written to the
       target when loading data (default: `True`)
     * `quoting` - What type of quoting should be used when reading and writing
@@ -20,8 +230,57 @@ class CsvConnector(BaseConnector):
       `python csv module documentation
       <https://docs.python.org/3/library/csv.html#csv.QUOTE_ALL>`__.
       (default: `nonnumeric`).
+    * `columnar_read` - Flag whether batches of data should be read using
+      the pandas csv parser rather than collecting the rows read by the csv
+      module. The values read are identical except that missing values at
+      the end of a short row are read as empty strings rather than `None`.
+      Only used when `quoting` isn't `nonnumeric` as the parser can't tell
+      quoted values from unquoted values (default: `True`).
+    * `block_size` - The number of rows to read at a time when reading
+      batches of data, if the runner requests a smaller batch that is used
+      instead (default: `100000`).
+    * `usecols` - The columns to read from the file, if not set all columns
+      are read. Columns are read in the order they appear in the file.
+    * `parse_workers` - The number of processes used to parse the file when
+      reading batches of data. The file is split into ranges of whole
+      records which are parsed in parallel, this requires quote characters
+      to only appear in quoted values. If not set the file is parsed in a
+      single process. Only used with `columnar_read` when the file isn't
+      compressed.
+    * `format_workers` - The number of workers used to format batches of
+      data while the next batches are transformed, if not set batches are
+      formatted as they are written.
+    * `format_executor` - Whether the batches are formatted in a `thread`
+      or `process` pool (default: `thread`).
+    * `compression` - The compression of the file, the data is decompressed
+      as it's read and compressed as it's written. Valid values are `infer`,
+      `none`, `gzip`, `bz2`, `xz`, `zstd` and `zip`. `infer` picks the
+      compression from the extension of `path` (`.gz`, `.bz2`, `.xz`,
+      `.zst` or `.zip`). `zstd` requires the `zstandard` package
+      (default: `infer`).
+    * `archive_member` - The name of the file to read in a zip archive, only
+      required when the archive contains more than one file. When writing
+      the file is named after the archive if not set.
+    * `compression_workers` - The number of threads used to compress the
+      data when writing. Each batch is compressed as a separate stream, the
+      streams are joined to give a valid file. Not used for `zip` files. If
+      not set the data is compressed as it's written.
+    * `read_workers` - The number of files read at the same time when
+      reading batches of data from several files. Each file is read ahead
+      of the consumer by a few batches, if not set the files are read one
+      after another. Only used with `columnar_read`.
+    * `source_column` - The name of a column to add to the data read
+      holding the path of the file each row was read from, if not set no
+      column is added.
     """
 
+    #: The default number of rows read at a time when reading batches
+    default_block_size = 100000
+
+    #: The maximum number of bytes parsed by each task when parsing in
+    #: parallel
+    parse_range_size = 64 * 1024 * 1024
+
     name = "CSV Connector"
     options_schema = {
         "type": "object",
@@ -52,6 +311,96 @@ class CsvConnector(BaseConnector):
                 "default": "nonnumeric",
                 "title": "Quoting",
             },
+            "columnar_read": {
+                "type": "boolean",
+                "description": (
+                    "Should batches of data be read using the pandas csv "
+                    "parser?"
+                ),
+                "default": True,
+                "title": "Columnar Read",
+            },
+            "block_size": {
+                "type": "integer",
+                "description": "The number of rows to read at a time",
+                "default": 100000,
+                "title": "Block Size",
+            },
+            "usecols": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": (
+                    "The columns to read from the file, if not set all "
+                    "columns are read"
+                ),
+                "title": "Columns",
+            },
+            "parse_workers": {
+                "type": "integer",
+                "description": (
+                    "The number of processes to use to parse the file when "
+                    "reading, if not set the file is parsed in one process"
+                ),
+                "title": "Parse Workers",
+            },
+            "format_workers": {
+                "type": "integer",
+                "description": (
+                    "The number of workers to use to format the data when "
+                    "writing, if not set the data is formatted as it's written"
+                ),
+                "title": "Format Workers",
+            },
+            "format_executor": {
+                "type": "string",
+                "description": "The type of pool to format the data in",
+                "enum": ["thread", "process"],
+                "default": "thread",
+                "title": "Format Executor",
+            },
+            "compression": {
+                "type": "string",
+                "description": (
+                    "The compression of the file, infer picks the "
+                    "compression from the file extension"
+                ),
+                "enum": ["infer", "none", "gzip", "bz2", "xz", "zstd", "zip"],
+                "default": "infer",
+                "title": "Compression",
+            },
+            "archive_member": {
+                "type": "string",
+                "description": (
+                    "The name of the file to read in a zip archive, only "
+                    "required if the archive contains more than one file"
+                ),
+                "title": "Archive Member",
+            },
+            "compression_workers": {
+                "type": "integer",
+                "description": (
+                    "The number of threads to use to compress the data when "
+                    "writing, if not set the data is compressed as it's "
+                    "written"
+                ),
+                "title": "Compression Workers",
+            },
+            "read_workers": {
+                "type": "integer",
+                "description": (
+                    "The number of files to read at the same time when "
+                    "reading several files"
+                ),
+                "title": "Read Workers",
+            },
+            "source_column": {
+                "type": "string",
+                "description": (
+                    "The name of the column to store the path of the file "
+                    "each row was read from in"
+                ),
+                "title": "Source Column",
+            },
         },
         "required": ["path"],
     }
@@ -59,7 +408,10 @@ class CsvConnector(BaseConnector):
     def __init__(self, config, **options):
         super().__init__(config, **options)
 
-        self.file_path = config.absolute_path(options["path"])
+        self.file_paths = [
+            config.absolute_path(p) for p in path_list(options["path"])
+        ]
+        self.file_path = self.file_paths[0]
         self.write_header = options.get("write_header", True)
         self.quoting = {
             "all": csv.QUOTE_ALL,
@@ -67,6 +419,61 @@ class CsvConnector(BaseConnector):
             "none": csv.QUOTE_NONE,
             "nonnumeric": csv.QUOTE_NONNUMERIC,
         }.get(options.get("quoting", "nonnumeric"))
+        self.columnar_read = options.get("columnar_read", True)
+        self.block_size = int(
+            options.get("block_size") or self.default_block_size
+        )
+
+        usecols = options.get("usecols")
+        if isinstance(usecols, str):
+            usecols = [c.strip() for c in usecols.split(",")]
+        self.usecols: Optional[List[str]] = usecols or None
+
+        self.parse_workers = int(options.get("parse_workers") or 0)
+        self.format_workers = int(options.get("format_workers") or 0)
+        self.format_executor = options.get("format_executor", "thread")
+
+        self.compression = options.get("compression", "infer")
+        self.archive_member: Optional[str] = options.get("archive_member")
+        self.compression_workers = int(options.get("compression_workers") or 0)
+
+        self.read_workers = int(options.get("read_workers") or 0)
+        self.source_column: Optional[str] = options.get("source_column")
+
+    def _compression(self, path: str) -> Optional[str]:
+        """
+        Gets the compression of the file.
+
+        :param path: The path to the file
+
+        :return: The name of the compression, ``None`` if the file isn't
+            compressed
+        """
+        if self.compression == "infer":
+            return infer_compression(path)
+
+        return None if self.compression == "none" else self.compression
+
+    def _open(
+        self, path: str, mode: str = "r", **kwargs
+    ) -> ContextManager[IO[str]]:
+        """
+        Opens the file, decompressing it as it's read and compressing it as
+        it's written.
+
+        :param path: The path to the file
+        :param mode: The mode to open the file in, ``r`` or ``w``
+        :param kwargs: Extra arguments for ``open``
+
+        :return: The opened file
+        """
+        return open_compressed(
+            path,
+            mode,
+            compression=self._compression(path),
+            member=self.archive_member,
+            **kwargs,
+        )
 
     def _data_serializer(self, row):
         return {
@@ -81,7 +488,7 @@ class CsvConnector(BaseConnector):
         except StopIteration:
             return
 
-        with open(self.file_path, "w", newline="") as f:
+        with self._open(output_path(self.file_paths), "w", newline="") as f:
             writer = csv.DictWriter(
                 f, fieldnames=list(first_row.keys()), quoting=self.quoting
             )
@@ -92,6 +499,251 @@ class CsvConnector(BaseConnector):
             writer.writerow(self._data_serializer(first_row))
             writer.writerows(map(self._data_serializer, data))
 
+    def _format_batches(
+        self, batches: Iterable[pd.DataFrame]
+    ) -> Iterable[str]:
+        """
+        Formats each batch as csv, if ``format_workers`` is set the batches
+        are formatted in a pool while the next batches are generated.
+
+        :param batches: The batches to format
+
+        :return: An iterable of the formatted batches in order
+        """
+        if not self.format_workers:
+            yield from (format_batch(b, self.quoting) for b in batches)
+            return
+
+        executor_class = (
+            ProcessPoolExecutor
+            if self.format_executor == "process"
+            else ThreadPoolExecutor
+        )
+        with executor_class(max_workers=self.format_workers) as executor:
+            yield from map_in_order(
+                executor,
+                partial(format_batch, quoting=self.quoting),
+                batches,
+                self.format_workers,
+            )
+
+    def load_batches(self, batches: Iterable[pd.DataFrame]):
+        batches = (batch for batch in batches if len(batch))
+        try:
+            first_batch = next(batches)
+        except StopIteration:
+            return
+
+        header = StringIO()
+        if self.write_header:
+            csv.writer(header, quoting=self.quoting).writerow(
+                first_batch.columns
+            )
+
+        formatted = chain(
+            [header.getvalue()],
+            self._format_batches(chain([first_batch], batches)),
+        )
+
+        path = output_path(self.file_paths)
+        if (
+            self.compression_workers
+            and self._compression(path) in CONCATENABLE_COMPRESSIONS
+        ):
+            self._write_compressed_blocks(path, formatted)
+            return
+
+        with self._open(path, "w", newline="") as f:
+            for block in formatted:
+                f.write(block)
+
+    def _write_compressed_blocks(self, path: str, blocks: Iterable[str]):
+        """
+        Writes the blocks to the file compressing each as a separate stream
+        in a thread pool.
+
+        :param path: The path to the file
+        :param blocks: The formatted blocks to write
+        """
+        encoding = locale.getpreferredencoding(False)
+        with open(path, "wb") as f, ThreadPoolExecutor(
+            max_workers=self.compression_workers
+        ) as executor:
+            for compressed in map_in_order(
+                executor,
+                partial(compress, compression=self._compression(path)),
+                (b.encode(encoding) for b in blocks if b),
+                self.compression_workers,
+            ):
+                f.write(compressed)
+
     def extract(self) -> Iterable[Dict[str, Any]]:
-        with open(self.file_path, "r") as f:
-            yield from csv.DictReader(f, quoting=self.quoting)
+        for path in expand_paths(self.file_paths):
+            rows = self._extract_file(path)
+            if self.source_column:
+                rows = ({**row, self.source_column: path} for row in rows)
+
+            yield from rows
+
+    def _extract_file(self, path: str) -> Iterable[Dict[str, Any]]:
+        """
+        Reads the rows from a single file.
+
+        :param path: The path to the file
+
+        :return: An iterable of the rows in the file
+        """
+        with self._open(path) as f:
+            reader = csv.DictReader(f, quoting=self.quoting)
+            if not self.usecols:
+                yield from reader
+                return
+
+            columns = [c for c in reader.fieldnames or [] if c in self.usecols]
+            missing = set(self.usecols).difference(columns)
+            if missing:
+                raise ValueError(
+                    f"Columns {', '.join(sorted(missing))} are not in {path}"
+                )
+
+            for row in reader:
+                yield {c: row[c] for c in columns}
+
+    def extract_batches(
+        self,
+        batch_size: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+    ) -> Iterable[pd.DataFrame]:
+        if not self.columnar_read or self.quoting == csv.QUOTE_NONNUMERIC:
+            yield from super().extract_batches(batch_size, columns)
+            return
+
+        yield from read_files(
+            expand_paths(self.file_paths),
+            partial(self._extract_file_batches, batch_size=batch_size),
+            self.read_workers,
+            self.source_column,
+        )
+
+    def _extract_file_batches(
+        self, path: str, batch_size: Optional[int] = None
+    ) -> Iterable[pd.DataFrame]:
+        """
+        Reads the batches from a single file using the pandas parser.
+
+        :param path: The path to the file
+        :param batch_size: The maximum number of rows in each batch
+
+        :return: An iterable of the batches read from the file
+        """
+        if self.parse_workers and not self._compression(path):
+            yield from self._extract_parallel_batches(path, batch_size)
+            return
+
+        with self._open(path) as f:
+            try:
+                reader = pd.read_csv(
+                    f,
+                    usecols=self.usecols,
+                    chunksize=min(
+                        batch_size or self.block_size, self.block_size
+                    ),
+                    **self._read_options(),
+                )
+            except pd.errors.EmptyDataError:
+                return
+
+            with reader:
+                for batch in reader:
+                    if len(batch):
+                        yield batch
+
+    def _read_options(self) -> Dict[str, Any]:
+        """
+        Gets the options passed to the pandas parser when reading batches.
+
+        :return: The keyword arguments for ``pd.read_csv``
+        """
+        return {
+            "dtype": str,
+            "keep_default_na": False,
+            "na_filter": False,
+            "quoting": (
+                csv.QUOTE_NONE
+                if self.quoting == csv.QUOTE_NONE
+                else csv.QUOTE_MINIMAL
+            ),
+        }
+
+    def _extract_parallel_batches(
+        self, path: str, batch_size: Optional[int] = None
+    ) -> Iterable[pd.DataFrame]:
+        """
+        Reads batches by splitting the file into byte ranges of whole records
+        and parsing the ranges in a process pool. The batches are yielded in
+        the order they appear in the file.
+
+        :param path: The path to the file
+        :param batch_size: The maximum number of rows in each batch
+
+        :return: An iterable of the batches read from the file
+        """
+        block_size = min(batch_size or self.block_size, self.block_size)
+        quotechar = None if self.quoting == csv.QUOTE_NONE else b'"'
+        read_options = self._read_options()
+        encoding = locale.getpreferredencoding(False)
+
+        if not os.path.getsize(path):
+            return
+
+        with open(path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as data:
+            # blank lines before the header are skipped by the parser
+            header_start = 0
+            while header_start < len(data) and data[header_start] in b"\r\n":
+                header_start += 1
+
+            header_end = record_end(data, header_start, quotechar)
+            if header_start == header_end:
+                return
+
+            names = list(
+                pd.read_csv(
+                    StringIO(data[header_start:header_end].decode(encoding)),
+                    nrows=0,
+                    **read_options,
+                ).columns
+            )
+            ranges = split_records(
+                data,
+                header_end,
+                min(
+                    self.parse_range_size,
+                    -(-(len(data) - header_end) // self.parse_workers),
+                ),
+                quotechar,
+            )
+
+        if self.usecols:
+            missing = set(self.usecols).difference(names)
+            if missing:
+                raise ValueError(
+                    f"Columns {', '.join(sorted(missing))} are not in {path}"
+                )
+
+        with ProcessPoolExecutor(max_workers=self.parse_workers) as executor:
+            for batch in map_in_order(
+                executor,
+                partial(
+                    read_csv_range,
+                    path=path,
+                    encoding=encoding,
+                    names=names,
+                    usecols=self.usecols,
+                    **read_options,
+                ),
+                ranges,
+                self.parse_workers,
+            ):
+                yield from split_batch(batch, block_size)
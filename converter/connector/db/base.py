@@ -1,5 +1,7 @@
-from typing import Any, Dict, Iterable, List
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+import pandas as pd
 import sqlparams
 import sqlparse
 
@@ -21,8 +23,32 @@ class BaseDBConnector(BaseConnector):
     * `password` - The password to use when connecting to the database
     * `select_statement` - sql query to read the data from
     * `insert_statement` - sql query to insert the data from
+    * `fetch_size` - The number of rows fetched from the database at a time
+      when reading data. Rows are passed on as each set is fetched rather
+      than after the whole result is read (default: `10000`).
+    * `insert_batch_size` - The number of rows inserted at a time when
+      writing data. Each insert statement is run for a batch before the next
+      batch is read so only one batch is held in memory
+      (default: `10000`).
+    * `batches_per_commit` - The number of batches inserted in each
+      transaction, if not set all the data is inserted in a single
+      transaction. If an insert fails the batches committed before it are
+      kept.
+
+    Batches of data are read by building a dataframe from each set of
+    fetched rows.
+
+    Insert statements without parameters are run once rather than for each
+    batch. Those before the first statement with parameters are run before
+    any data is inserted and the others after all the data is inserted.
     """
 
+    #: The default number of rows fetched at a time when reading data
+    default_fetch_size = 10000
+
+    #: The default number of rows inserted at a time when writing data
+    default_insert_batch_size = 10000
+
     name = "BaseDB Connector"
     options_schema = {
         "type": "object",
@@ -78,6 +104,28 @@ class BaseDBConnector(BaseConnector):
                 "subtype": "path",
                 "title": "Select Statement File",
             },
+            "fetch_size": {
+                "type": "integer",
+                "description": (
+                    "The number of rows to fetch from the database at a time"
+                ),
+                "default": 10000,
+                "title": "Fetch Size",
+            },
+            "insert_batch_size": {
+                "type": "integer",
+                "description": "The number of rows to insert at a time",
+                "default": 10000,
+                "title": "Insert Batch Size",
+            },
+            "batches_per_commit": {
+                "type": "integer",
+                "description": (
+                    "The number of batches to insert in each transaction, "
+                    "if not set all data is inserted in one transaction"
+                ),
+                "title": "Batches Per Commit",
+            },
         },
         "required": ["database", "select_statement", "insert_statement"],
     }
@@ -96,14 +144,60 @@ class BaseDBConnector(BaseConnector):
         self.sql_statement_path = config.absolute_path(
             options["sql_statement"]
         )
+        self.fetch_size = int(
+            options.get("fetch_size") or self.default_fetch_size
+        )
+        self.insert_batch_size = int(
+            options.get("insert_batch_size") or self.default_insert_batch_size
+        )
+        self.batches_per_commit: Optional[int] = (
+            int(options["batches_per_commit"])
+            if options.get("batches_per_commit")
+            else None
+        )
 
     def _create_connection(self, database: Dict[str, str]):
         raise NotImplementedError()
 
+    def _create_load_connection(self):
+        """
+        Creates the connection used to load data, connectors can override
+        this to configure the connection for writing.
+
+        :return: Connection object
+        """
+        return self._create_connection(self.database)
+
     def _get_cursor(self, conn):
         cur = conn.cursor()
         return cur
 
+    def _get_select_cursor(self, conn):
+        """
+        Gets the cursor used to read the result of the select statement.
+
+        :param conn: The database connection
+
+        :return: The cursor
+        """
+        return self._get_cursor(conn)
+
+    def _fetch_rows(self, cur) -> Iterable[Any]:
+        """
+        Fetches the rows of the result from the cursor ``fetch_size`` rows at
+        a time so the whole result is never held in memory.
+
+        :param cur: The cursor the select statement was executed on
+
+        :return: An iterable of the rows
+        """
+        while True:
+            rows = cur.fetchmany(self.fetch_size)
+            if not rows:
+                return
+
+            yield from rows
+
     def _get_select_statement(self) -> str:
         """
         SQL string to select the data from the DB
@@ -126,24 +220,134 @@ class BaseDBConnector(BaseConnector):
 
         return sqlparse.split(sql)
 
+    def _insert_batches(
+        self, data: Iterable[Dict[str, Any]]
+    ) -> Iterable[List[Dict[str, Any]]]:
+        """
+        Splits the rows into lists of at most ``insert_batch_size`` rows.
+
+        :param data: The rows to split
+
+        :return: An iterable of the batches
+        """
+        data = iter(data)
+        while True:
+            batch = list(islice(data, self.insert_batch_size))
+            if not batch:
+                return
+
+            yield batch
+
+    def _split_statements(
+        self, query: sqlparams.SQLParams, statements: List[str]
+    ) -> Tuple[List[str], List[str], List[str]]:
+        """
+        Splits the insert statements into the statements without parameters
+        run before the data is inserted, the statements run for each batch
+        and the statements without parameters run after the data is
+        inserted.
+
+        :param query: The converter for the statement parameters
+        :param statements: The insert statements
+
+        :return: The statements run before, for each batch and after
+        """
+        has_params = []
+        for line in statements:
+            try:
+                query.format(line, {})
+                has_params.append(False)
+            except KeyError:
+                has_params.append(True)
+
+        if not any(has_params):
+            return [], statements, []
+
+        first = has_params.index(True)
+        return (
+            statements[:first],
+            [s for s, p in zip(statements, has_params) if p],
+            [
+                s
+                for s, p in zip(statements[first:], has_params[first:])
+                if not p
+            ],
+        )
+
+    def _run_once(
+        self, cur, query: sqlparams.SQLParams, statements: List[str]
+    ):
+        """
+        Runs the statements without parameters.
+
+        :param cur: The cursor to run the statements on
+        :param query: The converter for the statement parameters
+        :param statements: The statements to run
+        """
+        for line in statements:
+            sql, params = query.format(line, {})
+            try:
+                cur.execute(sql, params)
+            except Exception as e:
+                raise DBQueryError(sql, e)
+
+    def _insert_batch(
+        self,
+        cur,
+        query: sqlparams.SQLParams,
+        statements: List[str],
+        batch: List[Dict[str, Any]],
+        batch_number: int,
+    ):
+        """
+        Runs each of the insert statements for the rows in the batch.
+
+        :param cur: The cursor to run the statements on
+        :param query: The converter for the statement parameters
+        :param statements: The statements to run
+        :param batch: The rows to insert
+        :param batch_number: The number of the batch, starting from 1
+        """
+        for line in statements:
+            sql, params = query.formatmany(line, batch)
+            try:
+                self._execute_batch(cur, sql, params)
+            except Exception as e:
+                raise DBQueryError(sql, e, data=batch, batch=batch_number)
+
+    def _execute_batch(self, cur, sql: str, params: List[Any]):
+        """
+        Runs the statement for each set of parameters.
+
+        :param cur: The cursor to run the statement on
+        :param sql: The statement to run
+        :param params: The parameters for each row of the batch
+        """
+        cur.executemany(sql, params)
+
     def load(self, data: Iterable[Dict[str, Any]]):
         insert_sql = self._get_insert_statements()
-        data = list(
-            data
-        )  # convert iterable to list as we reuse it based on number of queries
-        conn = self._create_connection(self.database)
+        conn = self._create_load_connection()
 
         with conn:
             cur = self._get_cursor(conn)
             query = sqlparams.SQLParams("named", self.sql_params_output)
+            before, each_batch, after = self._split_statements(
+                query, insert_sql
+            )
+
+            i = 0
+            for i, batch in enumerate(self._insert_batches(data), 1):
+                if i == 1:
+                    self._run_once(cur, query, before)
 
-            # insert query can contain more than 1 statement
-            for line in insert_sql:
-                sql, params = query.formatmany(line, data)
-                try:
-                    cur.executemany(sql, params)
-                except Exception as e:
-                    raise DBQueryError(sql, e, data=data)
+                self._insert_batch(cur, query, each_batch, batch, i)
+
+                if self.batches_per_commit and not i % self.batches_per_commit:
+                    conn.commit()
+
+            if i:
+                self._run_once(cur, query, after)
 
     def row_to_dict(self, row):
         """
@@ -158,12 +362,40 @@ class BaseDBConnector(BaseConnector):
         conn = self._create_connection(self.database)
 
         with conn:
-            cur = self._get_cursor(conn)
+            cur = self._get_select_cursor(conn)
             try:
                 cur.execute(select_sql)
             except Exception as e:
                 raise DBQueryError(select_sql, e)
 
-            rows = cur.fetchall()
-            for row in rows:
+            for row in self._fetch_rows(cur):
                 yield self.row_to_dict(row)
+
+    def extract_batches(
+        self,
+        batch_size: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+    ) -> Iterable[pd.DataFrame]:
+        select_sql = self._get_select_statement()
+        conn = self._create_connection(self.database)
+        size = min(batch_size or self.fetch_size, self.fetch_size)
+
+        with conn:
+            cur = self._get_select_cursor(conn)
+            try:
+                cur.execute(select_sql)
+            except Exception as e:
+                raise DBQueryError(select_sql, e)
+
+            # each set of fetched rows is built into a dataframe directly
+            # rather than building a dictionary for each row
+            while True:
+                rows = cur.fetchmany(size)
+                if not rows:
+                    return
+
+                yield pd.DataFrame(
+                    list(map(tuple, rows)),
+                    columns=[d[0] for d in cur.description],
+                    dtype="object",
+                )
@@ -6,12 +6,16 @@ class DBConnectionError(ConverterError):
 
 
 class DBQueryError(ConverterError):
-    def __init__(self, query, error, data=None):
+    def __init__(self, query, error, data=None, batch=None):
         self.query = query
         self.data = data
         self.error = error
+        self.batch = batch
 
-        super().__init__(f"Error running query: {query} with {data} - {error}")
+        location = "" if batch is None else f" in batch {batch}"
+        super().__init__(
+            f"Error running query{location}: {query} with {data} - {error}"
+        )
 
 
 class DBInsertDataError(ConverterError):
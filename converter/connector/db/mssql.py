@@ -1,18 +1,85 @@
-from typing import Dict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import pyodbc
 
+from converter.types.notset import NotSetType
+
 from .base import BaseDBConnector
 from .errors import DBConnectionError
 
 
+#: The longest strings that can be bound as a sized ``nvarchar``, longer
+#: strings are bound as ``nvarchar(max)``
+MAX_SIZED_STRING = 4000
+
+
+def parameter_type(values: Sequence[Any]) -> Optional[Tuple[int, int, int]]:
+    """
+    Gets the sql type, size and precision to bind the values of a parameter
+    with. Strings are sized to fit the longest value so the parameter
+    array doesn't need to be rebuilt part way through the batch.
+
+    :param values: The values of the parameter in each row
+
+    :return: The input size for ``setinputsizes``, ``None`` if the type
+        should be picked by the driver
+    """
+    types = {type(v) for v in values if v is not None}
+    if not types:
+        return None
+    elif types == {bool}:
+        return pyodbc.SQL_BIT, 0, 0
+    elif types == {int}:
+        return pyodbc.SQL_BIGINT, 0, 0
+    elif types <= {int, float}:
+        return pyodbc.SQL_DOUBLE, 0, 0
+    elif types == {str}:
+        # the size is the number of utf-16 code units
+        size = max(
+            len(v.encode("utf-16-le")) // 2 for v in values if v is not None
+        )
+        return pyodbc.SQL_WVARCHAR, size if size <= MAX_SIZED_STRING else 0, 0
+
+    return None
+
+
 class SQLServerConnector(BaseDBConnector):
     """
     Connects to an Microsoft SQL Server for reading and writing data.
+
+    **Options:**
+
+    As the base database connector with:
+
+    * `fast_executemany` - Flag whether each batch of rows should be sent
+      to the server as arrays of parameters in a single round trip rather
+      than a round trip for each row. The type of each parameter is taken
+      from the values in the batch (default: `False`).
     """
 
     name = "SQL Server Connector"
     driver = "{ODBC Driver 17 for SQL Server}"
+    options_schema = {
+        "type": "object",
+        "properties": {
+            **BaseDBConnector.options_schema["properties"],  # type: ignore
+            "fast_executemany": {
+                "type": "boolean",
+                "description": (
+                    "Flag whether each batch should be sent to the server "
+                    "in a single round trip"
+                ),
+                "default": False,
+                "title": "Fast Executemany",
+            },
+        },
+        "required": ["database", "select_statement", "insert_statement"],
+    }
+
+    def __init__(self, config, **options):
+        super().__init__(config, **options)
+
+        self.fast_executemany = options.get("fast_executemany", False)
 
     def _create_connection(self, database: Dict[str, str]):
         """
@@ -38,5 +105,26 @@ class SQLServerConnector(BaseDBConnector):
 
         return conn
 
+    def _get_cursor(self, conn):
+        cur = conn.cursor()
+        cur.fast_executemany = self.fast_executemany
+        return cur
+
+    def _execute_batch(self, cur, sql: str, params: List[Any]):
+        if not self.fast_executemany:
+            super()._execute_batch(cur, sql, params)
+            return
+
+        params = [
+            [None if isinstance(v, NotSetType) else v for v in row]
+            for row in params
+        ]
+        if params and params[0]:
+            cur.setinputsizes(
+                [parameter_type(values) for values in zip(*params)]
+            )
+
+        cur.executemany(sql, params)
+
     def row_to_dict(self, row):
         return dict(zip([t[0] for t in row.cursor_description], row))
@@ -1,19 +1,141 @@
-from typing import Dict
+import math
+import os
+import re
+import threading
+from io import StringIO
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+import pandas as pd
 import psycopg2
+import psycopg2.extensions
 import psycopg2.extras
 
+from converter.connector.base import dataframe_rows
+from converter.types.notset import NotSetType
+
 from .base import BaseDBConnector
-from .errors import DBConnectionError
+from .errors import DBConnectionError, DBQueryError
+
+
+#: Matches insert statements inserting a single row of parameters which can
+#: be replaced by a ``COPY ... FROM STDIN`` statement
+COPY_INSERT = re.compile(
+    r"\s*INSERT\s+INTO\s+(?P<table>.+?)\s*\((?P<columns>[^()]*)\)\s*"
+    r"VALUES\s*\((?P<values>.*)\)\s*;?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+#: Matches a named parameter in either the ``named`` or ``pyformat`` style
+COPY_PARAMETER = re.compile(r"\s*(?::(\w+)|%\((\w+)\)s)\s*$")
+
+#: The characters escaped in the text format used by ``COPY``
+COPY_ESCAPES = str.maketrans(
+    {"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"}
+)
+
+
+def copy_target(statement: str) -> Optional[Tuple[str, str, List[str]]]:
+    """
+    Gets the table, columns and parameter names from an insert statement
+    if it can be run using ``COPY``. Only statements of the form
+    ``INSERT INTO table (a, b) VALUES (:x, :y)`` can be copied.
+
+    :param statement: The insert statement
+
+    :return: The table, the columns and the names of the parameters
+        inserted in each column. ``None`` if the statement can't be copied
+    """
+    match = COPY_INSERT.match(statement)
+    if not match:
+        return None
+
+    names = []
+    for value in match.group("values").split(","):
+        parameter = COPY_PARAMETER.match(value)
+        if not parameter:
+            return None
+        names.append(parameter.group(1) or parameter.group(2))
+
+    if len(names) != len(match.group("columns").split(",")):
+        return None
+
+    return match.group("table"), match.group("columns").strip(), names
+
+
+def copy_value(value: Any) -> str:
+    """
+    Formats a value in the text format used by ``COPY``.
+
+    :param value: The value to format
+
+    :return: The formatted value
+    """
+    if value is None or isinstance(value, NotSetType):
+        return "\\N"
+    elif isinstance(value, float) and math.isnan(value):
+        return "NaN"
+
+    return str(value).translate(COPY_ESCAPES)
+
+
+def format_copy_rows(rows: List[Dict[str, Any]], names: List[str]) -> str:
+    """
+    Formats the rows in the text format used by ``COPY``.
+
+    :param rows: The rows to format
+    :param names: The names of the values in each row to write
+
+    :return: The formatted rows
+    """
+    return "".join(
+        "\t".join(copy_value(row.get(name)) for name in names) + "\n"
+        for row in rows
+    )
 
 
 class PostgresConnector(BaseDBConnector):
     """
     Connects to a Postgres database for reading and writing data.
+
+    The result of the select statement is read through a server side cursor
+    so only `fetch_size` rows are sent from the server at a time.
+
+    **Options:**
+
+    As the base database connector with:
+
+    * `use_copy` - Flag whether data should be transferred using `COPY`
+      rather than inserting each row and reading through a cursor. When
+      writing each batch is sent with `COPY ... FROM STDIN`, only insert
+      statements of the form `INSERT INTO table (a, b) VALUES (:x, :y)` are
+      copied, other statements are run as usual. When reading the result of
+      the select statement is sent with `COPY (...) TO STDOUT` and parsed
+      as csv in batches of `fetch_size` rows so all values are read as
+      strings (default: `False`).
     """
 
     name = "Postgres Connector"
     sql_params_output = "pyformat"
+    options_schema = {
+        "type": "object",
+        "properties": {
+            **BaseDBConnector.options_schema["properties"],  # type: ignore
+            "use_copy": {
+                "type": "boolean",
+                "description": (
+                    "Flag whether data should be transferred using COPY"
+                ),
+                "default": False,
+                "title": "Use Copy",
+            },
+        },
+        "required": ["database", "select_statement", "insert_statement"],
+    }
+
+    def __init__(self, config, **options):
+        super().__init__(config, **options)
+
+        self.use_copy = options.get("use_copy", False)
 
     def _create_connection(self, database: Dict[str, str]):
         """
@@ -32,3 +154,95 @@ class PostgresConnector(BaseDBConnector):
     def _get_cursor(self, conn):
         cur = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
         return cur
+
+    def _get_select_cursor(self, conn):
+        cur = conn.cursor(
+            name="converter_extract",
+            cursor_factory=psycopg2.extras.DictCursor,
+        )
+        cur.itersize = self.fetch_size
+        return cur
+
+    def _insert_batch(self, cur, query, statements, batch, batch_number):
+        if not self.use_copy:
+            super()._insert_batch(cur, query, statements, batch, batch_number)
+            return
+
+        for line in statements:
+            target = copy_target(line)
+            if target is None:
+                super()._insert_batch(cur, query, [line], batch, batch_number)
+                continue
+
+            table, columns, names = target
+            sql = f"COPY {table} ({columns}) FROM STDIN"
+            try:
+                cur.copy_expert(sql, StringIO(format_copy_rows(batch, names)))
+            except Exception as e:
+                raise DBQueryError(sql, e, data=batch, batch=batch_number)
+
+    def extract_batches(
+        self,
+        batch_size: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+    ) -> Iterable[pd.DataFrame]:
+        if not self.use_copy:
+            yield from super().extract_batches(batch_size, columns)
+            return
+
+        select_sql = self._get_select_statement().strip().rstrip(";")
+        sql = (
+            f"COPY ({select_sql}) TO STDOUT "
+            f"WITH (FORMAT csv, HEADER, NULL '\\N')"
+        )
+        conn = self._create_connection(self.database)
+
+        with conn:
+            cur = self._get_cursor(conn)
+            read_fd, write_fd = os.pipe()
+            errors: List[Exception] = []
+
+            def copy():
+                try:
+                    with os.fdopen(write_fd, "wb") as f:
+                        cur.copy_expert(sql, f)
+                except Exception as e:
+                    errors.append(e)
+
+            # the result is parsed as it's sent so it's never held in memory
+            thread = threading.Thread(target=copy)
+            thread.start()
+            try:
+                with os.fdopen(read_fd, "rb") as f:
+                    try:
+                        reader = pd.read_csv(
+                            f,
+                            chunksize=batch_size or self.fetch_size,
+                            dtype=str,
+                            keep_default_na=False,
+                            na_values=["\\N"],
+                            encoding=psycopg2.extensions.encodings.get(
+                                conn.encoding, conn.encoding
+                            ),
+                        )
+                    except pd.errors.EmptyDataError:
+                        reader = None
+
+                    if reader is not None:
+                        with reader:
+                            for batch in reader:
+                                if len(batch):
+                                    yield batch.where(batch.notna(), None)
+            finally:
+                thread.join()
+
+            if errors:
+                raise DBQueryError(sql, errors[0])
+
+    def extract(self) -> Iterable[Dict[str, Any]]:
+        if not self.use_copy:
+            yield from super().extract()
+            return
+
+        for batch in self.extract_batches():
+            yield from dataframe_rows(batch)
@@ -1,17 +1,50 @@
+import re
 import sqlite3
 from sqlite3 import Error
-from typing import Dict
+from typing import Any, Dict, Iterable, List, Tuple
 
 from .base import BaseDBConnector
 from .errors import DBConnectionError
 
 
+#: Matches the table of an insert statement
+INSERT_TABLE = re.compile(
+    r"\s*(?:INSERT|REPLACE)\s+(?:OR\s+\w+\s+)?INTO\s+"
+    r"(?:(?:\w+|\"[^\"]+\")\s*\.\s*)?(?P<table>\w+|\"[^\"]+\")",
+    re.IGNORECASE,
+)
+
+
 class SQLiteConnector(BaseDBConnector):
     """
     Connects to an sqlite file on the local machine for reading and writing
     data.
+
+    **Options:**
+
+    As the base database connector with:
+
+    * `bulk_load` - Flag whether the connection used to load data should
+      trade durability for speed. The journal is kept in memory, the file
+      isn't synced after each transaction, the page cache is enlarged and
+      temporary tables are kept in memory. The database may be corrupted if
+      the machine fails part way through loading (default: `False`).
+    * `defer_indexes` - Flag whether the indexes of the tables data is
+      inserted into should be dropped before loading the data and created
+      again afterwards, which is quicker than updating the indexes for each
+      row. Unique indexes are kept so duplicate rows are still rejected
+      (default: `False`).
     """
 
+    #: The pragmas set on the connection used to load data when
+    #: ``bulk_load`` is set
+    bulk_load_pragmas = {
+        "journal_mode": "MEMORY",
+        "synchronous": "OFF",
+        "cache_size": "-262144",
+        "temp_store": "MEMORY",
+    }
+
     name = "SQLite Connector"
     options_schema = {
         "type": "object",
@@ -32,10 +65,56 @@ class SQLiteConnector(BaseDBConnector):
                 "subtype": "path",
                 "title": "Select Statement File",
             },
+            "fetch_size": {
+                "type": "integer",
+                "description": (
+                    "The number of rows to fetch from the database at a time"
+                ),
+                "default": 10000,
+                "title": "Fetch Size",
+            },
+            "insert_batch_size": {
+                "type": "integer",
+                "description": "The number of rows to insert at a time",
+                "default": 10000,
+                "title": "Insert Batch Size",
+            },
+            "batches_per_commit": {
+                "type": "integer",
+                "description": (
+                    "The number of batches to insert in each transaction, "
+                    "if not set all data is inserted in one transaction"
+                ),
+                "title": "Batches Per Commit",
+            },
+            "bulk_load": {
+                "type": "boolean",
+                "description": (
+                    "Flag whether data should be loaded with durability "
+                    "traded for speed"
+                ),
+                "default": False,
+                "title": "Bulk Load",
+            },
+            "defer_indexes": {
+                "type": "boolean",
+                "description": (
+                    "Flag whether indexes should be created after the data "
+                    "is loaded"
+                ),
+                "default": False,
+                "title": "Defer Indexes",
+            },
         },
         "required": ["database", "select_statement", "insert_statement"],
     }
 
+    def __init__(self, config, **options):
+        super().__init__(config, **options)
+
+        self.bulk_load = options.get("bulk_load", False)
+        self.defer_indexes = options.get("defer_indexes", False)
+
     def _create_connection(self, database: Dict[str, str]):
         """
         Create database connection to the SQLite database specified in database
@@ -53,3 +132,64 @@ class SQLiteConnector(BaseDBConnector):
 
         conn.row_factory = sqlite3.Row
         return conn
+
+    def _create_load_connection(self):
+        conn = super()._create_load_connection()
+        if self.bulk_load:
+            for name, value in self.bulk_load_pragmas.items():
+                conn.execute(f"PRAGMA {name} = {value}")
+
+        return conn
+
+    def _deferred_indexes(self, conn) -> List[Tuple[str, str]]:
+        """
+        Gets the non unique indexes of the tables the insert statements
+        insert into.
+
+        :param conn: The database connection
+
+        :return: The name and sql to create each index
+        """
+        tables = []
+        for statement in self._get_insert_statements():
+            match = INSERT_TABLE.match(statement)
+            if match and match.group("table").strip('"') not in tables:
+                tables.append(match.group("table").strip('"'))
+
+        indexes = []
+        for table in tables:
+            for index in conn.execute(
+                "SELECT name, sql FROM sqlite_master WHERE type = 'index' "
+                "AND tbl_name = ? AND sql IS NOT NULL ORDER BY name",
+                (table,),
+            ):
+                unique = conn.execute(
+                    'SELECT "unique" FROM pragma_index_list(?) '
+                    "WHERE name = ?",
+                    (table, index["name"]),
+                ).fetchone()
+                if not unique[0]:
+                    indexes.append((index["name"], index["sql"]))
+
+        return indexes
+
+    def load(self, data: Iterable[Dict[str, Any]]):
+        if not self.defer_indexes:
+            super().load(data)
+            return
+
+        conn = self._create_connection(self.database)
+        try:
+            with conn:
+                indexes = self._deferred_indexes(conn)
+                for name, _ in indexes:
+                    conn.execute(f'DROP INDEX "{name}"')
+
+            try:
+                super().load(data)
+            finally:
+                with conn:
+                    for _, sql in indexes:
+                        conn.execute(sql)
+        finally:
+            conn.close()
@@ -0,0 +1,190 @@
+from typing import Any, Dict, Iterable, List, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+from converter.connector.arrow import (
+    dataframe_to_table,
+    row_batches,
+    select_columns,
+)
+from converter.connector.base import BaseConnector, dataframe_rows
+
+
+def read_record_batches(
+    source: pa.MemoryMappedFile,
+) -> Iterable[pa.RecordBatch]:
+    """
+    Reads the record batches from an arrow ipc file or stream. The batches
+    reference the memory of the source rather than copying it when the
+    data isn't compressed.
+
+    :param source: The memory mapped file to read from
+
+    :return: An iterable of the record batches
+    """
+    try:
+        reader = ipc.open_file(source)
+    except pa.ArrowInvalid:
+        source.seek(0)
+        yield from ipc.open_stream(source)
+        return
+
+    for i in range(reader.num_record_batches):
+        yield reader.get_batch(i)
+
+
+class FeatherConnector(BaseConnector):
+    """
+    Connects to an arrow ipc (feather v2) file on the local machine for
+    reading and writing data. This is intended for intermediate files
+    passed between conversions as the data is stored in the layout used
+    in memory so it doesn't need to be parsed.
+
+    **Options:**
+
+    * `path` - The path to the file to read/write
+    * `columns` - The columns to read from the file, if not set all columns
+      used by the transformation are read.
+    * `block_size` - The maximum number of rows to read at a time, if the
+      runner requests a smaller batch that is used instead
+      (default: `100000`).
+    * `format` - Whether data is written as an arrow ipc `file` (feather
+      v2) or `stream`. Both are read (default: `file`).
+    * `compression` - The compression to use when writing data. Valid values
+      are `none`, `lz4` and `zstd`. Compressed data has to be decompressed
+      when it's read rather than being read from the file directly
+      (default: `none`).
+
+    The file is memory mapped when reading so the data is only read from
+    disk as each batch is used. When writing the type of each column is
+    taken from the first batch as for the parquet connector.
+    """
+
+    #: The default number of rows read at a time when reading batches
+    default_block_size = 100000
+
+    name = "Feather Connector"
+    options_schema = {
+        "type": "object",
+        "properties": {
+            "path": {
+                "type": "string",
+                "description": (
+                    "The path to the file to load relative to the config file"
+                ),
+                "subtype": "path",
+                "title": "Path",
+            },
+            "columns": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": (
+                    "The columns to read from the file, if not set all "
+                    "columns used by the transformation are read"
+                ),
+                "title": "Columns",
+            },
+            "block_size": {
+                "type": "integer",
+                "description": "The number of rows to read at a time",
+                "default": 100000,
+                "title": "Block Size",
+            },
+            "format": {
+                "type": "string",
+                "description": "Whether to write an ipc file or stream",
+                "enum": ["file", "stream"],
+                "default": "file",
+                "title": "Format",
+            },
+            "compression": {
+                "type": "string",
+                "description": "The compression to use when writing data",
+                "enum": ["none", "lz4", "zstd"],
+                "default": "none",
+                "title": "Compression",
+            },
+        },
+        "required": ["path"],
+    }
+
+    def __init__(self, config, **options):
+        super().__init__(config, **options)
+
+        self.file_path = config.absolute_path(options["path"])
+
+        columns = options.get("columns")
+        if isinstance(columns, str):
+            columns = [c.strip() for c in columns.split(",")]
+        self.columns: Optional[List[str]] = columns or None
+
+        self.block_size = int(
+            options.get("block_size") or self.default_block_size
+        )
+        self.format = options.get("format", "file")
+        self.compression = options.get("compression", "none")
+
+    def load(self, data: Iterable[Dict[str, Any]]):
+        self.load_batches(row_batches(data, self.block_size))
+
+    def load_batches(self, batches: Iterable[pd.DataFrame]):
+        writer: Optional[ipc.RecordBatchFileWriter] = None
+        schema: Optional[pa.Schema] = None
+
+        try:
+            for batch in batches:
+                if not len(batch):
+                    continue
+
+                table = dataframe_to_table(batch, schema)
+                if writer is None:
+                    schema = table.schema
+                    new_writer = (
+                        ipc.new_file
+                        if self.format == "file"
+                        else ipc.new_stream
+                    )
+                    writer = new_writer(
+                        self.file_path,
+                        schema,
+                        options=ipc.IpcWriteOptions(
+                            compression=(
+                                None
+                                if self.compression == "none"
+                                else self.compression
+                            )
+                        ),
+                    )
+
+                writer.write_table(table)
+        finally:
+            if writer:
+                writer.close()
+
+    def extract(self) -> Iterable[Dict[str, Any]]:
+        for batch in self.extract_batches():
+            yield from dataframe_rows(batch)
+
+    def extract_batches(
+        self,
+        batch_size: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+    ) -> Iterable[pd.DataFrame]:
+        block_size = min(batch_size or self.block_size, self.block_size)
+
+        with pa.memory_map(self.file_path) as source:
+            selected: Optional[List[str]] = None
+            for record_batch in read_record_batches(source):
+                if selected is None:
+                    selected = select_columns(
+                        self.file_path,
+                        record_batch.schema.names,
+                        self.columns,
+                        columns,
+                    )
+
+                record_batch = record_batch.select(selected)
+                for start in range(0, record_batch.num_rows, block_size):
+                    yield record_batch.slice(start, block_size).to_pandas()
@@ -0,0 +1,159 @@
+import glob
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional, Union
+
+import pandas as pd
+
+
+#: The number of batches each file reader reads ahead of the consumer
+READ_AHEAD = 2
+
+_END = object()
+
+
+def is_pattern(path: str) -> bool:
+    """
+    Checks if the path is a glob pattern rather than the path to a single
+    file.
+
+    :param path: The path to check
+
+    :return: ``True`` if the path contains any glob wildcards
+    """
+    return any(c in path for c in "*?[")
+
+
+def path_list(path: Union[str, List[str]]) -> List[str]:
+    """
+    Gets the list of paths from the path option of a file connector which
+    may be a single path or a list of paths.
+
+    :param path: The path option
+
+    :return: The list of paths
+    """
+    return list(path) if isinstance(path, (list, tuple)) else [path]
+
+
+def expand_paths(paths: List[str]) -> List[str]:
+    """
+    Expands the glob patterns in the list of paths. The files matching each
+    pattern are sorted so that the files are always read in the same order.
+
+    :param paths: The paths and patterns to expand
+
+    :return: The paths of the files to read
+    """
+    expanded = []
+    for path in paths:
+        if not is_pattern(path):
+            expanded.append(path)
+            continue
+
+        matches = sorted(glob.glob(path))
+        if not matches:
+            raise FileNotFoundError(f"No files match {path}")
+        expanded.extend(matches)
+
+    return expanded
+
+
+def output_path(paths: List[str]) -> str:
+    """
+    Gets the path to write data to, data can only be written to a single
+    file.
+
+    :param paths: The paths given to the connector
+
+    :return: The path to write to
+    """
+    if len(paths) != 1 or is_pattern(paths[0]):
+        raise ValueError(
+            f"Data can only be written to a single file, not "
+            f"{', '.join(paths)}"
+        )
+
+    return paths[0]
+
+
+def _put(q: queue.Queue, item: Any, stop: threading.Event) -> bool:
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+
+    return False
+
+
+def read_files(
+    paths: List[str],
+    read_file: Callable[[str], Iterable[pd.DataFrame]],
+    workers: int = 0,
+    source_column: Optional[str] = None,
+) -> Iterable[pd.DataFrame]:
+    """
+    Reads the batches from each file as a single stream. The batches of each
+    file are yielded in the order of the paths.
+
+    If ``workers`` is set the files are read in a thread pool, each reader
+    reads at most ``READ_AHEAD`` batches ahead of the consumer so the
+    memory used is limited however large the files are.
+
+    :param paths: The paths of the files to read
+    :param read_file: Function reading the batches from a single file
+    :param workers: The number of files to read at the same time
+    :param source_column: The name of the column to store the path of the
+        file each row was read from in, if not set no column is added
+
+    :return: An iterable of the batches from all the files
+    """
+
+    def file_batches(path):
+        for batch in read_file(path):
+            if source_column:
+                batch = batch.assign(**{source_column: path})
+            yield batch
+
+    if not workers:
+        for path in paths:
+            yield from file_batches(path)
+        return
+
+    stop = threading.Event()
+    queues: List[queue.Queue] = [queue.Queue(READ_AHEAD) for _ in paths]
+
+    def produce(path, q):
+        if stop.is_set():
+            return
+
+        try:
+            for batch in file_batches(path):
+                if not _put(q, batch, stop):
+                    return
+        except Exception as e:
+            _put(q, e, stop)
+        else:
+            _put(q, _END, stop)
+
+    # the files are read in the order they are submitted so the file being
+    # consumed is always being read
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            for path, q in zip(paths, queues):
+                executor.submit(produce, path, q)
+
+            for q in queues:
+                while True:
+                    item = q.get()
+                    if item is _END:
+                        break
+                    elif isinstance(item, Exception):
+                        raise item
+
+                    yield item
+        finally:
+            stop.set()
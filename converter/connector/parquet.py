@@ -0,0 +1,276 @@
+from functools import partial
+from typing import Any, Dict, Iterable, List, Optional
+
+import pandas as pd
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from converter.connector.arrow import (
+    dataframe_to_table,
+    row_batches,
+    select_columns,
+)
+from converter.connector.base import BaseConnector, dataframe_rows
+from converter.connector.multifile import (
+    expand_paths,
+    output_path,
+    path_list,
+    read_files,
+)
+
+
+class ParquetConnector(BaseConnector):
+    """
+    Connects to a parquet file on the local machine for reading and writing
+    data.
+
+    **Options:**
+
+    * `path` - The path to the parquet file to read/write. When reading
+      this can also be a glob pattern or a list of paths, the files are read
+      as a single stream in the order given with the files matching each
+      pattern sorted by name.
+    * `columns` - The columns to read from the file, if not set all columns
+      used by the transformation are read.
+    * `filters` - Filters to apply when reading the data, row groups are
+      skipped when their statistics show no rows can match. Each filter is
+      a list of `[column, operator, value]` where the operator is one of
+      `==`, `=`, `!=`, `<`, `<=`, `>`, `>=`, `in` or `not in`. A list of
+      filters matches rows matching all the filters, a list of lists of
+      filters matches rows matching any of the inner lists.
+    * `block_size` - The maximum number of rows to read at a time, if the
+      runner requests a smaller batch that is used instead
+      (default: `100000`).
+    * `row_group_size` - The number of rows in each row group when writing
+      data (default: `100000`).
+    * `compression` - The compression to use when writing data. Valid values
+      are `none`, `snappy`, `gzip`, `brotli`, `lz4` and `zstd`
+      (default: `snappy`).
+    * `read_workers` - The number of files read at the same time when
+      reading data from several files. Each file is read ahead of the
+      consumer by a few batches, if not set the files are read one after
+      another.
+    * `source_column` - The name of a column to add to the data read
+      holding the path of the file each row was read from, if not set no
+      column is added.
+
+    When writing the type of each column is taken from the first row group
+    and the values in later row groups are converted to it. Columns with no
+    values in the first row group are written as strings as are columns
+    mixing values of different types.
+    """
+
+    #: The default number of rows read at a time when reading batches
+    default_block_size = 100000
+
+    #: The default number of rows in each row group when writing data
+    default_row_group_size = 100000
+
+    name = "Parquet Connector"
+    options_schema = {
+        "type": "object",
+        "properties": {
+            "path": {
+                "type": "string",
+                "description": (
+                    "The path to the file to load relative to the config file"
+                ),
+                "subtype": "path",
+                "title": "Path",
+            },
+            "columns": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": (
+                    "The columns to read from the file, if not set all "
+                    "columns used by the transformation are read"
+                ),
+                "title": "Columns",
+            },
+            "filters": {
+                "type": "array",
+                "items": {"type": "array"},
+                "description": (
+                    "Filters to apply when reading the data, each filter is "
+                    "a list of [column, operator, value]"
+                ),
+                "title": "Filters",
+            },
+            "block_size": {
+                "type": "integer",
+                "description": "The number of rows to read at a time",
+                "default": 100000,
+                "title": "Block Size",
+            },
+            "row_group_size": {
+                "type": "integer",
+                "description": "The number of rows in each row group",
+                "default": 100000,
+                "title": "Row Group Size",
+            },
+            "compression": {
+                "type": "string",
+                "description": "The compression to use when writing data",
+                "enum": ["none", "snappy", "gzip", "brotli", "lz4", "zstd"],
+                "default": "snappy",
+                "title": "Compression",
+            },
+            "read_workers": {
+                "type": "integer",
+                "description": (
+                    "The number of files to read at the same time when "
+                    "reading several files"
+                ),
+                "title": "Read Workers",
+            },
+            "source_column": {
+                "type": "string",
+                "description": (
+                    "The name of the column to store the path of the file "
+                    "each row was read from in"
+                ),
+                "title": "Source Column",
+            },
+        },
+        "required": ["path"],
+    }
+
+    def __init__(self, config, **options):
+        super().__init__(config, **options)
+
+        self.file_paths = [
+            config.absolute_path(p) for p in path_list(options["path"])
+        ]
+        self.file_path = self.file_paths[0]
+
+        columns = options.get("columns")
+        if isinstance(columns, str):
+            columns = [c.strip() for c in columns.split(",")]
+        self.columns: Optional[List[str]] = columns or None
+
+        filters = options.get("filters")
+        self.filter: Optional[ds.Expression] = (
+            pq.filters_to_expression(filters) if filters else None
+        )
+
+        self.block_size = int(
+            options.get("block_size") or self.default_block_size
+        )
+        self.row_group_size = int(
+            options.get("row_group_size") or self.default_row_group_size
+        )
+        self.compression = options.get("compression", "snappy")
+
+        self.read_workers = int(options.get("read_workers") or 0)
+        self.source_column: Optional[str] = options.get("source_column")
+
+    def _write_row_groups(
+        self,
+        writer: Optional[pq.ParquetWriter],
+        data: pd.DataFrame,
+    ) -> pq.ParquetWriter:
+        """
+        Writes the data as row groups of at most ``row_group_size`` rows,
+        the writer is created from the schema of the data if it's not set.
+
+        :param writer: The writer for the file
+        :param data: The data to write
+
+        :return: The writer for the file
+        """
+        table = dataframe_to_table(data, writer.schema if writer else None)
+        if writer is None:
+            writer = pq.ParquetWriter(
+                output_path(self.file_paths),
+                table.schema,
+                compression=self.compression.upper(),
+            )
+
+        writer.write_table(table, row_group_size=self.row_group_size)
+        return writer
+
+    def load(self, data: Iterable[Dict[str, Any]]):
+        self.load_batches(row_batches(data, self.row_group_size))
+
+    def load_batches(self, batches: Iterable[pd.DataFrame]):
+        writer: Optional[pq.ParquetWriter] = None
+        pending: List[pd.DataFrame] = []
+        pending_rows = 0
+
+        try:
+            for batch in batches:
+                if not len(batch):
+                    continue
+
+                pending.append(batch)
+                pending_rows += len(batch)
+                if pending_rows < self.row_group_size:
+                    continue
+
+                # write whole row groups keeping the remaining rows for the
+                # next row group
+                data = pd.concat(pending, ignore_index=True)
+                full_rows = (
+                    pending_rows // self.row_group_size * self.row_group_size
+                )
+                writer = self._write_row_groups(writer, data.iloc[:full_rows])
+
+                pending = (
+                    [data.iloc[full_rows:]] if full_rows < len(data) else []
+                )
+                pending_rows -= full_rows
+
+            if pending:
+                writer = self._write_row_groups(
+                    writer, pd.concat(pending, ignore_index=True)
+                )
+        finally:
+            if writer:
+                writer.close()
+
+    def extract(self) -> Iterable[Dict[str, Any]]:
+        for batch in self.extract_batches():
+            yield from dataframe_rows(batch)
+
+    def extract_batches(
+        self,
+        batch_size: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+    ) -> Iterable[pd.DataFrame]:
+        yield from read_files(
+            expand_paths(self.file_paths),
+            partial(
+                self._extract_file_batches,
+                batch_size=batch_size,
+                columns=columns,
+            ),
+            self.read_workers,
+            self.source_column,
+        )
+
+    def _extract_file_batches(
+        self,
+        path: str,
+        batch_size: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+    ) -> Iterable[pd.DataFrame]:
+        """
+        Reads the batches from a single file.
+
+        :param path: The path to the file
+        :param batch_size: The maximum number of rows in each batch
+        :param columns: The columns used by the transformation
+
+        :return: An iterable of the batches read from the file
+        """
+        dataset = ds.dataset(path, format="parquet")
+
+        for record_batch in dataset.to_batches(
+            columns=select_columns(
+                path, dataset.schema.names, self.columns, columns
+            ),
+            filter=self.filter,
+            batch_size=min(batch_size or self.block_size, self.block_size),
+        ):
+            if record_batch.num_rows:
+                yield record_batch.to_pandas()
@@ -0,0 +1,135 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
+import zipfile
+from contextlib import contextmanager
+from typing import IO, Iterator, Literal, Optional
+
+
+#: The compression used for each file extension
+COMPRESSION_EXTENSIONS = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    ".zst": "zstd",
+    ".zip": "zip",
+}
+
+#: The compressions where independently compressed blocks can be joined to
+#: give a valid file
+CONCATENABLE_COMPRESSIONS = {"gzip", "bz2", "xz", "zstd"}
+
+
+def infer_compression(path: str) -> Optional[str]:
+    """
+    Gets the compression of the file from its extension.
+
+    :param path: The path to the file
+
+    :return: The name of the compression, ``None`` if the file isn't
+        compressed
+    """
+    return COMPRESSION_EXTENSIONS.get(os.path.splitext(path)[1].lower())
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "The zstandard package is required to read and write zstd files"
+        )
+
+    return zstandard
+
+
+def _archive_member(archive: zipfile.ZipFile, path: str, mode: str) -> str:
+    if mode.startswith("w"):
+        return os.path.splitext(os.path.basename(path))[0]
+
+    names = [i.filename for i in archive.infolist() if not i.is_dir()]
+    if len(names) != 1:
+        raise ValueError(
+            f"{path} contains {len(names)} files, the file to read must be "
+            f"selected"
+        )
+
+    return names[0]
+
+
+@contextmanager
+def open_compressed(
+    path: str,
+    mode: str = "r",
+    compression: Optional[str] = None,
+    member: Optional[str] = None,
+    newline: Optional[str] = None,
+) -> Iterator[IO[str]]:
+    """
+    Opens a possibly compressed file in text mode, the data is decompressed
+    as it's read and compressed as it's written.
+
+    :param path: The path to the file
+    :param mode: The mode to open the file in, ``r`` or ``w``
+    :param compression: The compression of the file, one of ``gzip``,
+        ``bz2``, ``xz``, ``zstd`` or ``zip``. If not set the file isn't
+        compressed
+    :param member: The name of the file in a zip archive, if not set the
+        archive must contain a single file when reading. When writing the
+        file is named after the archive
+    :param newline: How newlines are translated, as for ``open``
+
+    :return: The opened file
+    """
+    if compression == "zip":
+        archive_mode: Literal["r", "w"] = "w" if mode.startswith("w") else "r"
+        with zipfile.ZipFile(
+            path, archive_mode, compression=zipfile.ZIP_DEFLATED
+        ) as archive:
+            name = member or _archive_member(archive, path, archive_mode)
+            with archive.open(name, archive_mode, force_zip64=True) as f:
+                with io.TextIOWrapper(f, newline=newline) as text:
+                    yield text
+
+        return
+
+    openers = {
+        "gzip": gzip.open,
+        "bz2": bz2.open,
+        "xz": lzma.open,
+    }
+    if compression == "zstd":
+        opener = _zstandard().open
+    elif compression:
+        opener = openers[compression]
+    else:
+        opener = open
+
+    with opener(
+        path, mode if compression is None else f"{mode}t", newline=newline
+    ) as f:
+        yield f
+
+
+def compress(data: bytes, compression: str) -> bytes:
+    """
+    Compresses the data as a complete stream. Streams of the compressions in
+    ``CONCATENABLE_COMPRESSIONS`` can be joined to give a valid file.
+
+    :param data: The data to compress
+    :param compression: The compression to use
+
+    :return: The compressed data
+    """
+    if compression == "gzip":
+        return gzip.compress(data)
+    elif compression == "bz2":
+        return bz2.compress(data)
+    elif compression == "xz":
+        return lzma.compress(data)
+    elif compression == "zstd":
+        return _zstandard().ZstdCompressor().compress(data)
+
+    raise ValueError(f"{compression} data can't be compressed in blocks")
@@ -11,11 +11,16 @@ from typing import (
 )
 
 import networkx as nx
-from lark import Tree
 
 from converter.config.config import TransformationConfig
 from converter.mapping.errors import NoConversionPathError
-from converter.transformers.transform import parse
+from converter.transformers.transform import (
+    CompiledExpression,
+    Tree,
+    compile_expression,
+    get_lookups,
+    parse,
+)
 
 
 def get_logger():
@@ -34,6 +39,9 @@ class TransformationEntry:
         self.transformation_tree = transformation_tree
         self.when = when
         self.when_tree = when_tree
+        self._transformation_fn: Optional[CompiledExpression] = None
+        self._when_fn: Optional[CompiledExpression] = None
+        self._lookups: Optional[Set[str]] = None
 
     def __eq__(self, other):
         return (
@@ -45,6 +53,45 @@ class TransformationEntry:
         self.when_tree = parse(self.when)
         self.transformation_tree = parse(self.transformation)
 
+        # compile from the expressions rather than the trees so that entries
+        # sharing an expression share the cached compiled function
+        self._when_fn = compile_expression(self.when)
+        self._transformation_fn = compile_expression(self.transformation)
+
+    @property
+    def when_fn(self) -> CompiledExpression:
+        """
+        The compiled when clause, compiling it if it hasn't been already
+        """
+        if self._when_fn is None:
+            self._when_fn = compile_expression(self.when_tree or self.when)
+
+        return self._when_fn
+
+    @property
+    def transformation_fn(self) -> CompiledExpression:
+        """
+        The compiled transformation, compiling it if it hasn't been already
+        """
+        if self._transformation_fn is None:
+            self._transformation_fn = compile_expression(
+                self.transformation_tree or self.transformation
+            )
+
+        return self._transformation_fn
+
+    @property
+    def lookups(self) -> Set[str]:
+        """
+        The names of the columns used by the when clause and transformation
+        """
+        if self._lookups is None:
+            self._lookups = get_lookups(
+                self.when_tree or self.when
+            ) | get_lookups(self.transformation_tree or self.transformation)
+
+        return self._lookups
+
 
 TransformationSet = Dict[str, List[TransformationEntry]]
 
@@ -247,7 +294,7 @@ class BaseMapping:
             f"Path found {' -> '.join(f'{n.name} v{n.version}' for n in path)}"
         )
 
-        # parse the trees of the path so that is doesnt need
+        # parse and compile the trees of the path so that is doesnt need
         # to be done for every row
         transformations = [edge["transform"] for edge in self.path_edges]
         for mapping in transformations:
@@ -9,6 +9,7 @@ from typing import (
     Dict,
     Iterable,
     List,
+    Optional,
     TypedDict,
     Union,
 )
@@ -22,7 +23,10 @@ from converter.mapping.base import (
     TransformationEntry,
 )
 from converter.metadata.log import log_metadata
-from converter.transformers.transform import run
+from converter.transformers.transform import (
+    TransformerMapping,
+    get_transformer_mapping,
+)
 from converter.types.notset import NotSet, NotSetType
 
 
@@ -60,6 +64,29 @@ class _BaseRunner:
     def __init__(self, config: TransformationConfig, **options):
         self.config = config
         self._options = options
+        self._transformer_mapping: Optional[TransformerMapping] = None
+
+    def get_transformer_overrides(self) -> TransformerMapping:
+        """
+        Gets the overrides for the transformer operations used when running
+        the compiled transformations.
+
+        :return: The transformer mapping overrides
+        """
+        return {}
+
+    @property
+    def transformer_mapping(self) -> TransformerMapping:
+        """
+        The full set of transformer operations for the runner. This is built
+        once and reused for each call to the compiled transformations.
+        """
+        if self._transformer_mapping is None:
+            self._transformer_mapping = get_transformer_mapping(
+                self.get_transformer_overrides()
+            )
+
+        return self._transformer_mapping
 
     @classmethod
     def log_type_coercion_error(cls, row, column, value, to_type, reason):
@@ -164,8 +191,8 @@ class _BaseRunner:
         """
 
         # process the when clause to get a filter series
-        if run(row, entry.when_tree or entry.when):
-            return run(row, entry.transformation_tree or entry.transformation)
+        if entry.when_fn(row, self.transformer_mapping):
+            return entry.transformation_fn(row, self.transformer_mapping)
         else:
             return NotSet
 
@@ -1,7 +1,4 @@
-from itertools import chain, islice
-
 import dask
-import pandas as pd
 from dask import dataframe as dd
 
 from .pandas import PandasRunner
@@ -11,7 +8,7 @@ from .pandas import PandasRunner
 def read_pandas_chunk(c):
     # pragma: no cover
     # This is not picked up by coverage since it's a delayed dask object
-    return pd.DataFrame(c)
+    return c.infer_objects()
 
 
 class DaskRunner(PandasRunner):
@@ -37,17 +34,20 @@ class DaskRunner(PandasRunner):
     def create_series(self, index, value):
         return index.to_series().apply(lambda x: value)
 
-    def chunk(self, iterable):
-        iterable = iter(iterable)
-        while True:
-            try:
-                slice = islice(iterable, self.chunk_size)
-                first_elem = next(slice)
-                yield chain((first_elem,), slice)
-            except StopIteration:
-                return
-
-    def get_dataframe(self, extractor):
+    def get_dataframe(self, extractor, columns=None):
         return dd.from_delayed(
-            [read_pandas_chunk(c) for c in self.chunk(extractor.extract())],
+            [
+                read_pandas_chunk(c)
+                for c in extractor.extract_batches(self.chunk_size, columns)
+            ],
+        )
+
+    def transform_batches(self, extractor, mapping):
+        # the chunk size sets the partitions of a single dask dataframe so
+        # all the data is transformed together and each partition is passed
+        # to the loader as a batch
+        transformed = self.transform_all(extractor, mapping)
+        return (
+            transformed.get_partition(i).compute()
+            for i in range(transformed.npartitions)
         )
@@ -1,6 +1,6 @@
 import os
+from io import StringIO
 
-from ..files.csv import BufferedCsvReader
 from ..types.notset import NotSetType
 from .pandas import PandasRunner
 
@@ -23,13 +23,35 @@ class ModinRunner(PandasRunner):
         super().__init__(config, **options)
         self.engine = options.get("engine", "dask")
 
-    def get_dataframe(self, extractor):
+        # modin distributes the data itself so it isn't split into chunks
+        self.chunk_size = None
+
+    def get_dataframe(self, extractor, columns=None):
         os.environ.setdefault("MODIN_ENGINE", self.engine)
         import modin.pandas as pd  # must be imported after modin engine is set
 
         self.dataframe_type = pd.DataFrame
         self.series_type = pd.Series
-        return pd.read_csv(BufferedCsvReader(extractor.extract()))
+
+        # the transformer operations depend on the series type so need
+        # to be rebuilt now the modin types are known
+        self._transformer_mapping = None
+
+        # modin infers the column types when reading csv data so the
+        # extracted batches are passed to it as csv
+        buffer = StringIO()
+        for i, batch in enumerate(extractor.extract_batches(columns=columns)):
+            batch.to_csv(buffer, index=False, header=i == 0)
+
+        buffer.seek(0)
+        return pd.read_csv(buffer)
+
+    def transform_batches(self, extractor, mapping):
+        from modin.utils import to_pandas
+
+        # loaders work with pandas dataframes so the transformed modin
+        # dataframe is converted before it is passed on
+        return [to_pandas(self.transform_all(extractor, mapping))]
 
     def combine_column(self, *args, **kwargs):
         combined = super().combine_column(*args, **kwargs)
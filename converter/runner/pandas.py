@@ -3,15 +3,23 @@ import math
 import os
 import re
 from functools import reduce
+from itertools import chain
 from operator import and_, or_
-from typing import Any, Dict, Iterable, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 from numpy import nan
 
-from ..connector.base import BaseConnector
-from ..mapping.base import BaseMapping, ColumnConversions, TransformationEntry
-from ..transformers import run
+from ..connector.base import BaseConnector, dataframe_rows
+from ..mapping.base import (
+    BaseMapping,
+    ColumnConversion,
+    ColumnConversions,
+    DirectionalMapping,
+    TransformationEntry,
+)
+from ..metadata.log import log_metadata
 from ..transformers.transform import (
     GroupWrapper,
     RowType,
@@ -19,9 +27,12 @@ from ..transformers.transform import (
     default_match,
     default_replace,
     default_search,
+    get_literal_replacement,
 )
 from ..types.notset import NotSet, NotSetType
-from ..validator.pandas import PandasValidator
+from ..validator.base import ValidatorConfig
+from ..validator.pandas import PandasValidationCollector, PandasValidator
+from . import vectorized
 from .base import BaseRunner
 
 
@@ -39,10 +50,35 @@ class PandasGroupWrapper(GroupWrapper):
     Base class for the pandas implementation for any and all groups
     """
 
+    def eq_operator(self, lhs, rhs):
+        return vectorized.operators["eq"].apply(lhs, rhs)
+
+    def gt_operator(self, lhs, rhs):
+        return vectorized.operators["gt"].apply(lhs, rhs)
+
+    def gte_operator(self, lhs, rhs):
+        return vectorized.operators["gte"].apply(lhs, rhs)
+
+    def lt_operator(self, lhs, rhs):
+        return vectorized.operators["lt"].apply(lhs, rhs)
+
+    def lte_operator(self, lhs, rhs):
+        return vectorized.operators["lte"].apply(lhs, rhs)
+
     def in_operator(self, x, y):
+        result = vectorized.is_in(x, y)
+        if result is not None:
+            return result
+
+        x = vectorized.nullable_to_object(x)
         return reduce(or_, (x == c for c in y), False)
 
     def not_in_operator(self, x, y):
+        result = vectorized.is_in(x, y)
+        if result is not None:
+            return ~result
+
+        x = vectorized.nullable_to_object(x)
         return reduce(and_, (x != c for c in y), True)
 
 
@@ -52,6 +88,11 @@ class PandasAnyWrapper(PandasGroupWrapper):
     """
 
     def check_fn(self, values):
+        values = list(values)
+        result = vectorized.reduce_stacked(values, "any")
+        if result is not None:
+            return result
+
         return reduce(or_, values, False)
 
 
@@ -61,6 +102,11 @@ class PandasAllWrapper(PandasGroupWrapper):
     """
 
     def check_fn(self, values):
+        values = list(values)
+        result = vectorized.reduce_stacked(values, "all")
+        if result is not None:
+            return result
+
         return reduce(and_, values, True)
 
 
@@ -78,6 +124,9 @@ def logical_or_transformer(row, lhs, rhs):
 
 
 def logical_not_transformer(row, value):
+    if isinstance(value, pd.Series):
+        return ~value.astype(bool)
+
     try:
         return not bool(value)
     except ValueError:
@@ -89,15 +138,25 @@ def logical_not_transformer(row, value):
 def in_transformer(row, lhs, rhs):
     if hasattr(lhs, "is_in"):
         return lhs.is_in(rhs)
-    else:
-        return reduce(or_, map(lambda s: lhs == s, rhs))
+
+    result = vectorized.is_in(lhs, rhs)
+    if result is not None:
+        return result
+
+    lhs = vectorized.nullable_to_object(lhs)
+    return reduce(or_, map(lambda s: lhs == s, rhs))
 
 
 def not_in_transformer(row, lhs, rhs):
     if hasattr(lhs, "is_not_in"):
         return lhs.is_not_in(rhs)
-    else:
-        return reduce(and_, map(lambda s: lhs != s, rhs))
+
+    result = vectorized.is_in(lhs, rhs)
+    if result is not None:
+        return ~result
+
+    lhs = vectorized.nullable_to_object(lhs)
+    return reduce(and_, map(lambda s: lhs != s, rhs))
 
 
 #
@@ -110,6 +169,19 @@ class StrReplace:
         self.series_type = series_type
 
     def __call__(self, row: RowType, target, *pattern_repl):
+        if isinstance(target, self.series_type):
+            replacement = get_literal_replacement(
+                pattern_repl, strings_are_regex=True
+            )
+            if replacement is not None:
+                # only values containing a pattern are matched and passed to
+                # the replacement so the series is processed in one pass
+                return target.astype(str).str.replace(
+                    replacement.contains_pattern,
+                    lambda m: replacement(m.group(0)),
+                    regex=True,
+                )
+
         result = target
         patterns = (p for i, p in enumerate(pattern_repl) if i % 2 == 0)
         repls = (r for i, r in enumerate(pattern_repl) if i % 2 != 0)
@@ -204,12 +276,48 @@ def type_converter(to_type, nullable, null_values):
     return _converter
 
 
+class ConstantColumn:
+    """
+    The result of a transformation that has the same value for every row.
+    The value is broadcast when the output dataframe is built rather than
+    being stored for each row.
+
+    :param value: The value for each row
+    :param index: The rows the value applies to
+    """
+
+    def __init__(self, value, index: pd.Index):
+        self.value = value
+        self.index = index
+
+    def to_series(self) -> pd.Series:
+        return pd.Series(self.value, index=self.index)
+
+
 class PandasRunner(BaseRunner):
     """
     Default implementation for a pandas like runner
+
+    **Options:**
+
+    * `chunk_size` - The number of rows to extract and transform at a time.
+      If not set all rows are loaded into memory and transformed together.
     """
 
     name = "Pandas"
+    options_schema = {
+        "type": "object",
+        "properties": {
+            "chunk_size": {
+                "type": "integer",
+                "description": (
+                    "The number of rows to transform at a time, if not set "
+                    "all rows are transformed together"
+                ),
+                "title": "Chunk Size",
+            }
+        },
+    }
 
     row_value_conversions = {
         "int": lambda col, nullable, null_values: col.apply(
@@ -229,7 +337,105 @@ class PandasRunner(BaseRunner):
     dataframe_type = pd.DataFrame
     series_type = pd.Series
 
+    #: The maximum ratio of distinct values to rows for a transformation on
+    #: a single column to be evaluated once per distinct value
+    max_memoized_cardinality_ratio = 0.5
+
+    #: Vectorized implementations of the row value conversions, each takes
+    #: an object array of the non null values and returns the converted
+    #: values and a mask of the values that couldn't be converted
+    vectorized_value_conversions = {
+        "int": vectorized.to_int_values,
+        "float": vectorized.to_float_values,
+        "string": vectorized.to_string_values,
+    }
+
+    #: The value types the vectorized conversions support
+    vectorized_value_types = {str, int, float, type(None)}
+
+    def __init__(self, config, **options):
+        super().__init__(config, **options)
+
+        chunk_size = options.get("chunk_size")
+        self.chunk_size = int(chunk_size) if chunk_size else None
+
+    def coerce_column(
+        self,
+        column: pd.Series,
+        conversion: ColumnConversion,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Converts the values in a column to the type of the conversion. If all
+        values are of a type supported by the vectorized conversions the
+        column is converted in bulk otherwise each value is converted
+        separately.
+
+        :param column: The column to convert
+        :param conversion: The conversion to apply
+
+        :return: The converted values as an object array and a mask of the
+            values that couldn't be converted
+        """
+        values = column.to_numpy(dtype=object)
+        convert = self.vectorized_value_conversions.get(conversion.type)
+
+        if convert is not None and (
+            set(map(type, values)) <= self.vectorized_value_types
+        ):
+            null = (
+                vectorized.null_mask(values, conversion.null_values)
+                if conversion.nullable
+                else np.zeros(len(values), dtype=bool)
+            )
+            if null is not None:
+                result = np.full(len(values), None, dtype=object)
+                bad = np.zeros(len(values), dtype=bool)
+                result[~null], bad[~null] = convert(values[~null])
+                return result, bad
+
+        converted = self.row_value_conversions[
+            conversion.type  # type: ignore
+        ](column, conversion.nullable, conversion.null_values)
+        result = converted.to_numpy(dtype=object)
+        bad = np.fromiter(
+            (isinstance(v, ConversionError) for v in result),
+            dtype=bool,
+            count=len(result),
+        )
+        return result, bad
+
+    def log_type_coercion_errors(
+        self,
+        rows: pd.DataFrame,
+        column: str,
+        conversion: ColumnConversion,
+    ):
+        """
+        Logs the failure of the type coercion for each of the rows
+
+        :param rows: The input rows that failed
+        :param column: The name of the column in which the errors occurred
+        :param conversion: The conversion that failed
+        """
+        errors = self.row_value_conversions[conversion.type](  # type: ignore
+            rows[column],
+            conversion.nullable,
+            conversion.null_values,
+        )
+
+        for entry, error in zip(rows.to_dict("records"), errors):
+            self.log_type_coercion_error(
+                entry,
+                column,
+                error.value,
+                conversion.type,
+                error.reason,
+            )
+
     def coerce_row_types(self, row, conversions: ColumnConversions):
+        if type(row) is pd.DataFrame and len(row.columns):
+            return self.coerce_dataframe_types(row, conversions)
+
         coerced_row = NotSet
 
         for column in row.columns:
@@ -274,18 +480,113 @@ class PandasRunner(BaseRunner):
 
         return coerced_row
 
+    def coerce_dataframe_types(
+        self,
+        row: pd.DataFrame,
+        conversions: ColumnConversions,
+    ) -> pd.DataFrame:
+        """
+        Changes the data types of each column of the dataframe. The rows that
+        fail are found for each column as a mask, logged together and
+        excluded from the result once all columns are converted.
+
+        :param row: The input dataframe
+        :param conversions: The set of conversions to run
+
+        :return: The coerced dataframe without any rows that failed
+        """
+        columns: Dict[str, Any] = {}
+        rejected = np.zeros(len(row), dtype=bool)
+        for column in row.columns:
+            conversion = conversions.get(column)
+            if not conversion:
+                columns[column] = row[column]
+                continue
+
+            columns[column], bad = self.coerce_column(row[column], conversion)
+
+            # rows that failed on an earlier column are only reported once
+            new_bad = bad & ~rejected
+            if new_bad.any():
+                self.log_type_coercion_errors(row[new_bad], column, conversion)
+                rejected |= new_bad
+
+        coerced_row = pd.DataFrame(columns, index=row.index)
+        return coerced_row[~rejected] if rejected.any() else coerced_row
+
+    def get_transformer_overrides(self) -> TransformerMapping:
+        # functions that aren't vectorized get typed columns as objects so
+        # that they see the same values as the object implementation
+        object_arguments = vectorized.with_object_arguments
+        return {
+            **vectorized.operators,  # type: ignore
+            "logical_and": object_arguments(logical_and_transformer),
+            "logical_or": object_arguments(logical_or_transformer),
+            "logical_not": object_arguments(logical_not_transformer),
+            "is_in": in_transformer,
+            "not_in": not_in_transformer,
+            "any": lambda r, values: PandasAnyWrapper(values),
+            "all": lambda r, values: PandasAllWrapper(values),
+            "str_replace": object_arguments(StrReplace(self.series_type)),
+            "str_match": object_arguments(StrMatch(self.series_type)),
+            "str_search": object_arguments(StrSearch(self.series_type)),
+            "str_join": object_arguments(StrJoin(self.series_type)),
+        }
+
     def create_series(self, index, value):
         return self.series_type(value, index=index)
 
-    def get_dataframe(self, extractor: BaseConnector) -> pd.DataFrame:
+    def get_dataframe(
+        self, extractor: BaseConnector, columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
         """
         Builds a dataframe from the extractors data
 
         :param extractor: The extractor providing the input data
+        :param columns: The input columns used by the transformation, if not
+            set all columns are used
 
         :return: The created dataframe
         """
-        return pd.DataFrame(extractor.extract(), dtype="object")
+        batches = list(extractor.extract_batches(columns=columns))
+        if not batches:
+            return pd.DataFrame(dtype="object")
+        elif len(batches) > 1:
+            return pd.concat(batches, ignore_index=True)
+
+        (df,) = batches
+        df.index = pd.RangeIndex(len(df))
+        return df
+
+    def get_dataframe_chunks(
+        self, extractor: BaseConnector, columns: Optional[List[str]] = None
+    ) -> Iterable[pd.DataFrame]:
+        """
+        Builds dataframes of at most ``chunk_size`` rows from the extractors
+        data. Each chunk is indexed by the position of its rows in the full
+        dataset, if there is no data no chunks are generated. If
+        ``chunk_size`` isn't set a single dataframe containing all the data
+        is generated.
+
+        :param extractor: The extractor providing the input data
+        :param columns: The input columns used by the transformation, if not
+            set all columns are used
+
+        :return: An iterable of the created dataframes
+        """
+        if not self.chunk_size:
+            yield self.get_dataframe(extractor, columns)
+            return
+
+        start = 0
+        for chunk in extractor.extract_batches(self.chunk_size, columns):
+            if len(chunk) == 0:
+                continue
+
+            chunk.index = pd.RangeIndex(start, start + len(chunk))
+            yield chunk
+
+            start += len(chunk)
 
     def combine_column(
         self,
@@ -325,6 +626,101 @@ class PandasRunner(BaseRunner):
         else:
             return current_column_value.combine_first(new_column_value)
 
+    def apply_column_transformation(
+        self,
+        row: pd.DataFrame,
+        entry_list: List[TransformationEntry],
+    ):
+        """
+        Applies all the transformations for a single output column. Each
+        entry is applied to the rows not matched by an earlier entry (tracked
+        as a bitmask of the remaining rows) and the column is assembled from
+        the results once all entries are processed.
+
+        :param row: The input dataframe
+        :param entry_list: A list of all the transformations to apply to
+            generate the output series
+
+        :return: The transformation result
+        """
+        if (
+            type(row) is not pd.DataFrame
+            or not row.index.is_unique
+            or not row.index.is_monotonic_increasing
+        ):
+            return super().apply_column_transformation(row, entry_list)
+
+        if len(row) and len(entry_list) == 1 and not entry_list[0].lookups:
+            constant = self.apply_constant_transformation_entry(
+                row, entry_list[0]
+            )
+            if constant is not None:
+                return constant
+
+        remaining = np.ones(len(row), dtype=bool)
+        results = []
+        for entry in entry_list:
+            if not remaining.any():
+                break
+
+            result = self.apply_transformation_entry(
+                row if remaining.all() else row[remaining], entry
+            )
+            if isinstance(result, NotSetType):
+                continue
+
+            positions = row.index.get_indexer(result.index)
+            remaining[positions] = False
+            results.append((positions, result))
+
+        return self.assemble_column(row.index, results)
+
+    def assemble_column(self, index: pd.Index, results):
+        """
+        Builds the output column from the results of each transformation
+        entry. The output matches combining each result in turn using
+        ``combine_first``, as each result is missing the rows covered by the
+        others numeric results are treated as floats and null values from
+        all but the last result are replaced with ``nan``.
+
+        :param index: The index of the input dataframe
+        :param results: Tuples of the positions in the index each result
+            covers and the result series
+
+        :return: The combined column value
+        """
+        if not results:
+            return NotSet
+        elif len(results) == 1:
+            return results[0][1]
+
+        kinds = {result.dtype.kind for _, result in results}
+        if any(len(result) == 0 for _, result in results) or not kinds <= set(
+            "iufbO"
+        ):
+            # the dtype rules below don't hold for these so fallback to
+            # combining the results directly
+            return reduce(
+                lambda current, result: current.combine_first(result),
+                (result for _, result in results),
+            )
+
+        numeric = kinds <= set("iuf")
+        values = np.empty(len(index), dtype=float if numeric else object)
+        assigned = np.zeros(len(index), dtype=bool)
+        for i, (positions, result) in enumerate(results):
+            if result.dtype.kind in "iu":
+                result = result.astype(float)
+
+            result_values = result.to_numpy(dtype=values.dtype)
+            if not numeric and i < len(results) - 1:
+                result_values[pd.isna(result_values)] = nan
+
+            values[positions] = result_values
+            assigned[positions] = True
+
+        return pd.Series(values[assigned], index=index[assigned])
+
     def assign(
         self,
         input_row: pd.DataFrame,
@@ -346,6 +742,8 @@ class PandasRunner(BaseRunner):
         for name, series in assignments.items():
             if isinstance(series, NotSetType):
                 series = self.create_series(input_row.index, nan)
+            elif isinstance(series, ConstantColumn):
+                series = series.to_series()
 
             if isinstance(output_row, NotSetType):
                 output_row = series.to_frame(name=name)
@@ -358,6 +756,180 @@ class PandasRunner(BaseRunner):
 
         return output_row
 
+    def build_output(
+        self,
+        input_row: pd.DataFrame,
+        columns: Dict[str, Any],
+    ) -> Union[pd.DataFrame, NotSetType]:
+        """
+        Builds the output dataframe from the results of each column in a
+        single step. The output matches assigning each column in turn, the
+        rows are the union of the rows in each column and once there are
+        multiple columns any missing or null values are set to ``NotSet``.
+        Constant columns that cover every output row are broadcast from
+        their value.
+
+        :param input_row: The row loaded from the extractor, its index must
+            be unique and sorted
+        :param columns: The transformation result for each output column
+
+        :return: The output dataframe
+        """
+        columns = {
+            name: (
+                self.create_series(input_row.index, nan)
+                if isinstance(value, NotSetType)
+                else value
+            )
+            for name, value in columns.items()
+        }
+
+        if not columns:
+            return NotSet
+        elif len(columns) == 1:
+            ((name, value),) = columns.items()
+            if isinstance(value, ConstantColumn):
+                value = value.to_series()
+
+            return value.to_frame(name=name)
+
+        # track the rows covered once each column is added, the rows of the
+        # earlier columns grow as they are aligned with each new column
+        covered = np.zeros(len(input_row.index), dtype=bool)
+        covered_indexes: List[pd.Index] = []
+        for value in columns.values():
+            covered[input_row.index.get_indexer(value.index)] = True
+            if covered_indexes and covered.sum() == len(covered_indexes[-1]):
+                covered_indexes.append(covered_indexes[-1])
+            elif covered.all():
+                covered_indexes.append(input_row.index)
+            else:
+                covered_indexes.append(input_row.index[covered])
+
+        index = covered_indexes[-1]
+
+        data = {}
+        for i, (name, value) in enumerate(columns.items()):
+            if isinstance(value, ConstantColumn):
+                if len(value.index) == len(index):
+                    data[name] = (
+                        NotSet if pd.isna(value.value) else value.value
+                    )
+                    continue
+
+                value = value.to_series()
+
+            # the column is first aligned with the rows covered when it is
+            # added (or when the second column is added for the first) and
+            # realigned if later columns add rows, nulls are replaced with
+            # ``NotSet`` after each alignment
+            aligned_index = covered_indexes[max(i, 1)]
+            data[name] = value.reindex(aligned_index).fillna(NotSet)
+            if len(aligned_index) != len(index):
+                data[name] = data[name].reindex(index).fillna(NotSet)
+
+        return pd.DataFrame(data, index=index)
+
+    def get_memoized_column(
+        self,
+        input_df: pd.DataFrame,
+        entry: TransformationEntry,
+    ) -> Optional[str]:
+        """
+        Gets the column the transformation can be memoized on. This is
+        possible when the when clause and transformation only use a single
+        integer or string column as the expression only needs to be evaluated
+        once for each distinct value.
+
+        :param input_df: The dataframe loaded from the extractor
+        :param entry: The transformation to apply
+
+        :return: The column name or ``None`` if the transformation can't be
+            memoized
+        """
+        if type(input_df) is not pd.DataFrame or len(entry.lookups) != 1:
+            return None
+
+        (column,) = entry.lookups
+        if column not in input_df.columns:
+            return None
+
+        values = input_df[column]
+        if values.dtype.kind in "iu" and not vectorized.is_nullable(values):
+            return column
+
+        # other types are excluded as values that are treated as equal when
+        # factorizing (such as 1, 1.0 and True or 0.0 and -0.0) can give
+        # different results
+        if (
+            values.dtype == object
+            and pd.api.types.infer_dtype(values, skipna=True) == "string"
+        ):
+            return column
+
+        return None
+
+    def apply_memoized_transformation_entry(
+        self,
+        input_df: pd.DataFrame,
+        entry: TransformationEntry,
+        column: str,
+    ) -> Union[pd.Series, NotSetType, None]:
+        """
+        Applies a transformation that only depends on a single column by
+        evaluating it for each distinct value and mapping the results back
+        to each row. Null values are evaluated separately so that they keep
+        their original representation.
+
+        :param input_df: The dataframe loaded from the extractor
+        :param entry: The transformation to apply
+        :param column: The column the transformation depends on
+
+        :return: The transformation result or ``None`` if there are too many
+            distinct values for memoization to be worthwhile
+        """
+        codes, uniques = pd.factorize(input_df[column])
+        if len(uniques) > len(input_df) * self.max_memoized_cardinality_ratio:
+            return None
+
+        unique_df = pd.DataFrame(
+            {column: pd.Series(uniques, dtype=input_df[column].dtype)}
+        )
+        unique_result = self.evaluate_transformation_entry(unique_df, entry)
+
+        parts = []
+        if not isinstance(unique_result, NotSetType):
+            # map each row to the result for its value, values that were
+            # filtered out by the when clause are excluded from the result,
+            # the extra position is looked up by the null rows (code -1)
+            positions = np.full(len(uniques) + 1, -1)
+            positions[unique_result.index] = np.arange(len(unique_result))
+            row_positions = positions[codes]
+            row_has_result = (codes >= 0) & (row_positions >= 0)
+
+            parts.append(
+                pd.Series(
+                    unique_result.to_numpy()[row_positions[row_has_result]],
+                    index=input_df.index[row_has_result],
+                )
+            )
+
+        null_rows = codes < 0
+        if null_rows.any():
+            null_result = self.evaluate_transformation_entry(
+                input_df[null_rows], entry
+            )
+            if not isinstance(null_result, NotSetType):
+                parts.append(null_result)
+
+        if not parts:
+            return NotSet
+        elif len(parts) == 1:
+            return parts[0]
+
+        combined = pd.concat(parts)
+        return combined[input_df.index[input_df.index.isin(combined.index)]]
+
     def apply_transformation_entry(
         self,
         input_df: pd.DataFrame,
@@ -365,31 +937,66 @@ class PandasRunner(BaseRunner):
     ) -> Union[pd.Series, NotSetType]:
         """
         Applies a single transformation to the dataset returning the result
-        as a series.
+        as a series. If the transformation only depends on a single low
+        cardinality column it is only evaluated once per distinct value.
 
         :param input_df: The dataframe loaded from the extractor
         :param entry: The transformation to apply
 
         :return: The transformation result
         """
-        transformer_mapping: TransformerMapping = {
-            "logical_and": logical_and_transformer,
-            "logical_or": logical_or_transformer,
-            "logical_not": logical_not_transformer,
-            "is_in": in_transformer,
-            "not_in": not_in_transformer,
-            "any": lambda r, values: PandasAnyWrapper(values),
-            "all": lambda r, values: PandasAllWrapper(values),
-            "str_replace": StrReplace(self.series_type),
-            "str_match": StrMatch(self.series_type),
-            "str_search": StrSearch(self.series_type),
-            "str_join": StrJoin(self.series_type),
-        }
+        column = self.get_memoized_column(input_df, entry)
+        if column is not None:
+            result = self.apply_memoized_transformation_entry(
+                input_df, entry, column
+            )
+            if result is not None:
+                return result
+
+        return self.evaluate_transformation_entry(input_df, entry)
+
+    def apply_constant_transformation_entry(
+        self,
+        input_df: pd.DataFrame,
+        entry: TransformationEntry,
+    ) -> Optional[ConstantColumn]:
+        """
+        Applies a transformation that doesn't depend on any columns. When it
+        applies to all rows the value is returned without being expanded to
+        a series.
+
+        :param input_df: The dataframe loaded from the extractor
+        :param entry: The transformation to apply
 
+        :return: The constant column or ``None`` if the result isn't a single
+            value for every row
+        """
+        when = entry.when_fn(input_df, self.transformer_mapping)
+        if isinstance(when, self.series_type) or not when:
+            return None
+
+        result = entry.transformation_fn(input_df, self.transformer_mapping)
+        if not pd.api.types.is_scalar(result):
+            return None
+
+        return ConstantColumn(result, input_df.index)
+
+    def evaluate_transformation_entry(
+        self,
+        input_df: pd.DataFrame,
+        entry: TransformationEntry,
+    ) -> Union[pd.Series, NotSetType]:
+        """
+        Evaluates the when clause and transformation against every row of
+        the dataset returning the result as a series.
+
+        :param input_df: The dataframe loaded from the extractor
+        :param entry: The transformation to apply
+
+        :return: The transformation result
+        """
         # process the when clause to get a filter series
-        filter_series = run(
-            input_df, entry.when_tree or entry.when, transformer_mapping
-        )
+        filter_series = entry.when_fn(input_df, self.transformer_mapping)
 
         if isinstance(filter_series, self.series_type):
             # if we have a series treat it as a row mapping
@@ -407,39 +1014,208 @@ class PandasRunner(BaseRunner):
             )
             return NotSet
 
-        result = run(
-            filtered_input,
-            entry.transformation_tree or entry.transformation,
-            transformer_mapping,
+        result = entry.transformation_fn(
+            filtered_input, self.transformer_mapping
         )
         if isinstance(result, self.series_type):
-            return result
+            # typed numeric results are returned as objects to match the
+            # values produced by the object implementation
+            return vectorized.to_object_series(result)
         else:
             return self.create_series(input_df.index, result)
 
-    def transform(
-        self, extractor: BaseConnector, mapping: BaseMapping
-    ) -> Iterable[Dict[str, Any]]:
-        transformations = mapping.get_transformations()
+    def apply_transformation_set(
+        self,
+        row: pd.DataFrame,
+        transformations: DirectionalMapping,
+        coerced_row: Optional[pd.DataFrame] = None,
+    ) -> Union[pd.DataFrame, NotSetType]:
+        """
+        Applies all the transformations to produce the output dataframe. Any
+        numeric columns are converted to typed columns after coercion so that
+        the transformations can be vectorized.
 
-        df = self.get_dataframe(extractor)
+        :param row: The input dataframe
+        :param transformations: The full set of column conversions and
+            transformation sets to apply to the ``row`` dataframe.
+        :param coerced_row: The input dataframe already coerced to the types
+            of the transformation set, if not provided ``row`` is coerced
 
-        validator = PandasValidator(
+        :return: The transformed dataframe
+        """
+        get_logger().info(
+            f"Running transformation set {transformations.input_format} -> "
+            f"{transformations.output_format}."
+        )
+        if coerced_row is None:
+            coerced_row = self.coerce_row_types(row, transformations.types)
+
+        coerced_row = vectorized.to_typed_columns(coerced_row)
+
+        if (
+            type(row) is pd.DataFrame
+            and row.index.is_unique
+            and row.index.is_monotonic_increasing
+        ):
+            return self.build_output(
+                row,
+                {
+                    name: self.apply_column_transformation(
+                        coerced_row, entry_list
+                    )
+                    for name, entry_list in (
+                        transformations.transformation_set.items()
+                    )
+                },
+            )
+
+        return reduce(
+            lambda target, col_transforms: self.assign(
+                row,
+                target,
+                **{
+                    col_transforms[0]: self.apply_column_transformation(
+                        coerced_row, col_transforms[1]
+                    )
+                },
+            ),
+            transformations.transformation_set.items(),
+            NotSet,
+        )
+
+    def get_validator(self) -> PandasValidator:
+        return PandasValidator(
             search_paths=(
                 [os.path.dirname(self.config.path)] if self.config.path else []
             ),
         )
-        validator.run(
-            self.coerce_row_types(df, transformations[0].types),
+
+    def get_input_columns(
+        self,
+        transformations: List[DirectionalMapping],
+        validation_config: Optional[ValidatorConfig],
+    ) -> Optional[List[str]]:
+        """
+        Gets the input columns used by the transformation. These are the
+        columns looked up by the first transformation set, the columns it
+        converts (as rows failing a conversion are dropped) and the columns
+        used by the input validation.
+
+        :param transformations: The transformation sets to apply
+        :param validation_config: The validation config for the input data
+
+        :return: The sorted names of the used columns, ``None`` if no
+            columns are used
+        """
+        columns = set(transformations[0].types)
+        for entries in transformations[0].transformation_set.values():
+            for entry in entries:
+                columns.update(entry.lookups)
+
+        for validation_entry in (
+            validation_config.entries if validation_config else []
+        ):
+            columns.update(validation_entry.fields)
+            columns.update(validation_entry.group_by or [])
+
+        return sorted(columns) or None
+
+    def apply_transformations(
+        self,
+        df: pd.DataFrame,
+        coerced_df: pd.DataFrame,
+        transformations: List[DirectionalMapping],
+    ) -> pd.DataFrame:
+        """
+        Applies each transformation set in turn to the input dataframe
+
+        :param df: The input dataframe
+        :param coerced_df: The input dataframe coerced to the types of the
+            first transformation set
+        :param transformations: The transformation sets to apply
+
+        :return: The transformed dataframe
+        """
+        return reduce(
+            self.apply_transformation_set,
+            transformations[1:],
+            self.apply_transformation_set(
+                df, transformations[0], coerced_row=coerced_df
+            ),
+        )
+
+    def run(
+        self,
+        extractor: BaseConnector,
+        mapping: BaseMapping,
+        loader: BaseConnector,
+    ):
+        log_metadata(self.config, mapping)
+        loader.load_batches(self.transform_batches(extractor, mapping))
+
+    def transform(
+        self, extractor: BaseConnector, mapping: BaseMapping
+    ) -> Iterable[Dict[str, Any]]:
+        return chain.from_iterable(
+            map(dataframe_rows, self.transform_batches(extractor, mapping))
+        )
+
+    def transform_batches(
+        self, extractor: BaseConnector, mapping: BaseMapping
+    ) -> Iterable[pd.DataFrame]:
+        """
+        Performs the transformation generating a dataframe for each batch of
+        the transformed data. If ``chunk_size`` is set each chunk of the
+        extracted data is a separate batch otherwise all the transformed data
+        is a single batch.
+
+        :param extractor: The data connection to extract data from
+        :param mapping: Mapping object describing the transformations to apply
+
+        :return: An iterable containing the transformed batches
+        """
+        if self.chunk_size:
+            return self.transform_chunks(extractor, mapping)
+
+        return [self.transform_all(extractor, mapping)]
+
+    def transform_all(
+        self, extractor: BaseConnector, mapping: BaseMapping
+    ) -> pd.DataFrame:
+        """
+        Performs the transformation on all the extracted data at once
+
+        :param extractor: The data connection to extract data from
+        :param mapping: Mapping object describing the transformations to apply
+
+        :return: The transformed data
+        """
+        transformations = mapping.get_transformations()
+
+        validator = self.get_validator()
+        input_validation_config = validator.load_config(
             mapping.input_format.name,
             mapping.input_format.version,
             mapping.file_type,
         )
 
-        transformed = reduce(
-            self.apply_transformation_set,
-            transformations,
-            df,
+        df = self.get_dataframe(
+            extractor,
+            self.get_input_columns(transformations, input_validation_config),
+        )
+
+        # the coerced input is shared with the first transformation set so
+        # that it is only coerced (and any errors logged) once
+        coerced_df = self.coerce_row_types(df, transformations[0].types)
+        validator.run_config(
+            coerced_df,
+            input_validation_config,
+            mapping.input_format.name,
+            mapping.file_type,
+        )
+
+        transformed = self.apply_transformations(
+            df, coerced_df, transformations
         )
 
         validator.run(
@@ -449,4 +1225,51 @@ class PandasRunner(BaseRunner):
             mapping.file_type,
         )
 
-        return (r.to_dict() for idx, r in transformed.iterrows())
+        return transformed
+
+    def transform_chunks(
+        self, extractor: BaseConnector, mapping: BaseMapping
+    ) -> Iterable[pd.DataFrame]:
+        """
+        Performs the transformation on each chunk of the extracted data
+        passing the transformed chunk onto the loader as each chunk is
+        processed. The validations are run once all chunks have been
+        processed.
+
+        :param extractor: The data connection to extract data from
+        :param mapping: Mapping object describing the transformations to apply
+
+        :return: An iterable containing the transformed chunks
+        """
+        transformations = mapping.get_transformations()
+
+        validator = self.get_validator()
+        input_validation = PandasValidationCollector(
+            validator,
+            mapping.input_format.name,
+            mapping.input_format.version,
+            mapping.file_type,
+        )
+        output_validation = PandasValidationCollector(
+            validator,
+            mapping.output_format.name,
+            mapping.output_format.version,
+            mapping.file_type,
+        )
+
+        for df in self.get_dataframe_chunks(
+            extractor,
+            self.get_input_columns(transformations, input_validation.config),
+        ):
+            coerced_df = self.coerce_row_types(df, transformations[0].types)
+            input_validation.add(coerced_df)
+
+            transformed = self.apply_transformations(
+                df, coerced_df, transformations
+            )
+            output_validation.add(transformed)
+
+            yield transformed
+
+        input_validation.run()
+        output_validation.run()
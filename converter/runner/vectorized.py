@@ -0,0 +1,564 @@
+import operator
+from typing import Any, Callable, Collection, Iterable, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from numpy import nan
+
+
+#: The maximum magnitude of an integer result before we fall back to the
+#: python implementation to preserve arbitrary precision
+INT_LIMIT = 2**63
+
+#: The number of values converted together when finding the values that
+#: can't be converted
+CONVERSION_BLOCK_SIZE = 4096
+
+
+def to_typed_columns(df):
+    """
+    Converts the object columns of the dataframe where all values are ints
+    or all values are floats to typed numpy columns so that operations on
+    them can be vectorized. Columns where the only nulls are ``None`` are
+    converted to nullable columns with the ``None`` entries masked, columns
+    containing other nulls or mixed types are left as objects so that they
+    keep their current semantics.
+
+    :param df: The dataframe to convert
+
+    :return: The converted dataframe
+    """
+    if not isinstance(df, pd.DataFrame):
+        return df
+
+    conversions = {}
+    nullable_columns = {}
+    for column in df.columns[df.dtypes == object]:
+        values = df[column].to_numpy()
+        nulls = pd.isna(values)
+
+        # the types are inferred from the non null values as ``None`` in
+        # float columns isn't skipped when inferring
+        inferred = pd.api.types.infer_dtype(
+            values[~nulls] if nulls.any() else values, skipna=False
+        )
+        if inferred == "integer":
+            dtype = np.int64
+        elif inferred == "floating":
+            dtype = np.float64
+        else:
+            continue
+
+        if not nulls.any():
+            conversions[column] = dtype
+            continue
+
+        nullable = to_nullable_values(values, nulls, dtype)
+        if nullable is None:
+            continue
+        elif nullable.isna().any():
+            nullable_columns[column] = nullable
+        else:
+            # float columns where the only nulls are nan don't need a mask
+            conversions[column] = dtype
+
+    if conversions:
+        try:
+            df = df.astype(conversions)
+        except OverflowError:
+            # python ints larger than 64 bits need to stay as objects so
+            # convert each column separately skipping those that fail
+            for column, dtype in conversions.items():
+                try:
+                    df = df.astype({column: dtype})
+                except OverflowError:
+                    pass
+
+    if nullable_columns:
+        df = df.copy()
+        for column, nullable in nullable_columns.items():
+            df[column] = pd.Series(nullable, index=df.index)
+
+    return df
+
+
+def to_nullable_values(
+    values: np.ndarray, nulls: np.ndarray, dtype
+) -> Optional[Union[pd.arrays.IntegerArray, pd.arrays.FloatingArray]]:
+    """
+    Converts an object array of ints or floats containing nulls to a
+    nullable array where the ``None`` entries are masked. ``nan`` entries in
+    float arrays are kept as values as they behave in the same way as python
+    floats.
+
+    :param values: The object array to convert
+    :param nulls: The mask of the null values in the array
+    :param dtype: The numpy type of the non null values
+
+    :return: The nullable array or ``None`` if the array contains other
+        nulls or values that are too large for numpy
+    """
+    null_values = values[nulls]
+    is_none = np.equal(null_values, None)
+    if not is_none.all() and (
+        dtype is not np.float64
+        or pd.api.types.infer_dtype(null_values[~is_none], skipna=False)
+        != "floating"
+    ):
+        return None
+
+    mask = nulls.copy()
+    mask[nulls] = is_none
+
+    data = np.ones(len(values), dtype=dtype)
+    try:
+        data[~mask] = values[~mask].astype(dtype)
+    except OverflowError:
+        return None
+
+    if dtype is np.int64:
+        return pd.arrays.IntegerArray(data, mask)
+
+    return pd.arrays.FloatingArray(data, mask)
+
+
+def is_nullable(value) -> bool:
+    """
+    Checks if the value is a nullable typed series created by
+    :func:`to_typed_columns`
+
+    :param value: The value to check
+
+    :return: ``True`` if the value is a nullable series
+    """
+    return isinstance(value, pd.Series) and isinstance(
+        value.dtype, (pd.Int64Dtype, pd.Float64Dtype)
+    )
+
+
+def nullable_to_object(value):
+    """
+    Converts a nullable typed series back to an object series with the
+    masked entries set to ``None``. Other values are returned unchanged.
+
+    :param value: The value to convert
+
+    :return: The converted value
+    """
+    if is_nullable(value):
+        return pd.Series(
+            value.to_numpy(dtype=object, na_value=None),
+            index=value.index,
+            name=value.name,
+        )
+
+    return value
+
+
+def with_object_arguments(fn: Callable) -> Callable:
+    """
+    Wraps a transformer function that isn't vectorized so that any typed
+    series passed to it are converted back to object series first.
+
+    :param fn: The transformer function to wrap
+
+    :return: The wrapped function
+    """
+
+    def wrapper(row, *args):
+        return fn(
+            row,
+            *(
+                [to_object_series(v) for v in arg]
+                if isinstance(arg, list)
+                else to_object_series(arg)
+                for arg in args
+            ),
+        )
+
+    return wrapper
+
+
+def null_mask(
+    values: np.ndarray, null_values: Collection
+) -> Optional[np.ndarray]:
+    """
+    Gets the mask of values that are treated as null by a type conversion,
+    these are ``None``, ``nan`` and any of the ``null_values``. Only arrays
+    of strings, ints, floats and ``None`` are supported.
+
+    :param values: The object array to check
+    :param null_values: The values treated as null by the conversion
+
+    :return: The null mask or ``None`` if the null values can't be checked
+        as a group
+    """
+    mask = pd.isna(values)
+    if null_values:
+        try:
+            mask |= pd.Series(values, dtype=object).isin(list(null_values))
+        except TypeError:
+            return None
+
+    return mask
+
+
+def to_float_values(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Converts an object array to floats with the same results as ``float``.
+    If any value can't be converted the array is converted in blocks so
+    that only the values in the blocks that fail are checked separately.
+
+    :param values: The object array to convert
+
+    :return: The converted values and a mask of the values that couldn't be
+        converted
+    """
+    try:
+        result = values.astype(float)
+    except (TypeError, ValueError, OverflowError):
+        result = np.full(len(values), nan)
+        for start in range(0, len(values), CONVERSION_BLOCK_SIZE):
+            block = slice(start, start + CONVERSION_BLOCK_SIZE)
+            try:
+                result[block] = values[block].astype(float)
+            except (TypeError, ValueError, OverflowError):
+                # left as nan so that each value is checked below
+                pass
+
+    # numpy converts ``None`` to ``nan`` rather than failing so all ``nan``
+    # results are checked
+    failed = np.zeros(len(values), dtype=bool)
+    for i in np.flatnonzero(np.isnan(result)):
+        try:
+            result[i] = float(values[i])
+        except (TypeError, ValueError, OverflowError):
+            failed[i] = True
+
+    return result, failed
+
+
+def to_int_values(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Converts an object array to python ints with the same results as
+    ``int(float(v))``. Values are converted to floats first so that strings
+    such as ``"3.1"`` are accepted and truncated.
+
+    :param values: The object array to convert
+
+    :return: The converted values as an object array and a mask of the
+        values that couldn't be converted
+    """
+    floats, failed = to_float_values(values)
+
+    finite = np.isfinite(floats) & ~failed
+    small = finite & (np.abs(floats) < INT_LIMIT)
+
+    result = np.full(len(values), None, dtype=object)
+    result[small] = floats[small].astype(np.int64).astype(object)
+    for i in np.flatnonzero(finite & ~small):
+        result[i] = int(floats[i])
+
+    return result, ~finite
+
+
+def to_string_values(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Converts an object array to strings using ``str``.
+
+    :param values: The object array to convert
+
+    :return: The converted values as an object array and a mask of the
+        values that couldn't be converted
+    """
+    result = np.empty(len(values), dtype=object)
+    result[:] = [str(v) for v in values]
+    return result, np.zeros(len(values), dtype=bool)
+
+
+def to_object_series(value):
+    """
+    Converts a typed numeric series back to an object series so that the
+    output of the runner matches the object implementation.
+
+    :param value: The value to convert
+
+    :return: The converted value
+    """
+    if is_nullable(value):
+        return nullable_to_object(value)
+
+    if isinstance(value, pd.Series) and value.dtype.kind in "if":
+        return value.astype(object)
+
+    return value
+
+
+def typed_values(value):
+    """
+    Gets the numeric representation of a value that numpy operations can be
+    applied to. Only typed numeric pandas series and python numbers are
+    supported, for any other value ``None`` is returned so that the caller can
+    fall back to the object implementation. The masked entries of nullable
+    series are set to ``1`` so that they can't cause errors, the caller is
+    responsible for replacing the results for these entries.
+
+    :param value: The value to convert
+
+    :return: The typed values or ``None`` if the value isnt numeric
+    """
+    if isinstance(value, bool):
+        # python treats bools as ints in arithmetic whereas numpy treats
+        # them as logical values so leave them to the object implementation
+        return None
+
+    if isinstance(value, int):
+        return value if abs(value) < INT_LIMIT else None
+
+    if isinstance(value, float):
+        return value
+
+    if is_nullable(value):
+        return value.to_numpy(dtype=value.dtype.numpy_dtype, na_value=1)
+
+    if isinstance(value, pd.Series) and value.dtype.kind in "if":
+        return value.to_numpy()
+
+    return None
+
+
+def combined_nulls(*values) -> Optional[np.ndarray]:
+    """
+    Gets the mask of the entries that are null in any of the nullable
+    series in the values.
+
+    :param values: The values to get the mask for
+
+    :return: The combined mask or ``None`` if none of the values are
+        nullable
+    """
+    masks = [v.isna().to_numpy() for v in values if is_nullable(v)]
+    if not masks:
+        return None
+
+    return np.logical_or.reduce(masks)
+
+
+def shared_index(*values) -> Optional[pd.Index]:
+    """
+    Gets the index shared by all the series in the values. If there are no
+    pandas series, any of the values are another type of collection or the
+    indexes differ ``None`` is returned as the values cannot be operated on
+    as aligned arrays.
+
+    :param values: The values to get the index for
+
+    :return: The shared index or ``None``
+    """
+    index = None
+    for v in values:
+        if isinstance(v, pd.Series):
+            if index is None:
+                index = v.index
+            elif v.index is not index and not v.index.equals(index):
+                return None
+        elif hasattr(v, "__len__") and not isinstance(v, str):
+            return None
+
+    return index
+
+
+class NumpyOperator:
+    """
+    Transformer operation that is applied to typed numpy arrays when both
+    operands are numeric. If either operand isn't numeric the python operator
+    is applied to the original values.
+
+    :param op: The python operator to apply
+    """
+
+    def __init__(self, op: Callable[[Any, Any], Any]):
+        self.op = op
+
+    def __call__(self, row, lhs, rhs):
+        return self.apply(lhs, rhs)
+
+    def evaluate(self, lhs, rhs):
+        """
+        Applies the operation to the typed values.
+
+        :param lhs: The left hand side of the operator
+        :param rhs: The right hand side of the operator
+
+        :return: The result array or ``None`` if the object implementation
+            should be used
+        """
+        raise NotImplementedError()
+
+    def fill_nulls(self, result: np.ndarray, nulls: np.ndarray) -> np.ndarray:
+        """
+        Sets the result for the entries where either operand is null to the
+        value given by the object implementation.
+
+        :param result: The result array
+        :param nulls: The mask of the null entries
+
+        :return: The updated result array
+        """
+        raise NotImplementedError()
+
+    def apply(self, lhs, rhs):
+        """
+        Applies the operation to the operands.
+
+        :param lhs: The left hand side of the operator
+        :param rhs: The right hand side of the operator
+
+        :return: The result of the operation
+        """
+        index = shared_index(lhs, rhs)
+        if index is None:
+            return self.op(lhs, rhs)
+
+        typed_lhs = typed_values(lhs)
+        typed_rhs = typed_values(rhs)
+        if typed_lhs is not None and typed_rhs is not None:
+            with np.errstate(all="ignore"):
+                result = self.evaluate(typed_lhs, typed_rhs)
+        else:
+            result = None
+
+        if result is None:
+            return self.op(to_object_series(lhs), to_object_series(rhs))
+
+        nulls = combined_nulls(lhs, rhs)
+        if nulls is not None and nulls.any():
+            result = self.fill_nulls(result, nulls)
+
+        return pd.Series(result, index=index)
+
+
+class ArithmeticOperator(NumpyOperator):
+    """
+    Applies an arithmetic operation, ``nan`` entries propagate in the same
+    way as the object implementation.
+    """
+
+    def evaluate(self, lhs, rhs):
+        if self.op is operator.truediv and np.any(np.asarray(rhs) == 0):
+            # python raises on division by zero, leave this to the object
+            # implementation so the behaviour is preserved
+            return None
+
+        result = np.asarray(self.op(lhs, rhs))
+        if result.dtype.kind == "i":
+            # python ints have arbitrary precision so if the result could have
+            # overflowed fallback to the object implementation
+            approx = self.op(
+                np.asarray(lhs, dtype=float), np.asarray(rhs, dtype=float)
+            )
+            if np.any(np.abs(approx) >= INT_LIMIT):
+                return None
+
+        return result
+
+    def fill_nulls(self, result, nulls):
+        # the object implementation gives nan for null entries, int results
+        # are returned as objects so that the other entries stay as ints
+        if result.dtype.kind != "f":
+            result = result.astype(object)
+
+        result[nulls] = nan
+        return result
+
+
+class ComparisonOperator(NumpyOperator):
+    """
+    Applies a comparison operation, comparisons with ``nan`` and null
+    entries resolve in the same way as the object implementation.
+    """
+
+    def evaluate(self, lhs, rhs):
+        return np.asarray(self.op(lhs, rhs), dtype=bool)
+
+    def fill_nulls(self, result, nulls):
+        # null entries are only not equal to other values
+        result[nulls] = self.op is operator.ne
+        return result
+
+
+#: Numpy implementations of the arithmetic and comparison operations
+operators = {
+    "add": ArithmeticOperator(operator.add),
+    "subtract": ArithmeticOperator(operator.sub),
+    "multiply": ArithmeticOperator(operator.mul),
+    "divide": ArithmeticOperator(operator.truediv),
+    "eq": ComparisonOperator(operator.eq),
+    "not_eq": ComparisonOperator(operator.ne),
+    "gt": ComparisonOperator(operator.gt),
+    "gte": ComparisonOperator(operator.ge),
+    "lt": ComparisonOperator(operator.lt),
+    "lte": ComparisonOperator(operator.le),
+}
+
+
+def reduce_stacked(
+    values: Iterable[Any], reduction: str
+) -> Optional[Union[pd.Series, bool]]:
+    """
+    Reduces a set of boolean results by stacking them into a 2d array and
+    reducing along each row.
+
+    :param values: The boolean series or values to reduce
+    :param reduction: Either ``"any"`` or ``"all"``
+
+    :return: The reduced series or ``None`` if the values cant be stacked
+    """
+    values = list(values)
+    index = shared_index(*values)
+    if index is None:
+        return None
+
+    columns = []
+    for v in values:
+        if isinstance(v, pd.Series):
+            if v.dtype != bool:
+                return None
+            columns.append(v.to_numpy())
+        elif isinstance(v, (bool, np.bool_)):
+            columns.append(np.full(len(index), v))
+        else:
+            return None
+
+    stacked = np.column_stack(columns)
+    return pd.Series(getattr(stacked, reduction)(axis=1), index=index)
+
+
+def is_in(lhs, rhs) -> Optional[pd.Series]:
+    """
+    Checks if the lhs is in the rhs values for each entry. If the lhs is a
+    series and all rhs values are hashable, non null scalars this is done
+    using a single hash lookup otherwise the equality check against each
+    value is stacked.
+
+    :param lhs: The value to check
+    :param rhs: The values to check against
+
+    :return: The result series or ``None`` if the vectorized implementation
+        cant be used
+    """
+    if not rhs or shared_index(lhs, *rhs) is None:
+        return None
+
+    if isinstance(lhs, pd.Series) and all(
+        isinstance(v, (str, int, float)) and not pd.isna(v) for v in rhs
+    ):
+        if is_nullable(lhs):
+            # null entries are never matched
+            nulls = lhs.isna().to_numpy()
+            typed = pd.Series(typed_values(lhs), index=lhs.index)
+            return typed.isin(rhs) & ~nulls
+
+        return lhs.isin(rhs)
+
+    return reduce_stacked((operators["eq"].apply(lhs, v) for v in rhs), "any")
@@ -0,0 +1,2195 @@
+# flake8: noqa
+# isort: skip_file
+# mypy: ignore-errors
+# fmt: off
+#
+# Generated from the grammar in converter/transformers/grammar.py, do not edit
+# this file directly. To regenerate it after changing the grammar run:
+#
+#    python -c "from converter.transformers.grammar import generate_standalone_parser; generate_standalone_parser()"
+#
+# The file was automatically generated by Lark v0.8.9
+#
+#
+#   Lark Stand-alone Generator Tool
+# ----------------------------------
+# Generates a stand-alone LALR(1) parser with a standard lexer
+#
+# Git:    https://github.com/erezsh/lark
+# Author: Erez Shinan (erezshin@gmail.com)
+#
+#
+#    >>> LICENSE
+#
+#    This tool and its generated code use a separate license from Lark,
+#    and are subject to the terms of the Mozilla Public License, v. 2.0.
+#    If a copy of the MPL was not distributed with this
+#    file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#    If you wish to purchase a commercial license for this tool and its
+#    generated code, you may contact me via email or otherwise.
+#
+#    If MPL2 is incompatible with your free or open-source project,
+#    contact me and we'll work it out.
+#
+#
+
+import os
+from io import open
+
+class LarkError(Exception):
+    pass
+
+class GrammarError(LarkError):
+    pass
+
+class ParseError(LarkError):
+    pass
+
+class LexError(LarkError):
+    pass
+
+class UnexpectedEOF(ParseError):
+    def __init__(self, expected):
+        self.expected = expected
+
+        message = ("Unexpected end-of-input. Expected one of: \n\t* %s\n" % '\n\t* '.join(x.name for x in self.expected))
+        super(UnexpectedEOF, self).__init__(message)
+
+
+class UnexpectedInput(LarkError):
+    pos_in_stream = None
+
+    def get_context(self, text, span=40):
+        pos = self.pos_in_stream
+        start = max(pos - span, 0)
+        end = pos + span
+        before = text[start:pos].rsplit('\n', 1)[-1]
+        after = text[pos:end].split('\n', 1)[0]
+        return before + after + '\n' + ' ' * len(before) + '^\n'
+
+    def match_examples(self, parse_fn, examples):
+        """ Given a parser instance and a dictionary mapping some label with
+            some malformed syntax examples, it'll return the label for the
+            example that bests matches the current error.
+        """
+        assert self.state is not None, "Not supported for this exception"
+
+        candidate = None
+        for label, example in examples.items():
+            assert not isinstance(example, STRING_TYPE)
+
+            for malformed in example:
+                try:
+                    parse_fn(malformed)
+                except UnexpectedInput as ut:
+                    if ut.state == self.state:
+                        try:
+                            if ut.token == self.token:  # Try exact match first
+                                return label
+                        except AttributeError:
+                            pass
+                        if not candidate:
+                            candidate = label
+
+        return candidate
+
+
+class UnexpectedCharacters(LexError, UnexpectedInput):
+    def __init__(self, seq, lex_pos, line, column, allowed=None, considered_tokens=None, state=None, token_history=None):
+        message = "No terminal defined for '%s' at line %d col %d" % (seq[lex_pos], line, column)
+
+        self.line = line
+        self.column = column
+        self.allowed = allowed
+        self.considered_tokens = considered_tokens
+        self.pos_in_stream = lex_pos
+        self.state = state
+
+        message += '\n\n' + self.get_context(seq)
+        if allowed:
+            message += '\nExpecting: %s\n' % allowed
+        if token_history:
+            message += '\nPrevious tokens: %s\n' % ', '.join(repr(t) for t in token_history)
+
+        super(UnexpectedCharacters, self).__init__(message)
+
+
+
+class UnexpectedToken(ParseError, UnexpectedInput):
+    def __init__(self, token, expected, considered_rules=None, state=None):
+        self.token = token
+        self.expected = expected     # XXX str shouldn't necessary
+        self.line = getattr(token, 'line', '?')
+        self.column = getattr(token, 'column', '?')
+        self.considered_rules = considered_rules
+        self.state = state
+        self.pos_in_stream = getattr(token, 'pos_in_stream', None)
+
+        message = ("Unexpected token %r at line %s, column %s.\n"
+                   "Expected one of: \n\t* %s\n"
+                   % (token, self.line, self.column, '\n\t* '.join(self.expected)))
+
+        super(UnexpectedToken, self).__init__(message)
+
+class VisitError(LarkError):
+    """VisitError is raised when visitors are interrupted by an exception
+
+    It provides the following attributes for inspection:
+    - obj: the tree node or token it was processing when the exception was raised
+    - orig_exc: the exception that cause it to fail
+    """
+    def __init__(self, rule, obj, orig_exc):
+        self.obj = obj
+        self.orig_exc = orig_exc
+
+        message = 'Error trying to process rule "%s":\n\n%s' % (rule, orig_exc)
+        super(VisitError, self).__init__(message)
+
+def classify(seq, key=None, value=None):
+    d = {}
+    for item in seq:
+        k = key(item) if (key is not None) else item
+        v = value(item) if (value is not None) else item
+        if k in d:
+            d[k].append(v)
+        else:
+            d[k] = [v]
+    return d
+
+
+def _deserialize(data, namespace, memo):
+    if isinstance(data, dict):
+        if '__type__' in data: # Object
+            class_ = namespace[data['__type__']]
+            return class_.deserialize(data, memo)
+        elif '@' in data:
+            return memo[data['@']]
+        return {key:_deserialize(value, namespace, memo) for key, value in data.items()}
+    elif isinstance(data, list):
+        return [_deserialize(value, namespace, memo) for value in data]
+    return data
+
+
+class Serialize(object):
+    def memo_serialize(self, types_to_memoize):
+        memo = SerializeMemoizer(types_to_memoize)
+        return self.serialize(memo), memo.serialize()
+
+    def serialize(self, memo=None):
+        if memo and memo.in_types(self):
+            return {'@': memo.memoized.get(self)}
+
+        fields = getattr(self, '__serialize_fields__')
+        res = {f: _serialize(getattr(self, f), memo) for f in fields}
+        res['__type__'] = type(self).__name__
+        postprocess = getattr(self, '_serialize', None)
+        if postprocess:
+            postprocess(res, memo)
+        return res
+
+    @classmethod
+    def deserialize(cls, data, memo):
+        namespace = getattr(cls, '__serialize_namespace__', {})
+        namespace = {c.__name__:c for c in namespace}
+
+        fields = getattr(cls, '__serialize_fields__')
+
+        if '@' in data:
+            return memo[data['@']]
+
+        inst = cls.__new__(cls)
+        for f in fields:
+            try:
+                setattr(inst, f, _deserialize(data[f], namespace, memo))
+            except KeyError as e:
+                raise KeyError("Cannot find key for class", cls, e)
+        postprocess = getattr(inst, '_deserialize', None)
+        if postprocess:
+            postprocess()
+        return inst
+
+
+class SerializeMemoizer(Serialize):
+    __serialize_fields__ = 'memoized',
+
+    def __init__(self, types_to_memoize):
+        self.types_to_memoize = tuple(types_to_memoize)
+        self.memoized = Enumerator()
+
+    def in_types(self, value):
+        return isinstance(value, self.types_to_memoize)
+
+    def serialize(self):
+        return _serialize(self.memoized.reversed(), None)
+
+    @classmethod
+    def deserialize(cls, data, namespace, memo):
+        return _deserialize(data, namespace, memo)
+
+
+
+try:
+    STRING_TYPE = basestring
+except NameError:   # Python 3
+    STRING_TYPE = str
+
+
+import types
+from functools import wraps, partial
+from contextlib import contextmanager
+
+Str = type(u'')
+try:
+    classtype = types.ClassType # Python2
+except AttributeError:
+    classtype = type    # Python3
+
+def smart_decorator(f, create_decorator):
+    if isinstance(f, types.FunctionType):
+        return wraps(f)(create_decorator(f, True))
+
+    elif isinstance(f, (classtype, type, types.BuiltinFunctionType)):
+        return wraps(f)(create_decorator(f, False))
+
+    elif isinstance(f, types.MethodType):
+        return wraps(f)(create_decorator(f.__func__, True))
+
+    elif isinstance(f, partial):
+        # wraps does not work for partials in 2.7: https://bugs.python.org/issue3445
+        return wraps(f.func)(create_decorator(lambda *args, **kw: f(*args[1:], **kw), True))
+
+    else:
+        return create_decorator(f.__func__.__call__, True)
+
+import sys, re
+Py36 = (sys.version_info[:2] >= (3, 6))
+
+import sre_parse
+import sre_constants
+def get_regexp_width(regexp):
+    try:
+        return [int(x) for x in sre_parse.parse(regexp).getwidth()]
+    except sre_constants.error:
+        raise ValueError(regexp)
+
+
+class Meta:
+    def __init__(self):
+        self.empty = True
+
+class Tree(object):
+    def __init__(self, data, children, meta=None):
+        self.data = data
+        self.children = children
+        self._meta = meta
+
+    @property
+    def meta(self):
+        if self._meta is None:
+            self._meta = Meta()
+        return self._meta
+
+    def __repr__(self):
+        return 'Tree(%s, %s)' % (self.data, self.children)
+
+    def _pretty_label(self):
+        return self.data
+
+    def _pretty(self, level, indent_str):
+        if len(self.children) == 1 and not isinstance(self.children[0], Tree):
+            return [ indent_str*level, self._pretty_label(), '\t', '%s' % (self.children[0],), '\n']
+
+        l = [ indent_str*level, self._pretty_label(), '\n' ]
+        for n in self.children:
+            if isinstance(n, Tree):
+                l += n._pretty(level+1, indent_str)
+            else:
+                l += [ indent_str*(level+1), '%s' % (n,), '\n' ]
+
+        return l
+
+    def pretty(self, indent_str='  '):
+        return ''.join(self._pretty(0, indent_str))
+
+    def __eq__(self, other):
+        try:
+            return self.data == other.data and self.children == other.children
+        except AttributeError:
+            return False
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self):
+        return hash((self.data, tuple(self.children)))
+
+    def iter_subtrees(self):
+        queue = [self]
+        subtrees = OrderedDict()
+        for subtree in queue:
+            subtrees[id(subtree)] = subtree
+            queue += [c for c in reversed(subtree.children)
+                      if isinstance(c, Tree) and id(c) not in subtrees]
+
+        del queue
+        return reversed(list(subtrees.values()))
+
+    def find_pred(self, pred):
+        "Find all nodes where pred(tree) == True"
+        return filter(pred, self.iter_subtrees())
+
+    def find_data(self, data):
+        "Find all nodes where tree.data == data"
+        return self.find_pred(lambda t: t.data == data)
+
+
+from inspect import getmembers, getmro
+
+class Discard(Exception):
+    pass
+
+# Transformers
+
+class _Decoratable:
+    @classmethod
+    def _apply_decorator(cls, decorator, **kwargs):
+        mro = getmro(cls)
+        assert mro[0] is cls
+        libmembers = {name for _cls in mro[1:] for name, _ in getmembers(_cls)}
+        for name, value in getmembers(cls):
+
+            # Make sure the function isn't inherited (unless it's overwritten)
+            if name.startswith('_') or (name in libmembers and name not in cls.__dict__):
+                continue
+            if not callable(value):
+                continue
+
+            # Skip if v_args already applied (at the function level)
+            if hasattr(cls.__dict__[name], 'vargs_applied') or hasattr(value, 'vargs_applied'):
+                continue
+
+            static = isinstance(cls.__dict__[name], (staticmethod, classmethod))
+            setattr(cls, name, decorator(value, static=static, **kwargs))
+        return cls
+
+    def __class_getitem__(cls, _):
+        return cls
+
+
+class Transformer(_Decoratable):
+    """Visits the tree recursively, starting with the leaves and finally the root (bottom-up)
+
+    Calls its methods (provided by user via inheritance) according to tree.data
+    The returned value replaces the old one in the structure.
+
+    Can be used to implement map or reduce.
+    """
+    __visit_tokens__ = True   # For backwards compatibility
+
+    def __init__(self,  visit_tokens=True):
+        self.__visit_tokens__ = visit_tokens
+
+    def _call_userfunc(self, tree, new_children=None):
+        # Assumes tree is already transformed
+        children = new_children if new_children is not None else tree.children
+        try:
+            f = getattr(self, tree.data)
+        except AttributeError:
+            return self.__default__(tree.data, children, tree.meta)
+        else:
+            try:
+                wrapper = getattr(f, 'visit_wrapper', None)
+                if wrapper is not None:
+                    return f.visit_wrapper(f, tree.data, children, tree.meta)
+                else:
+                    return f(children)
+            except (GrammarError, Discard):
+                raise
+            except Exception as e:
+                raise VisitError(tree.data, tree, e)
+
+    def _call_userfunc_token(self, token):
+        try:
+            f = getattr(self, token.type)
+        except AttributeError:
+            return self.__default_token__(token)
+        else:
+            try:
+                return f(token)
+            except (GrammarError, Discard):
+                raise
+            except Exception as e:
+                raise VisitError(token.type, token, e)
+
+
+    def _transform_children(self, children):
+        for c in children:
+            try:
+                if isinstance(c, Tree):
+                    yield self._transform_tree(c)
+                elif self.__visit_tokens__ and isinstance(c, Token):
+                    yield self._call_userfunc_token(c)
+                else:
+                    yield c
+            except Discard:
+                pass
+
+    def _transform_tree(self, tree):
+        children = list(self._transform_children(tree.children))
+        return self._call_userfunc(tree, children)
+
+    def transform(self, tree):
+        return self._transform_tree(tree)
+
+    def __mul__(self, other):
+        return TransformerChain(self, other)
+
+    def __default__(self, data, children, meta):
+        "Default operation on tree (for override)"
+        return Tree(data, children, meta)
+
+    def __default_token__(self, token):
+        "Default operation on token (for override)"
+        return token
+
+
+
+class InlineTransformer(Transformer):   # XXX Deprecated
+    def _call_userfunc(self, tree, new_children=None):
+        # Assumes tree is already transformed
+        children = new_children if new_children is not None else tree.children
+        try:
+            f = getattr(self, tree.data)
+        except AttributeError:
+            return self.__default__(tree.data, children, tree.meta)
+        else:
+            return f(*children)
+
+
+class TransformerChain(object):
+    def __init__(self, *transformers):
+        self.transformers = transformers
+
+    def transform(self, tree):
+        for t in self.transformers:
+            tree = t.transform(tree)
+        return tree
+
+    def __mul__(self, other):
+        return TransformerChain(*self.transformers + (other,))
+
+
+class Transformer_InPlace(Transformer):
+    "Non-recursive. Changes the tree in-place instead of returning new instances"
+    def _transform_tree(self, tree):           # Cancel recursion
+        return self._call_userfunc(tree)
+
+    def transform(self, tree):
+        for subtree in tree.iter_subtrees():
+            subtree.children = list(self._transform_children(subtree.children))
+
+        return self._transform_tree(tree)
+
+
+class Transformer_NonRecursive(Transformer):
+    "Non-recursive. Doesn't change the original tree."
+
+    def transform(self, tree):
+        # Tree to postfix
+        rev_postfix = []
+        q = [tree]
+        while q:
+            t = q.pop()
+            rev_postfix.append( t )
+            if isinstance(t, Tree):
+                q += t.children
+
+        # Postfix to tree
+        stack = []
+        for x in reversed(rev_postfix):
+            if isinstance(x, Tree):
+                size = len(x.children)
+                if size:
+                    args = stack[-size:]
+                    del stack[-size:]
+                else:
+                    args = []
+                stack.append(self._call_userfunc(x, args))
+            else:
+                stack.append(x)
+
+        t ,= stack  # We should have only one tree remaining
+        return t
+
+
+
+class Transformer_InPlaceRecursive(Transformer):
+    "Recursive. Changes the tree in-place instead of returning new instances"
+    def _transform_tree(self, tree):
+        tree.children = list(self._transform_children(tree.children))
+        return self._call_userfunc(tree)
+
+
+
+# Visitors
+
+class VisitorBase:
+    def _call_userfunc(self, tree):
+        return getattr(self, tree.data, self.__default__)(tree)
+
+    def __default__(self, tree):
+        "Default operation on tree (for override)"
+        return tree
+
+    def __class_getitem__(cls, _):
+        return cls
+
+
+class Visitor(VisitorBase):
+    """Bottom-up visitor, non-recursive
+
+    Visits the tree, starting with the leaves and finally the root (bottom-up)
+    Calls its methods (provided by user via inheritance) according to tree.data
+    """
+
+    def visit(self, tree):
+        for subtree in tree.iter_subtrees():
+            self._call_userfunc(subtree)
+        return tree
+
+    def visit_topdown(self,tree):
+        for subtree in tree.iter_subtrees_topdown():
+            self._call_userfunc(subtree)
+        return tree
+
+class Visitor_Recursive(VisitorBase):
+    """Bottom-up visitor, recursive
+
+    Visits the tree, starting with the leaves and finally the root (bottom-up)
+    Calls its methods (provided by user via inheritance) according to tree.data
+    """
+
+    def visit(self, tree):
+        for child in tree.children:
+            if isinstance(child, Tree):
+                self.visit(child)
+
+        self._call_userfunc(tree)
+        return tree
+
+    def visit_topdown(self,tree):
+        self._call_userfunc(tree)
+
+        for child in tree.children:
+            if isinstance(child, Tree):
+                self.visit_topdown(child)
+
+        return tree
+
+
+
+def visit_children_decor(func):
+    "See Interpreter"
+    @wraps(func)
+    def inner(cls, tree):
+        values = cls.visit_children(tree)
+        return func(cls, values)
+    return inner
+
+
+class Interpreter(_Decoratable):
+    """Top-down visitor, recursive
+
+    Visits the tree, starting with the root and finally the leaves (top-down)
+    Calls its methods (provided by user via inheritance) according to tree.data
+
+    Unlike Transformer and Visitor, the Interpreter doesn't automatically visit its sub-branches.
+    The user has to explicitly call visit_children, or use the @visit_children_decor
+    """
+
+    def visit(self, tree):
+        f = getattr(self, tree.data)
+        wrapper = getattr(f, 'visit_wrapper', None)
+        if wrapper is not None:
+            return f.visit_wrapper(f, tree.data, tree.children, tree.meta)
+        else:
+            return f(tree)
+
+    def visit_children(self, tree):
+        return [self.visit(child) if isinstance(child, Tree) else child
+                for child in tree.children]
+
+    def __getattr__(self, name):
+        return self.__default__
+
+    def __default__(self, tree):
+        return self.visit_children(tree)
+
+
+
+
+# Decorators
+
+def _apply_decorator(obj, decorator, **kwargs):
+    try:
+        _apply = obj._apply_decorator
+    except AttributeError:
+        return decorator(obj, **kwargs)
+    else:
+        return _apply(decorator, **kwargs)
+
+
+
+def _inline_args__func(func):
+    @wraps(func)
+    def create_decorator(_f, with_self):
+        if with_self:
+            def f(self, children):
+                return _f(self, *children)
+        else:
+            def f(self, children):
+                return _f(*children)
+        return f
+
+    return smart_decorator(func, create_decorator)
+
+
+def inline_args(obj):   # XXX Deprecated
+    return _apply_decorator(obj, _inline_args__func)
+
+
+
+def _visitor_args_func_dec(func, visit_wrapper=None, static=False):
+    def create_decorator(_f, with_self):
+        if with_self:
+            def f(self, *args, **kwargs):
+                return _f(self, *args, **kwargs)
+        else:
+            def f(self, *args, **kwargs):
+                return _f(*args, **kwargs)
+        return f
+
+    if static:
+        f = wraps(func)(create_decorator(func, False))
+    else:
+        f = smart_decorator(func, create_decorator)
+    f.vargs_applied = True
+    f.visit_wrapper = visit_wrapper
+    return f
+
+
+def _vargs_inline(f, data, children, meta):
+    return f(*children)
+def _vargs_meta_inline(f, data, children, meta):
+    return f(meta, *children)
+def _vargs_meta(f, data, children, meta):
+    return f(children, meta)   # TODO swap these for consistency? Backwards incompatible!
+def _vargs_tree(f, data, children, meta):
+    return f(Tree(data, children, meta))
+
+def v_args(inline=False, meta=False, tree=False, wrapper=None):
+    "A convenience decorator factory, for modifying the behavior of user-supplied visitor methods"
+    if tree and (meta or inline):
+        raise ValueError("Visitor functions cannot combine 'tree' with 'meta' or 'inline'.")
+
+    func = None
+    if meta:
+        if inline:
+            func = _vargs_meta_inline
+        else:
+            func = _vargs_meta
+    elif inline:
+        func = _vargs_inline
+    elif tree:
+        func = _vargs_tree
+
+    if wrapper is not None:
+        if func is not None:
+            raise ValueError("Cannot use 'wrapper' along with 'tree', 'meta' or 'inline'.")
+        func = wrapper
+
+    def _visitor_args_dec(obj):
+        return _apply_decorator(obj, _visitor_args_func_dec, visit_wrapper=func)
+    return _visitor_args_dec
+
+
+
+class Indenter:
+    def __init__(self):
+        self.paren_level = None
+        self.indent_level = None
+        assert self.tab_len > 0
+
+    def handle_NL(self, token):
+        if self.paren_level > 0:
+            return
+
+        yield token
+
+        indent_str = token.rsplit('\n', 1)[1] # Tabs and spaces
+        indent = indent_str.count(' ') + indent_str.count('\t') * self.tab_len
+
+        if indent > self.indent_level[-1]:
+            self.indent_level.append(indent)
+            yield Token.new_borrow_pos(self.INDENT_type, indent_str, token)
+        else:
+            while indent < self.indent_level[-1]:
+                self.indent_level.pop()
+                yield Token.new_borrow_pos(self.DEDENT_type, indent_str, token)
+
+            assert indent == self.indent_level[-1], '%s != %s' % (indent, self.indent_level[-1])
+
+    def _process(self, stream):
+        for token in stream:
+            if token.type == self.NL_type:
+                for t in self.handle_NL(token):
+                    yield t
+            else:
+                yield token
+
+            if token.type in self.OPEN_PAREN_types:
+                self.paren_level += 1
+            elif token.type in self.CLOSE_PAREN_types:
+                self.paren_level -= 1
+                assert self.paren_level >= 0
+
+        while len(self.indent_level) > 1:
+            self.indent_level.pop()
+            yield Token(self.DEDENT_type, '')
+
+        assert self.indent_level == [0], self.indent_level
+
+    def process(self, stream):
+        self.paren_level = 0
+        self.indent_level = [0]
+        return self._process(stream)
+
+    # XXX Hack for ContextualLexer. Maybe there's a more elegant solution?
+    @property
+    def always_accept(self):
+        return (self.NL_type,)
+
+
+
+class Symbol(Serialize):
+    __slots__ = ('name',)
+
+    is_term = NotImplemented
+
+    def __init__(self, name):
+        self.name = name
+
+    def __eq__(self, other):
+        assert isinstance(other, Symbol), other
+        return self.is_term == other.is_term and self.name == other.name
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self):
+        return hash(self.name)
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, self.name)
+
+    fullrepr = property(__repr__)
+
+
+class Terminal(Symbol):
+    __serialize_fields__ = 'name', 'filter_out'
+
+    is_term = True
+
+    def __init__(self, name, filter_out=False):
+        self.name = name
+        self.filter_out = filter_out
+
+    @property
+    def fullrepr(self):
+        return '%s(%r, %r)' % (type(self).__name__, self.name, self.filter_out)
+
+
+
+class NonTerminal(Symbol):
+    __serialize_fields__ = 'name',
+
+    is_term = False
+
+
+
+class RuleOptions(Serialize):
+    __serialize_fields__ = 'keep_all_tokens', 'expand1', 'priority', 'template_source', 'empty_indices'
+
+    def __init__(self, keep_all_tokens=False, expand1=False, priority=None, template_source=None, empty_indices=()):
+        self.keep_all_tokens = keep_all_tokens
+        self.expand1 = expand1
+        self.priority = priority
+        self.template_source = template_source
+        self.empty_indices = empty_indices
+
+    def __repr__(self):
+        return 'RuleOptions(%r, %r, %r, %r)' % (
+            self.keep_all_tokens,
+            self.expand1,
+            self.priority,
+            self.template_source
+        )
+
+
+class Rule(Serialize):
+    """
+        origin : a symbol
+        expansion : a list of symbols
+        order : index of this expansion amongst all rules of the same name
+    """
+    __slots__ = ('origin', 'expansion', 'alias', 'options', 'order', '_hash')
+
+    __serialize_fields__ = 'origin', 'expansion', 'order', 'alias', 'options'
+    __serialize_namespace__ = Terminal, NonTerminal, RuleOptions
+
+    def __init__(self, origin, expansion, order=0, alias=None, options=None):
+        self.origin = origin
+        self.expansion = expansion
+        self.alias = alias
+        self.order = order
+        self.options = options or RuleOptions()
+        self._hash = hash((self.origin, tuple(self.expansion)))
+
+    def _deserialize(self):
+        self._hash = hash((self.origin, tuple(self.expansion)))
+
+    def __str__(self):
+        return '<%s : %s>' % (self.origin.name, ' '.join(x.name for x in self.expansion))
+
+    def __repr__(self):
+        return 'Rule(%r, %r, %r, %r)' % (self.origin, self.expansion, self.alias, self.options)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if not isinstance(other, Rule):
+            return False
+        return self.origin == other.origin and self.expansion == other.expansion
+
+
+
+
+
+class Pattern(Serialize):
+
+    def __init__(self, value, flags=()):
+        self.value = value
+        self.flags = frozenset(flags)
+
+    def __repr__(self):
+        return repr(self.to_regexp())
+
+    # Pattern Hashing assumes all subclasses have a different priority!
+    def __hash__(self):
+        return hash((type(self), self.value, self.flags))
+    def __eq__(self, other):
+        return type(self) == type(other) and self.value == other.value and self.flags == other.flags
+
+    def to_regexp(self):
+        raise NotImplementedError()
+
+    if Py36:
+        # Python 3.6 changed syntax for flags in regular expression
+        def _get_flags(self, value):
+            for f in self.flags:
+                value = ('(?%s:%s)' % (f, value))
+            return value
+
+    else:
+        def _get_flags(self, value):
+            for f in self.flags:
+                value = ('(?%s)' % f) + value
+            return value
+
+
+class PatternStr(Pattern):
+    __serialize_fields__ = 'value', 'flags'
+
+    type = "str"
+
+    def to_regexp(self):
+        return self._get_flags(re.escape(self.value))
+
+    @property
+    def min_width(self):
+        return len(self.value)
+    max_width = min_width
+
+class PatternRE(Pattern):
+    __serialize_fields__ = 'value', 'flags', '_width'
+
+    type = "re"
+
+    def to_regexp(self):
+        return self._get_flags(self.value)
+
+    _width = None
+    def _get_width(self):
+        if self._width is None:
+            self._width = get_regexp_width(self.to_regexp())
+        return self._width
+
+    @property
+    def min_width(self):
+        return self._get_width()[0]
+    @property
+    def max_width(self):
+        return self._get_width()[1]
+
+
+class TerminalDef(Serialize):
+    __serialize_fields__ = 'name', 'pattern', 'priority'
+    __serialize_namespace__ = PatternStr, PatternRE
+
+    def __init__(self, name, pattern, priority=1):
+        assert isinstance(pattern, Pattern), pattern
+        self.name = name
+        self.pattern = pattern
+        self.priority = priority
+
+    def __repr__(self):
+        return '%s(%r, %r)' % (type(self).__name__, self.name, self.pattern)
+
+
+
+class Token(Str):
+    __slots__ = ('type', 'pos_in_stream', 'value', 'line', 'column', 'end_line', 'end_column', 'end_pos')
+
+    def __new__(cls, type_, value, pos_in_stream=None, line=None, column=None, end_line=None, end_column=None, end_pos=None):
+        try:
+            self = super(Token, cls).__new__(cls, value)
+        except UnicodeDecodeError:
+            value = value.decode('latin1')
+            self = super(Token, cls).__new__(cls, value)
+
+        self.type = type_
+        self.pos_in_stream = pos_in_stream
+        self.value = value
+        self.line = line
+        self.column = column
+        self.end_line = end_line
+        self.end_column = end_column
+        self.end_pos = end_pos
+        return self
+
+    def update(self, type_=None, value=None):
+        return Token.new_borrow_pos(
+            type_ if type_ is not None else self.type,
+            value if value is not None else self.value,
+            self
+        )
+
+    @classmethod
+    def new_borrow_pos(cls, type_, value, borrow_t):
+        return cls(type_, value, borrow_t.pos_in_stream, borrow_t.line, borrow_t.column, borrow_t.end_line, borrow_t.end_column, borrow_t.end_pos)
+
+    def __reduce__(self):
+        return (self.__class__, (self.type, self.value, self.pos_in_stream, self.line, self.column, ))
+
+    def __repr__(self):
+        return 'Token(%s, %r)' % (self.type, self.value)
+
+    def __deepcopy__(self, memo):
+        return Token(self.type, self.value, self.pos_in_stream, self.line, self.column)
+
+    def __eq__(self, other):
+        if isinstance(other, Token) and self.type != other.type:
+            return False
+
+        return Str.__eq__(self, other)
+
+    __hash__ = Str.__hash__
+
+
+class LineCounter:
+    def __init__(self):
+        self.newline_char = '\n'
+        self.char_pos = 0
+        self.line = 1
+        self.column = 1
+        self.line_start_pos = 0
+
+    def feed(self, token, test_newline=True):
+        """Consume a token and calculate the new line & column.
+
+        As an optional optimization, set test_newline=False is token doesn't contain a newline.
+        """
+        if test_newline:
+            newlines = token.count(self.newline_char)
+            if newlines:
+                self.line += newlines
+                self.line_start_pos = self.char_pos + token.rindex(self.newline_char) + 1
+
+        self.char_pos += len(token)
+        self.column = self.char_pos - self.line_start_pos + 1
+
+class _Lex:
+    "Built to serve both Lexer and ContextualLexer"
+    def __init__(self, lexer, state=None):
+        self.lexer = lexer
+        self.state = state
+
+    def lex(self, stream, newline_types, ignore_types):
+        newline_types = frozenset(newline_types)
+        ignore_types = frozenset(ignore_types)
+        line_ctr = LineCounter()
+        last_token = None
+
+        while line_ctr.char_pos < len(stream):
+            lexer = self.lexer
+            res = lexer.match(stream, line_ctr.char_pos)
+            if not res:
+                allowed = {v for m, tfi in lexer.mres for v in tfi.values()} - ignore_types
+                if not allowed:
+                    allowed = {"<END-OF-FILE>"}
+                raise UnexpectedCharacters(stream, line_ctr.char_pos, line_ctr.line, line_ctr.column, allowed=allowed, state=self.state, token_history=last_token and [last_token])
+
+            value, type_ = res
+
+            if type_ not in ignore_types:
+                t = Token(type_, value, line_ctr.char_pos, line_ctr.line, line_ctr.column)
+                line_ctr.feed(value, type_ in newline_types)
+                t.end_line = line_ctr.line
+                t.end_column = line_ctr.column
+                t.end_pos = line_ctr.char_pos
+                if t.type in lexer.callback:
+                    t = lexer.callback[t.type](t)
+                    if not isinstance(t, Token):
+                        raise ValueError("Callbacks must return a token (returned %r)" % t)
+                yield t
+                last_token = t
+            else:
+                if type_ in lexer.callback:
+                    t2 = Token(type_, value, line_ctr.char_pos, line_ctr.line, line_ctr.column)
+                    lexer.callback[type_](t2)
+                line_ctr.feed(value, type_ in newline_types)
+
+
+
+
+class UnlessCallback:
+    def __init__(self, mres):
+        self.mres = mres
+
+    def __call__(self, t):
+        for mre, type_from_index in self.mres:
+            m = mre.match(t.value)
+            if m:
+                t.type = type_from_index[m.lastindex]
+                break
+        return t
+
+class CallChain:
+    def __init__(self, callback1, callback2, cond):
+        self.callback1 = callback1
+        self.callback2 = callback2
+        self.cond = cond
+
+    def __call__(self, t):
+        t2 = self.callback1(t)
+        return self.callback2(t) if self.cond(t2) else t2
+
+
+
+
+
+def _create_unless(terminals, g_regex_flags):
+    tokens_by_type = classify(terminals, lambda t: type(t.pattern))
+    assert len(tokens_by_type) <= 2, tokens_by_type.keys()
+    embedded_strs = set()
+    callback = {}
+    for retok in tokens_by_type.get(PatternRE, []):
+        unless = [] # {}
+        for strtok in tokens_by_type.get(PatternStr, []):
+            if strtok.priority > retok.priority:
+                continue
+            s = strtok.pattern.value
+            m = re.match(retok.pattern.to_regexp(), s, g_regex_flags)
+            if m and m.group(0) == s:
+                unless.append(strtok)
+                if strtok.pattern.flags <= retok.pattern.flags:
+                    embedded_strs.add(strtok)
+        if unless:
+            callback[retok.name] = UnlessCallback(build_mres(unless, g_regex_flags, match_whole=True))
+
+    terminals = [t for t in terminals if t not in embedded_strs]
+    return terminals, callback
+
+
+def _build_mres(terminals, max_size, g_regex_flags, match_whole):
+    # Python sets an unreasonable group limit (currently 100) in its re module
+    # Worse, the only way to know we reached it is by catching an AssertionError!
+    # This function recursively tries less and less groups until it's successful.
+    postfix = '$' if match_whole else ''
+    mres = []
+    while terminals:
+        try:
+            mre = re.compile(u'|'.join(u'(?P<%s>%s)'%(t.name, t.pattern.to_regexp()+postfix) for t in terminals[:max_size]), g_regex_flags)
+        except AssertionError:  # Yes, this is what Python provides us.. :/
+            return _build_mres(terminals, max_size//2, g_regex_flags, match_whole)
+
+        # terms_from_name = {t.name: t for t in terminals[:max_size]}
+        mres.append((mre, {i:n for n,i in mre.groupindex.items()} ))
+        terminals = terminals[max_size:]
+    return mres
+
+def build_mres(terminals, g_regex_flags, match_whole=False):
+    return _build_mres(terminals, len(terminals), g_regex_flags, match_whole)
+
+def _regexp_has_newline(r):
+    r"""Expressions that may indicate newlines in a regexp:
+        - newlines (\n)
+        - escaped newline (\\n)
+        - anything but ([^...])
+        - any-char (.) when the flag (?s) exists
+        - spaces (\s)
+    """
+    return '\n' in r or '\\n' in r or '\\s' in r or '[^' in r or ('(?s' in r and '.' in r)
+
+class Lexer(object):
+    """Lexer interface
+
+    Method Signatures:
+        lex(self, stream) -> Iterator[Token]
+    """
+    lex = NotImplemented
+
+
+class TraditionalLexer(Lexer):
+
+    def __init__(self, terminals, ignore=(), user_callbacks={}, g_regex_flags=0):
+        assert all(isinstance(t, TerminalDef) for t in terminals), terminals
+
+        terminals = list(terminals)
+
+        # Sanitization
+        for t in terminals:
+            try:
+                re.compile(t.pattern.to_regexp(), g_regex_flags)
+            except re.error:
+                raise LexError("Cannot compile token %s: %s" % (t.name, t.pattern))
+
+            if t.pattern.min_width == 0:
+                raise LexError("Lexer does not allow zero-width terminals. (%s: %s)" % (t.name, t.pattern))
+
+        assert set(ignore) <= {t.name for t in terminals}
+
+        # Init
+        self.newline_types = [t.name for t in terminals if _regexp_has_newline(t.pattern.to_regexp())]
+        self.ignore_types = list(ignore)
+
+        terminals.sort(key=lambda x:(-x.priority, -x.pattern.max_width, -len(x.pattern.value), x.name))
+        self.terminals = terminals
+        self.user_callbacks = user_callbacks
+        self.build(g_regex_flags)
+
+    def build(self, g_regex_flags=0):
+        terminals, self.callback = _create_unless(self.terminals, g_regex_flags)
+        assert all(self.callback.values())
+
+        for type_, f in self.user_callbacks.items():
+            if type_ in self.callback:
+                # Already a callback there, probably UnlessCallback
+                self.callback[type_] = CallChain(self.callback[type_], f, lambda t: t.type == type_)
+            else:
+                self.callback[type_] = f
+
+        self.mres = build_mres(terminals, g_regex_flags)
+
+    def match(self, stream, pos):
+        for mre, type_from_index in self.mres:
+            m = mre.match(stream, pos)
+            if m:
+                return m.group(0), type_from_index[m.lastindex]
+
+    def lex(self, stream):
+        return _Lex(self).lex(stream, self.newline_types, self.ignore_types)
+
+
+
+
+class ContextualLexer(Lexer):
+
+    def __init__(self, terminals, states, ignore=(), always_accept=(), user_callbacks={}, g_regex_flags=0):
+        tokens_by_name = {}
+        for t in terminals:
+            assert t.name not in tokens_by_name, t
+            tokens_by_name[t.name] = t
+
+        lexer_by_tokens = {}
+        self.lexers = {}
+        for state, accepts in states.items():
+            key = frozenset(accepts)
+            try:
+                lexer = lexer_by_tokens[key]
+            except KeyError:
+                accepts = set(accepts) | set(ignore) | set(always_accept)
+                state_tokens = [tokens_by_name[n] for n in accepts if n and n in tokens_by_name]
+                lexer = TraditionalLexer(state_tokens, ignore=ignore, user_callbacks=user_callbacks, g_regex_flags=g_regex_flags)
+                lexer_by_tokens[key] = lexer
+
+            self.lexers[state] = lexer
+
+        self.root_lexer = TraditionalLexer(terminals, ignore=ignore, user_callbacks=user_callbacks, g_regex_flags=g_regex_flags)
+
+    def lex(self, stream, get_parser_state):
+        parser_state = get_parser_state()
+        l = _Lex(self.lexers[parser_state], parser_state)
+        try:
+            for x in l.lex(stream, self.root_lexer.newline_types, self.root_lexer.ignore_types):
+                yield x
+                parser_state = get_parser_state()
+                l.lexer = self.lexers[parser_state]
+                l.state = parser_state # For debug only, no need to worry about multithreading
+        except UnexpectedCharacters as e:
+            # In the contextual lexer, UnexpectedCharacters can mean that the terminal is defined,
+            # but not in the current context.
+            # This tests the input against the global context, to provide a nicer error.
+            root_match = self.root_lexer.match(stream, e.pos_in_stream)
+            if not root_match:
+                raise
+
+            value, type_ = root_match
+            t = Token(type_, value, e.pos_in_stream, e.line, e.column)
+            raise UnexpectedToken(t, e.allowed, state=e.state)
+
+
+
+class LexerConf(Serialize):
+    __serialize_fields__ = 'tokens', 'ignore', 'g_regex_flags'
+    __serialize_namespace__ = TerminalDef,
+
+    def __init__(self, tokens, ignore=(), postlex=None, callbacks=None, g_regex_flags=0):
+        self.tokens = tokens
+        self.ignore = ignore
+        self.postlex = postlex
+        self.callbacks = callbacks or {}
+        self.g_regex_flags = g_regex_flags
+
+    def _deserialize(self):
+        self.callbacks = {} # TODO
+
+
+from functools import partial, wraps
+from itertools import repeat, product
+
+
+class ExpandSingleChild:
+    def __init__(self, node_builder):
+        self.node_builder = node_builder
+
+    def __call__(self, children):
+        if len(children) == 1:
+            return children[0]
+        else:
+            return self.node_builder(children)
+
+class PropagatePositions:
+    def __init__(self, node_builder):
+        self.node_builder = node_builder
+
+    def __call__(self, children):
+        res = self.node_builder(children)
+
+        # local reference to Tree.meta reduces number of presence checks
+        if isinstance(res, Tree):
+            res_meta = res.meta
+            for c in children:
+                if isinstance(c, Tree):
+                    child_meta = c.meta
+                    if not child_meta.empty:
+                        res_meta.line = child_meta.line
+                        res_meta.column = child_meta.column
+                        res_meta.start_pos = child_meta.start_pos
+                        res_meta.empty = False
+                        break
+                elif isinstance(c, Token):
+                    res_meta.line = c.line
+                    res_meta.column = c.column
+                    res_meta.start_pos = c.pos_in_stream
+                    res_meta.empty = False
+                    break
+
+            for c in reversed(children):
+                if isinstance(c, Tree):
+                    child_meta = c.meta
+                    if not child_meta.empty:
+                        res_meta.end_line = child_meta.end_line
+                        res_meta.end_column = child_meta.end_column
+                        res_meta.end_pos = child_meta.end_pos
+                        res_meta.empty = False
+                        break
+                elif isinstance(c, Token):
+                    res_meta.end_line = c.end_line
+                    res_meta.end_column = c.end_column
+                    res_meta.end_pos = c.end_pos
+                    res_meta.empty = False
+                    break
+
+        return res
+
+
+class ChildFilter:
+    def __init__(self, to_include, append_none, node_builder):
+        self.node_builder = node_builder
+        self.to_include = to_include
+        self.append_none = append_none
+
+    def __call__(self, children):
+        filtered = []
+
+        for i, to_expand, add_none in self.to_include:
+            if add_none:
+                filtered += [None] * add_none
+            if to_expand:
+                filtered += children[i].children
+            else:
+                filtered.append(children[i])
+
+        if self.append_none:
+            filtered += [None] * self.append_none
+
+        return self.node_builder(filtered)
+
+class ChildFilterLALR(ChildFilter):
+    "Optimized childfilter for LALR (assumes no duplication in parse tree, so it's safe to change it)"
+
+    def __call__(self, children):
+        filtered = []
+        for i, to_expand, add_none in self.to_include:
+            if add_none:
+                filtered += [None] * add_none
+            if to_expand:
+                if filtered:
+                    filtered += children[i].children
+                else:   # Optimize for left-recursion
+                    filtered = children[i].children
+            else:
+                filtered.append(children[i])
+
+        if self.append_none:
+            filtered += [None] * self.append_none
+
+        return self.node_builder(filtered)
+
+class ChildFilterLALR_NoPlaceholders(ChildFilter):
+    "Optimized childfilter for LALR (assumes no duplication in parse tree, so it's safe to change it)"
+    def __init__(self, to_include, node_builder):
+        self.node_builder = node_builder
+        self.to_include = to_include
+
+    def __call__(self, children):
+        filtered = []
+        for i, to_expand in self.to_include:
+            if to_expand:
+                if filtered:
+                    filtered += children[i].children
+                else:   # Optimize for left-recursion
+                    filtered = children[i].children
+            else:
+                filtered.append(children[i])
+        return self.node_builder(filtered)
+
+def _should_expand(sym):
+    return not sym.is_term and sym.name.startswith('_')
+
+def maybe_create_child_filter(expansion, keep_all_tokens, ambiguous, _empty_indices):
+    # Prepare empty_indices as: How many Nones to insert at each index?
+    if _empty_indices:
+        assert _empty_indices.count(False) == len(expansion)
+        s = ''.join(str(int(b)) for b in _empty_indices)
+        empty_indices = [len(ones) for ones in s.split('0')]
+        assert len(empty_indices) == len(expansion)+1, (empty_indices, len(expansion))
+    else:
+        empty_indices = [0] * (len(expansion)+1)
+
+    to_include = []
+    nones_to_add = 0
+    for i, sym in enumerate(expansion):
+        nones_to_add += empty_indices[i]
+        if keep_all_tokens or not (sym.is_term and sym.filter_out):
+            to_include.append((i, _should_expand(sym), nones_to_add))
+            nones_to_add = 0
+
+    nones_to_add += empty_indices[len(expansion)]
+
+    if _empty_indices or len(to_include) < len(expansion) or any(to_expand for i, to_expand,_ in to_include):
+        if _empty_indices or ambiguous:
+            return partial(ChildFilter if ambiguous else ChildFilterLALR, to_include, nones_to_add)
+        else:
+            # LALR without placeholders
+            return partial(ChildFilterLALR_NoPlaceholders, [(i, x) for i,x,_ in to_include])
+
+class AmbiguousExpander:
+    """Deal with the case where we're expanding children ('_rule') into a parent but the children
+       are ambiguous. i.e. (parent->_ambig->_expand_this_rule). In this case, make the parent itself
+       ambiguous with as many copies as their are ambiguous children, and then copy the ambiguous children
+       into the right parents in the right places, essentially shifting the ambiguiuty up the tree."""
+    def __init__(self, to_expand, tree_class, node_builder):
+        self.node_builder = node_builder
+        self.tree_class = tree_class
+        self.to_expand = to_expand
+
+    def __call__(self, children):
+        def _is_ambig_tree(child):
+            return hasattr(child, 'data') and child.data == '_ambig'
+
+        #### When we're repeatedly expanding ambiguities we can end up with nested ambiguities.
+        #    All children of an _ambig node should be a derivation of that ambig node, hence
+        #    it is safe to assume that if we see an _ambig node nested within an ambig node
+        #    it is safe to simply expand it into the parent _ambig node as an alternative derivation.
+        ambiguous = []
+        for i, child in enumerate(children):
+            if _is_ambig_tree(child):
+                if i in self.to_expand:
+                    ambiguous.append(i)
+
+                to_expand = [j for j, grandchild in enumerate(child.children) if _is_ambig_tree(grandchild)]
+                child.expand_kids_by_index(*to_expand)
+
+        if not ambiguous:
+            return self.node_builder(children)
+
+        expand = [ iter(child.children) if i in ambiguous else repeat(child) for i, child in enumerate(children) ]
+        return self.tree_class('_ambig', [self.node_builder(list(f[0])) for f in product(zip(*expand))])
+
+def maybe_create_ambiguous_expander(tree_class, expansion, keep_all_tokens):
+    to_expand = [i for i, sym in enumerate(expansion)
+                 if keep_all_tokens or ((not (sym.is_term and sym.filter_out)) and _should_expand(sym))]
+    if to_expand:
+        return partial(AmbiguousExpander, to_expand, tree_class)
+
+def ptb_inline_args(func):
+    @wraps(func)
+    def f(children):
+        return func(*children)
+    return f
+
+def inplace_transformer(func):
+    @wraps(func)
+    def f(children):
+        # function name in a Transformer is a rule name.
+        tree = Tree(func.__name__, children)
+        return func(tree)
+    return f
+
+def apply_visit_wrapper(func, name, wrapper):
+    if wrapper is _vargs_meta or wrapper is _vargs_meta_inline:
+        raise NotImplementedError("Meta args not supported for internal transformer")
+    @wraps(func)
+    def f(children):
+        return wrapper(func, name, children, None)
+    return f
+
+
+class ParseTreeBuilder:
+    def __init__(self, rules, tree_class, propagate_positions=False, keep_all_tokens=False, ambiguous=False, maybe_placeholders=False):
+        self.tree_class = tree_class
+        self.propagate_positions = propagate_positions
+        self.always_keep_all_tokens = keep_all_tokens
+        self.ambiguous = ambiguous
+        self.maybe_placeholders = maybe_placeholders
+
+        self.rule_builders = list(self._init_builders(rules))
+
+    def _init_builders(self, rules):
+        for rule in rules:
+            options = rule.options
+            keep_all_tokens = self.always_keep_all_tokens or options.keep_all_tokens
+            expand_single_child = options.expand1
+
+            wrapper_chain = list(filter(None, [
+                (expand_single_child and not rule.alias) and ExpandSingleChild,
+                maybe_create_child_filter(rule.expansion, keep_all_tokens, self.ambiguous, options.empty_indices if self.maybe_placeholders else None),
+                self.propagate_positions and PropagatePositions,
+                self.ambiguous and maybe_create_ambiguous_expander(self.tree_class, rule.expansion, keep_all_tokens),
+            ]))
+
+            yield rule, wrapper_chain
+
+
+    def create_callback(self, transformer=None):
+        callbacks = {}
+
+        for rule, wrapper_chain in self.rule_builders:
+
+            user_callback_name = rule.alias or rule.options.template_source or rule.origin.name
+            try:
+                f = getattr(transformer, user_callback_name)
+                # XXX InlineTransformer is deprecated!
+                wrapper = getattr(f, 'visit_wrapper', None)
+                if wrapper is not None:
+                    f = apply_visit_wrapper(f, user_callback_name, wrapper)
+                else:
+                    if isinstance(transformer, InlineTransformer):
+                        f = ptb_inline_args(f)
+                    elif isinstance(transformer, Transformer_InPlace):
+                        f = inplace_transformer(f)
+            except AttributeError:
+                f = partial(self.tree_class, user_callback_name)
+
+            for w in wrapper_chain:
+                f = w(f)
+
+            if rule in callbacks:
+                raise GrammarError("Rule '%s' already exists" % (rule,))
+
+            callbacks[rule] = f
+
+        return callbacks
+
+
+class LALR_Parser(object):
+    def __init__(self, parser_conf, debug=False):
+        assert all(r.options.priority is None for r in parser_conf.rules), "LALR doesn't yet support prioritization"
+        analysis = LALR_Analyzer(parser_conf, debug=debug)
+        analysis.compute_lalr()
+        callbacks = parser_conf.callbacks
+
+        self._parse_table = analysis.parse_table
+        self.parser_conf = parser_conf
+        self.parser = _Parser(analysis.parse_table, callbacks, debug)
+
+    @classmethod
+    def deserialize(cls, data, memo, callbacks):
+        inst = cls.__new__(cls)
+        inst._parse_table = IntParseTable.deserialize(data, memo)
+        inst.parser = _Parser(inst._parse_table, callbacks)
+        return inst
+
+    def serialize(self, memo):
+        return self._parse_table.serialize(memo)
+
+    def parse(self, *args):
+        return self.parser.parse(*args)
+
+
+class _Parser:
+    def __init__(self, parse_table, callbacks, debug=False):
+        self.states = parse_table.states
+        self.start_states = parse_table.start_states
+        self.end_states = parse_table.end_states
+        self.callbacks = callbacks
+        self.debug = debug
+
+    def parse(self, seq, start, set_state=None):
+        token = None
+        stream = iter(seq)
+        states = self.states
+
+        start_state = self.start_states[start]
+        end_state = self.end_states[start]
+
+        state_stack = [start_state]
+        value_stack = []
+
+        if set_state: set_state(start_state)
+
+        def get_action(token):
+            state = state_stack[-1]
+            try:
+                return states[state][token.type]
+            except KeyError:
+                expected = [s for s in states[state].keys() if s.isupper()]
+                raise UnexpectedToken(token, expected, state=state)
+
+        def reduce(rule):
+            size = len(rule.expansion)
+            if size:
+                s = value_stack[-size:]
+                del state_stack[-size:]
+                del value_stack[-size:]
+            else:
+                s = []
+
+            value = self.callbacks[rule](s)
+
+            _action, new_state = states[state_stack[-1]][rule.origin.name]
+            assert _action is Shift
+            state_stack.append(new_state)
+            value_stack.append(value)
+
+        # Main LALR-parser loop
+        try:
+            for token in stream:
+                while True:
+                    action, arg = get_action(token)
+                    assert arg != end_state
+
+                    if action is Shift:
+                        state_stack.append(arg)
+                        value_stack.append(token)
+                        if set_state: set_state(arg)
+                        break # next token
+                    else:
+                        reduce(arg)
+        except Exception as e:
+            if self.debug:
+                print("")
+                print("STATE STACK DUMP")
+                print("----------------")
+                for i, s in enumerate(state_stack):
+                    print('%d)' % i , s)
+                print("")
+
+            raise
+
+        token = Token.new_borrow_pos('$END', '', token) if token else Token('$END', '', 0, 1, 1)
+        while True:
+            _action, arg = get_action(token)
+            assert(_action is Reduce)
+            reduce(arg)
+            if state_stack[-1] == end_state:
+                return value_stack[-1]
+
+
+
+class Action:
+    def __init__(self, name):
+        self.name = name
+    def __str__(self):
+        return self.name
+    def __repr__(self):
+        return str(self)
+
+Shift = Action('Shift')
+Reduce = Action('Reduce')
+
+
+class ParseTable:
+    def __init__(self, states, start_states, end_states):
+        self.states = states
+        self.start_states = start_states
+        self.end_states = end_states
+
+    def serialize(self, memo):
+        tokens = Enumerator()
+        rules = Enumerator()
+
+        states = {
+            state: {tokens.get(token): ((1, arg.serialize(memo)) if action is Reduce else (0, arg))
+                    for token, (action, arg) in actions.items()}
+            for state, actions in self.states.items()
+        }
+
+        return {
+            'tokens': tokens.reversed(),
+            'states': states,
+            'start_states': self.start_states,
+            'end_states': self.end_states,
+        }
+
+    @classmethod
+    def deserialize(cls, data, memo):
+        tokens = data['tokens']
+        states = {
+            state: {tokens[token]: ((Reduce, Rule.deserialize(arg, memo)) if action==1 else (Shift, arg))
+                    for token, (action, arg) in actions.items()}
+            for state, actions in data['states'].items()
+        }
+        return cls(states, data['start_states'], data['end_states'])
+
+
+class IntParseTable(ParseTable):
+
+    @classmethod
+    def from_ParseTable(cls, parse_table):
+        enum = list(parse_table.states)
+        state_to_idx = {s:i for i,s in enumerate(enum)}
+        int_states = {}
+
+        for s, la in parse_table.states.items():
+            la = {k:(v[0], state_to_idx[v[1]]) if v[0] is Shift else v
+                  for k,v in la.items()}
+            int_states[ state_to_idx[s] ] = la
+
+
+        start_states = {start:state_to_idx[s] for start, s in parse_table.start_states.items()}
+        end_states = {start:state_to_idx[s] for start, s in parse_table.end_states.items()}
+        return cls(int_states, start_states, end_states)
+
+
+
+def get_frontend(parser, lexer):
+    if parser=='lalr':
+        if lexer is None:
+            raise ValueError('The LALR parser requires use of a lexer')
+        elif lexer == 'standard':
+            return LALR_TraditionalLexer
+        elif lexer == 'contextual':
+            return LALR_ContextualLexer
+        elif issubclass(lexer, Lexer):
+            return partial(LALR_CustomLexer, lexer)
+        else:
+            raise ValueError('Unknown lexer: %s' % lexer)
+    elif parser=='earley':
+        if lexer=='standard':
+            return Earley
+        elif lexer=='dynamic':
+            return XEarley
+        elif lexer=='dynamic_complete':
+            return XEarley_CompleteLex
+        elif lexer=='contextual':
+            raise ValueError('The Earley parser does not support the contextual parser')
+        else:
+            raise ValueError('Unknown lexer: %s' % lexer)
+    elif parser == 'cyk':
+        if lexer == 'standard':
+            return CYK
+        else:
+            raise ValueError('CYK parser requires using standard parser.')
+    else:
+        raise ValueError('Unknown parser: %s' % parser)
+
+
+class _ParserFrontend(Serialize):
+    def _parse(self, input, start, *args):
+        if start is None:
+            start = self.start
+            if len(start) > 1:
+                raise ValueError("Lark initialized with more than 1 possible start rule. Must specify which start rule to parse", start)
+            start ,= start
+        return self.parser.parse(input, start, *args)
+
+
+class WithLexer(_ParserFrontend):
+    lexer = None
+    parser = None
+    lexer_conf = None
+    start = None
+
+    __serialize_fields__ = 'parser', 'lexer_conf', 'start'
+    __serialize_namespace__ = LexerConf,
+
+    def __init__(self, lexer_conf, parser_conf, options=None):
+        self.lexer_conf = lexer_conf
+        self.start = parser_conf.start
+        self.postlex = lexer_conf.postlex
+
+    @classmethod
+    def deserialize(cls, data, memo, callbacks, postlex):
+        inst = super(WithLexer, cls).deserialize(data, memo)
+        inst.postlex = postlex
+        inst.parser = LALR_Parser.deserialize(inst.parser, memo, callbacks)
+        inst.init_lexer()
+        return inst
+
+    def _serialize(self, data, memo):
+        data['parser'] = data['parser'].serialize(memo)
+
+    def lex(self, *args):
+        stream = self.lexer.lex(*args)
+        return self.postlex.process(stream) if self.postlex else stream
+
+    def parse(self, text, start=None):
+        token_stream = self.lex(text)
+        return self._parse(token_stream, start)
+
+    def init_traditional_lexer(self):
+        self.lexer = TraditionalLexer(self.lexer_conf.tokens, ignore=self.lexer_conf.ignore, user_callbacks=self.lexer_conf.callbacks, g_regex_flags=self.lexer_conf.g_regex_flags)
+
+class LALR_WithLexer(WithLexer):
+    def __init__(self, lexer_conf, parser_conf, options=None):
+        debug = options.debug if options else False
+        self.parser = LALR_Parser(parser_conf, debug=debug)
+        WithLexer.__init__(self, lexer_conf, parser_conf, options)
+
+        self.init_lexer()
+
+    def init_lexer(self):
+        raise NotImplementedError()
+
+class LALR_TraditionalLexer(LALR_WithLexer):
+    def init_lexer(self):
+        self.init_traditional_lexer()
+
+class LALR_ContextualLexer(LALR_WithLexer):
+    def init_lexer(self):
+        states = {idx:list(t.keys()) for idx, t in self.parser._parse_table.states.items()}
+        always_accept = self.postlex.always_accept if self.postlex else ()
+        self.lexer = ContextualLexer(self.lexer_conf.tokens, states,
+                                     ignore=self.lexer_conf.ignore,
+                                     always_accept=always_accept,
+                                     user_callbacks=self.lexer_conf.callbacks,
+                                     g_regex_flags=self.lexer_conf.g_regex_flags)
+
+
+    def parse(self, text, start=None):
+        parser_state = [None]
+        def set_parser_state(s):
+            parser_state[0] = s
+
+        token_stream = self.lex(text, lambda: parser_state[0])
+        return self._parse(token_stream, start, set_parser_state)
+
+
+class LarkOptions(Serialize):
+    """Specifies the options for Lark
+
+    """
+    OPTIONS_DOC = """
+# General
+
+    start - The start symbol. Either a string, or a list of strings for
+            multiple possible starts (Default: "start")
+    debug - Display debug information, such as warnings (default: False)
+    transformer - Applies the transformer to every parse tree (equivlent to
+                  applying it after the parse, but faster)
+    propagate_positions - Propagates (line, column, end_line, end_column)
+                          attributes into all tree branches.
+    maybe_placeholders - When True, the `[]` operator returns `None` when not matched.
+                         When `False`,  `[]` behaves like the `?` operator,
+                             and returns no value at all.
+                         (default=`False`. Recommended to set to `True`)
+    cache - Cache the results of the Lark grammar analysis, for x2 to x3 faster loading.
+            LALR only for now.
+        When `False`, does nothing (default)
+        When `True`, caches to a temporary file in the local directory
+        When given a string, caches to the path pointed by the string
+
+    g_regex_flags - Flags that are applied to all terminals
+                    (both regex and strings)
+    keep_all_tokens - Prevent the tree builder from automagically
+                      removing "punctuation" tokens (default: False)
+
+# Algorithm
+
+    parser - Decides which parser engine to use
+             Accepts "earley" or "lalr". (Default: "earley")
+             (there is also a "cyk" option for legacy)
+
+    lexer - Decides whether or not to use a lexer stage
+        "auto" (default): Choose for me based on the parser
+        "standard": Use a standard lexer
+        "contextual": Stronger lexer (only works with parser="lalr")
+        "dynamic": Flexible and powerful (only with parser="earley")
+        "dynamic_complete": Same as dynamic, but tries *every* variation
+                            of tokenizing possible.
+
+    ambiguity - Decides how to handle ambiguity in the parse.
+                Only relevant if parser="earley"
+        "resolve": The parser will automatically choose the simplest
+                    derivation (it chooses consistently: greedy for
+                    tokens, non-greedy for rules)
+        "explicit": The parser will return all derivations wrapped
+                    in "_ambig" tree nodes (i.e. a forest).
+
+# Domain Specific
+
+    postlex - Lexer post-processing (Default: None) Only works with the
+                standard and contextual lexers.
+    priority - How priorities should be evaluated - auto, none, normal,
+                invert (Default: auto)
+    lexer_callbacks - Dictionary of callbacks for the lexer. May alter
+                        tokens during lexing. Use with caution.
+    edit_terminals - A callback
+    """
+    if __doc__:
+        __doc__ += OPTIONS_DOC
+
+    _defaults = {
+        'debug': False,
+        'keep_all_tokens': False,
+        'tree_class': None,
+        'cache': False,
+        'postlex': None,
+        'parser': 'earley',
+        'lexer': 'auto',
+        'transformer': None,
+        'start': 'start',
+        'priority': 'auto',
+        'ambiguity': 'auto',
+        'propagate_positions': False,
+        'lexer_callbacks': {},
+        'maybe_placeholders': False,
+        'edit_terminals': None,
+        'g_regex_flags': 0,
+    }
+
+    def __init__(self, options_dict):
+        o = dict(options_dict)
+
+        options = {}
+        for name, default in self._defaults.items():
+            if name in o:
+                value = o.pop(name)
+                if isinstance(default, bool) and name != 'cache':
+                    value = bool(value)
+            else:
+                value = default
+
+            options[name] = value
+
+        if isinstance(options['start'], STRING_TYPE):
+            options['start'] = [options['start']]
+
+        self.__dict__['options'] = options
+
+        assert self.parser in ('earley', 'lalr', 'cyk', None)
+
+        if self.parser == 'earley' and self.transformer:
+            raise ValueError('Cannot specify an embedded transformer when using the Earley algorithm.'
+                             'Please use your transformer on the resulting parse tree, or use a different algorithm (i.e. LALR)')
+
+        if o:
+            raise ValueError("Unknown options: %s" % o.keys())
+
+    def __getattr__(self, name):
+        try:
+            return self.options[name]
+        except KeyError as e:
+            raise AttributeError(e)
+
+    def __setattr__(self, name, value):
+        assert name in self.options
+        self.options[name] = value
+
+    def serialize(self, memo):
+        return self.options
+
+    @classmethod
+    def deserialize(cls, data, memo):
+        return cls(data)
+
+
+class Lark(Serialize):
+    def __init__(self, grammar, **options):
+        """
+            grammar : a string or file-object containing the grammar spec (using Lark's ebnf syntax)
+            options : a dictionary controlling various aspects of Lark.
+        """
+
+        self.options = LarkOptions(options)
+
+        # Some, but not all file-like objects have a 'name' attribute
+        try:
+            self.source = grammar.name
+        except AttributeError:
+            self.source = '<string>'
+
+        # Drain file-like objects to get their contents
+        try:
+            read = grammar.read
+        except AttributeError:
+            pass
+        else:
+            grammar = read()
+
+        assert isinstance(grammar, STRING_TYPE)
+
+        cache_fn = None
+        if self.options.cache:
+            if self.options.parser != 'lalr':
+                raise NotImplementedError("cache only works with parser='lalr' for now")
+            if isinstance(self.options.cache, STRING_TYPE):
+                cache_fn = self.options.cache
+            else:
+                if self.options.cache is not True:
+                    raise ValueError("cache must be bool or str")
+                unhashable = ('transformer', 'postlex', 'lexer_callbacks', 'edit_terminals')
+                from . import __version__
+                options_str = ''.join(k+str(v) for k, v in options.items() if k not in unhashable)
+                s = grammar + options_str + __version__
+                md5 = hashlib.md5(s.encode()).hexdigest()
+                cache_fn = '.lark_cache_%s.tmp' % md5
+
+            if FS.exists(cache_fn):
+                logging.debug('Loading grammar from cache: %s', cache_fn)
+                with FS.open(cache_fn, 'rb') as f:
+                    self._load(f, self.options.transformer, self.options.postlex)
+                return
+
+        if self.options.lexer == 'auto':
+            if self.options.parser == 'lalr':
+                self.options.lexer = 'contextual'
+            elif self.options.parser == 'earley':
+                self.options.lexer = 'dynamic'
+            elif self.options.parser == 'cyk':
+                self.options.lexer = 'standard'
+            else:
+                assert False, self.options.parser
+        lexer = self.options.lexer
+        assert lexer in ('standard', 'contextual', 'dynamic', 'dynamic_complete') or issubclass(lexer, Lexer)
+
+        if self.options.ambiguity == 'auto':
+            if self.options.parser == 'earley':
+                self.options.ambiguity = 'resolve'
+        else:
+            disambig_parsers = ['earley', 'cyk']
+            assert self.options.parser in disambig_parsers, (
+                'Only %s supports disambiguation right now') % ', '.join(disambig_parsers)
+
+        if self.options.priority == 'auto':
+            if self.options.parser in ('earley', 'cyk', ):
+                self.options.priority = 'normal'
+            elif self.options.parser in ('lalr', ):
+                self.options.priority = None
+        elif self.options.priority in ('invert', 'normal'):
+            assert self.options.parser in ('earley', 'cyk'), "priorities are not supported for LALR at this time"
+
+        assert self.options.priority in ('auto', None, 'normal', 'invert'), 'invalid priority option specified: {}. options are auto, none, normal, invert.'.format(self.options.priority)
+        assert self.options.ambiguity not in ('resolve__antiscore_sum', ), 'resolve__antiscore_sum has been replaced with the option priority="invert"'
+        assert self.options.ambiguity in ('resolve', 'explicit', 'auto', )
+
+        # Parse the grammar file and compose the grammars (TODO)
+        self.grammar = load_grammar(grammar, self.source)
+
+        # Compile the EBNF grammar into BNF
+        self.terminals, self.rules, self.ignore_tokens = self.grammar.compile(self.options.start)
+
+        if self.options.edit_terminals:
+            for t in self.terminals:
+                self.options.edit_terminals(t)
+
+        self._terminals_dict = {t.name:t for t in self.terminals}
+
+        # If the user asked to invert the priorities, negate them all here.
+        # This replaces the old 'resolve__antiscore_sum' option.
+        if self.options.priority == 'invert':
+            for rule in self.rules:
+                if rule.options.priority is not None:
+                    rule.options.priority = -rule.options.priority
+        # Else, if the user asked to disable priorities, strip them from the
+        # rules. This allows the Earley parsers to skip an extra forest walk
+        # for improved performance, if you don't need them (or didn't specify any).
+        elif self.options.priority == None:
+            for rule in self.rules:
+                if rule.options.priority is not None:
+                    rule.options.priority = None
+
+        # TODO Deprecate lexer_callbacks?
+        lexer_callbacks = dict(self.options.lexer_callbacks)
+        if self.options.transformer:
+            t = self.options.transformer
+            for term in self.terminals:
+                if hasattr(t, term.name):
+                    lexer_callbacks[term.name] = getattr(t, term.name)
+
+        self.lexer_conf = LexerConf(self.terminals, self.ignore_tokens, self.options.postlex, lexer_callbacks, self.options.g_regex_flags)
+
+        if self.options.parser:
+            self.parser = self._build_parser()
+        elif lexer:
+            self.lexer = self._build_lexer()
+
+        if cache_fn:
+            logging.debug('Saving grammar to cache: %s', cache_fn)
+            with FS.open(cache_fn, 'wb') as f:
+                self.save(f)
+
+    if __init__.__doc__:
+        __init__.__doc__ += "\nOptions:\n" + LarkOptions.OPTIONS_DOC
+
+    __serialize_fields__ = 'parser', 'rules', 'options'
+
+    def _build_lexer(self):
+        return TraditionalLexer(self.lexer_conf.tokens, ignore=self.lexer_conf.ignore, user_callbacks=self.lexer_conf.callbacks, g_regex_flags=self.lexer_conf.g_regex_flags)
+
+    def _prepare_callbacks(self):
+        self.parser_class = get_frontend(self.options.parser, self.options.lexer)
+        self._parse_tree_builder = ParseTreeBuilder(self.rules, self.options.tree_class or Tree, self.options.propagate_positions, self.options.keep_all_tokens, self.options.parser!='lalr' and self.options.ambiguity=='explicit', self.options.maybe_placeholders)
+        self._callbacks = self._parse_tree_builder.create_callback(self.options.transformer)
+
+    def _build_parser(self):
+        self._prepare_callbacks()
+        parser_conf = ParserConf(self.rules, self._callbacks, self.options.start)
+        return self.parser_class(self.lexer_conf, parser_conf, options=self.options)
+
+    def save(self, f):
+        data, m = self.memo_serialize([TerminalDef, Rule])
+        pickle.dump({'data': data, 'memo': m}, f)
+
+    @classmethod
+    def load(cls, f):
+        inst = cls.__new__(cls)
+        return inst._load(f)
+
+    def _load(self, f, transformer=None, postlex=None):
+        if isinstance(f, dict):
+            d = f
+        else:
+            d = pickle.load(f)
+        memo = d['memo']
+        data = d['data']
+
+        assert memo
+        memo = SerializeMemoizer.deserialize(memo, {'Rule': Rule, 'TerminalDef': TerminalDef}, {})
+        options = dict(data['options'])
+        if transformer is not None:
+            options['transformer'] = transformer
+        if postlex is not None:
+            options['postlex'] = postlex
+        self.options = LarkOptions.deserialize(options, memo)
+        self.rules = [Rule.deserialize(r, memo) for r in data['rules']]
+        self.source = '<deserialized>'
+        self._prepare_callbacks()
+        self.parser = self.parser_class.deserialize(data['parser'], memo, self._callbacks, self.options.postlex)
+        return self
+
+    @classmethod
+    def _load_from_dict(cls, data, memo, transformer=None, postlex=None):
+        inst = cls.__new__(cls)
+        return inst._load({'data': data, 'memo': memo}, transformer, postlex)
+
+    @classmethod
+    def open(cls, grammar_filename, rel_to=None, **options):
+        """Create an instance of Lark with the grammar given by its filename
+
+        If rel_to is provided, the function will find the grammar filename in relation to it.
+
+        Example:
+
+            >>> Lark.open("grammar_file.lark", rel_to=__file__, parser="lalr")
+            Lark(...)
+
+        """
+        if rel_to:
+            basepath = os.path.dirname(rel_to)
+            grammar_filename = os.path.join(basepath, grammar_filename)
+        with open(grammar_filename, encoding='utf8') as f:
+            return cls(f, **options)
+
+    def __repr__(self):
+        return 'Lark(open(%r), parser=%r, lexer=%r, ...)' % (self.source, self.options.parser, self.options.lexer)
+
+
+    def lex(self, text):
+        "Only lex (and postlex) the text, without parsing it. Only relevant when lexer='standard'"
+        if not hasattr(self, 'lexer'):
+            self.lexer = self._build_lexer()
+        stream = self.lexer.lex(text)
+        if self.options.postlex:
+            return self.options.postlex.process(stream)
+        return stream
+
+    def get_terminal(self, name):
+        "Get information about a terminal"
+        return self._terminals_dict[name]
+
+    def parse(self, text, start=None):
+        """Parse the given text, according to the options provided.
+
+        The 'start' parameter is required if Lark was given multiple possible start symbols (using the start option).
+
+        Returns a tree, unless specified otherwise.
+        """
+        return self.parser.parse(text, start=start)
+
+
+DATA = (
+{'parser': {'parser': {'tokens': {0: 'PLUS', 1: 'RPAR', 2: 'OR', 3: 'AND', 4: 'COMMA', 5: 'MINUS', 6: 'RSQB', 7: '$END', 8: 'atom', 9: 'comparison_lhs', 10: 'lookup', 11: '__ANON_2', 12: '__ANON_1', 13: 'LPAR', 14: 'IDENT', 15: '__ANON_5', 16: 'string', 17: 'SIGNED_NUMBER', 18: 'array', 19: 'BOOL', 20: 'comparison_op', 21: 'LSQB', 22: '__ANON_4', 23: 'group', 24: '__ANON_3', 25: 'string_manip', 26: 'NULL', 27: 'regex', 28: 'ALL', 29: '__ANON_0', 30: 'comparison', 31: 'ANY', 32: 'QUOTE', 33: 'RE', 34: 'IRE', 35: '_IS_NOT_IN', 36: '_GTE', 37: '_LTE', 38: '_IS_IN', 39: '_IS_NOT', 40: 'GT', 41: 'IS', 42: 'LT', 43: 'STAR', 44: 'SLASH', 45: 'expression', 46: 'NOT', 47: 'product', 48: 'pattern', 49: '__array_star_0', 50: 'STRING', 51: '__string_manip_plus_1', 52: 'start'}, 'states': {0: {0: (1, {'@': 37}), 1: (1, {'@': 37}), 2: (1, {'@': 37}), 3: (1, {'@': 37}), 4: (1, {'@': 37}), 5: (1, {'@': 37}), 6: (1, {'@': 37}), 7: (1, {'@': 37})}, 1: {0: (1, {'@': 38}), 1: (1, {'@': 38}), 2: (1, {'@': 38}), 7: (1, {'@': 38}), 5: (1, {'@': 38}), 4: (1, {'@': 38}), 3: (1, {'@': 38}), 6: (1, {'@': 38})}, 2: {1: (0, 43)}, 3: {8: (0, 37), 9: (0, 41), 10: (0, 103), 11: (0, 85), 12: (0, 48), 13: (0, 32), 14: (0, 75), 15: (0, 94), 16: (0, 62), 17: (0, 87), 18: (0, 76), 19: (0, 106), 20: (0, 52), 21: (0, 80), 22: (0, 102), 23: (0, 69), 24: (0, 23), 25: (0, 64), 26: (0, 49), 27: (0, 51), 28: (0, 60), 29: (0, 15), 30: (0, 98), 31: (0, 61), 32: (0, 36), 33: (0, 21), 34: (0, 22)}, 4: {24: (0, 23), 10: (0, 103), 11: (0, 85), 25: (0, 64), 26: (0, 49), 27: (0, 51), 29: (0, 15), 12: (0, 48), 13: (0, 32), 8: (0, 46), 15: (0, 94), 14: (0, 75), 16: (0, 62), 17: (0, 87), 18: (0, 76), 19: (0, 106), 22: (0, 102), 21: (0, 80), 32: (0, 36), 33: (0, 21), 34: (0, 22)}, 5: {5: (0, 13), 0: (0, 70), 3: (0, 79), 2: (0, 45), 1: (1, {'@': 39}), 4: (1, {'@': 39})}, 6: {35: (1, {'@': 40}), 2: (1, {'@': 40}), 36: (1, {'@': 40}), 37: (1, {'@': 40}), 38: (1, {'@': 40}), 6: (1, {'@': 40}), 0: (1, {'@': 40}), 1: (1, {'@': 40}), 39: (1, {'@': 40}), 7: (1, {'@': 40}), 5: (1, {'@': 40}), 40: (1, {'@': 40}), 41: (1, {'@': 40}), 4: (1, {'@': 40}), 3: (1, {'@': 40}), 42: (1, {'@': 40}), 43: (1, {'@': 40}), 44: (1, {'@': 40})}, 7: {35: (1, {'@': 41}), 42: (1, {'@': 41}), 39: (1, {'@': 41}), 36: (1, {'@': 41}), 37: (1, {'@': 41}), 41: (1, {'@': 41}), 38: (1, {'@': 41}), 40: (1, {'@': 41}), 0: (1, {'@': 42}), 1: (1, {'@': 42}), 2: (1, {'@': 42}), 43: (1, {'@': 42}), 5: (1, {'@': 42}), 4: (1, {'@': 42}), 44: (1, {'@': 42}), 3: (1, {'@': 42}), 6: (1, {'@': 42}), 7: (1, {'@': 42})}, 8: {43: (0, 12), 44: (0, 107), 0: (1, {'@': 43}), 1: (1, {'@': 43}), 2: (1, {'@': 43}), 3: (1, {'@': 43}), 4: (1, {'@': 43}), 5: (1, {'@': 43}), 6: (1, {'@': 43}), 7: (1, {'@': 43})}, 9: {5: (0, 13), 0: (0, 70), 3: (0, 79), 2: (0, 45), 4: (1, {'@': 44}), 6: (1, {'@': 44}), 1: (1, {'@': 44})}, 10: {8: (0, 7), 9: (0, 41), 10: (0, 103), 45: (0, 9), 11: (0, 85), 46: (0, 3), 12: (0, 48), 13: (0, 32), 14: (0, 75), 15: (0, 94), 16: (0, 62), 18: (0, 76), 19: (0, 106), 17: (0, 87), 21: (0, 80), 22: (0, 102), 23: (0, 69), 24: (0, 23), 47: (0, 19), 25: (0, 64), 26: (0, 49), 27: (0, 51), 28: (0, 60), 29: (0, 15), 31: (0, 61), 20: (0, 50), 32: (0, 36), 33: (0, 21), 34: (0, 22)}, 11: {}, 12: {24: (0, 23), 10: (0, 103), 11: (0, 85), 25: (0, 64), 26: (0, 49), 27: (0, 51), 8: (0, 97), 29: (0, 15), 12: (0, 48), 13: (0, 32), 15: (0, 94), 14: (0, 75), 16: (0, 62), 17: (0, 87), 18: (0, 76), 19: (0, 106), 22: (0, 102), 21: (0, 80), 32: (0, 36), 33: (0, 21), 34: (0, 22)}, 13: {24: (0, 23), 10: (0, 103), 11: (0, 85), 25: (0, 64), 26: (0, 49), 27: (0, 51), 29: (0, 15), 12: (0, 48), 47: (0, 29), 13: (0, 32), 15: (0, 94), 14: (0, 75), 16: (0, 62), 17: (0, 87), 18: (0, 76), 19: (0, 106), 22: (0, 102), 21: (0, 80), 32: (0, 36), 8: (0, 26), 33: (0, 21), 34: (0, 22)}, 14: {35: (1, {'@': 45}), 2: (1, {'@': 45}), 36: (1, {'@': 45}), 37: (1, {'@': 45}), 38: (1, {'@': 45}), 6: (1, {'@': 45}), 0: (1, {'@': 45}), 1: (1, {'@': 45}), 39: (1, {'@': 45}), 7: (1, {'@': 45}), 5: (1, {'@': 45}), 40: (1, {'@': 45}), 41: (1, {'@': 45}), 4: (1, {'@': 45}), 3: (1, {'@': 45}), 42: (1, {'@': 45}), 43: (1, {'@': 45}), 44: (1, {'@': 45})}, 15: {32: (0, 36), 16: (0, 54), 15: (0, 94)}, 16: {32: (0, 36), 16: (0, 25), 33: (0, 21), 27: (0, 39), 34: (0, 22), 48: (0, 73), 15: (0, 94)}, 17: {0: (1, {'@': 46}), 1: (1, {'@': 46}), 2: (1, {'@': 46}), 7: (1, {'@': 46}), 5: (1, {'@': 46}), 4: (1, {'@': 46}), 3: (1, {'@': 46}), 6: (1, {'@': 46})}, 18: {35: (1, {'@': 47}), 2: (1, {'@': 47}), 36: (1, {'@': 47}), 37: (1, {'@': 47}), 38: (1, {'@': 47}), 6: (1, {'@': 47}), 0: (1, {'@': 47}), 1: (1, {'@': 47}), 39: (1, {'@': 47}), 7: (1, {'@': 47}), 5: (1, {'@': 47}), 40: (1, {'@': 47}), 41: (1, {'@': 47}), 4: (1, {'@': 47}), 3: (1, {'@': 47}), 42: (1, {'@': 47}), 43: (1, {'@': 47}), 44: (1, {'@': 47})}, 19: {43: (0, 12), 44: (0, 107), 0: (1, {'@': 48}), 1: (1, {'@': 48}), 2: (1, {'@': 48}), 3: (1, {'@': 48}), 4: (1, {'@': 48}), 5: (1, {'@': 48}), 6: (1, {'@': 48}), 7: (1, {'@': 48})}, 20: {35: (1, {'@': 49}), 2: (1, {'@': 49}), 36: (1, {'@': 49}), 37: (1, {'@': 49}), 38: (1, {'@': 49}), 6: (1, {'@': 49}), 0: (1, {'@': 49}), 1: (1, {'@': 49}), 39: (1, {'@': 49}), 7: (1, {'@': 49}), 5: (1, {'@': 49}), 40: (1, {'@': 49}), 41: (1, {'@': 49}), 4: (1, {'@': 49}), 3: (1, {'@': 49}), 42: (1, {'@': 49}), 43: (1, {'@': 49}), 44: (1, {'@': 49})}, 21: {32: (0, 36), 16: (0, 82), 15: (0, 94)}, 22: {16: (0, 40), 32: (0, 36), 15: (0, 94)}, 23: {8: (0, 7), 9: (0, 41), 10: (0, 103), 45: (0, 24), 11: (0, 85), 46: (0, 3), 12: (0, 48), 13: (0, 32), 14: (0, 75), 15: (0, 94), 16: (0, 62), 18: (0, 76), 19: (0, 106), 17: (0, 87), 21: (0, 80), 22: (0, 102), 23: (0, 69), 24: (0, 23), 47: (0, 19), 25: (0, 64), 26: (0, 49), 27: (0, 51), 28: (0, 60), 29: (0, 15), 31: (0, 61), 20: (0, 50), 32: (0, 36), 33: (0, 21), 34: (0, 22)}, 24: {4: (0, 47), 5: (0, 13), 0: (0, 70), 3: (0, 79), 2: (0, 45)}, 25: {4: (1, {'@': 50}), 1: (1, {'@': 50})}, 26: {0: (1, {'@': 42}), 1: (1, {'@': 42}), 2: (1, {'@': 42}), 7: (1, {'@': 42}), 43: (1, {'@': 42}), 5: (1, {'@': 42}), 4: (1, {'@': 42}), 44: (1, {'@': 42}), 3: (1, {'@': 42}), 6: (1, {'@': 42})}, 27: {8: (0, 7), 9: (0, 41), 10: (0, 103), 45: (0, 35), 11: (0, 85), 46: (0, 3), 12: (0, 48), 13: (0, 32), 14: (0, 75), 15: (0, 94), 16: (0, 62), 18: (0, 76), 19: (0, 106), 17: (0, 87), 21: (0, 80), 22: (0, 102), 23: (0, 69), 24: (0, 23), 47: (0, 19), 25: (0, 64), 26: (0, 49), 27: (0, 51), 28: (0, 60), 29: (0, 15), 31: (0, 61), 20: (0, 50), 32: (0, 36), 33: (0, 21), 34: (0, 22)}, 28: {0: (1, {'@': 51}), 1: (1, {'@': 51}), 2: (1, {'@': 51}), 7: (1, {'@': 51}), 5: (1, {'@': 51}), 4: (1, {'@': 51}), 3: (1, {'@': 51}), 6: (1, {'@': 51})}, 29: {43: (0, 12), 44: (0, 107), 0: (1, {'@': 52}), 1: (1, {'@': 52}), 2: (1, {'@': 52}), 3: (1, {'@': 52}), 4: (1, {'@': 52}), 5: (1, {'@': 52}), 6: (1, {'@': 52}), 7: (1, {'@': 52})}, 30: {4: (0, 93), 5: (0, 13), 0: (0, 70), 3: (0, 79), 2: (0, 45)}, 31: {1: (0, 6), 4: (0, 27)}, 32: {8: (0, 7), 9: (0, 41), 10: (0, 103), 45: (0, 57), 11: (0, 85), 46: (0, 3), 12: (0, 48), 13: (0, 32), 14: (0, 75), 15: (0, 94), 16: (0, 62), 18: (0, 76), 19: (0, 106), 17: (0, 87), 21: (0, 80), 22: (0, 102), 23: (0, 69), 24: (0, 23), 47: (0, 19), 25: (0, 64), 26: (0, 49), 27: (0, 51), 28: (0, 60), 29: (0, 15), 31: (0, 61), 20: (0, 50), 32: (0, 36), 33: (0, 21), 34: (0, 22)}, 33: {49: (0, 86), 5: (0, 13), 4: (0, 10), 6: (0, 105), 2: (0, 45), 0: (0, 70), 3: (0, 79)}, 34: {1: (0, 44), 4: (0, 16)}, 35: {5: (0, 13), 0: (0, 70), 3: (0, 79), 2: (0, 45), 4: (1, {'@': 53}), 6: (1, {'@': 53}), 1: (1, {'@': 53})}, 36: {50: (0, 96)}, 37: {35: (1, {'@': 41}), 42: (1, {'@': 41}), 39: (1, {'@': 41}), 36: (1, {'@': 41}), 37: (1, {'@': 41}), 41: (1, {'@': 41}), 38: (1, {'@': 41}), 40: (1, {'@': 41}), 0: (1, {'@': 54}), 1: (1, {'@': 54}), 2: (1, {'@': 54}), 7: (1, {'@': 54}), 5: (1, {'@': 54}), 4: (1, {'@': 54}), 3: (1, {'@': 54}), 6: (1, {'@': 54})}, 38: {0: (1, {'@': 55}), 1: (1, {'@': 55}), 35: (1, {'@': 55}), 2: (1, {'@': 55}), 42: (1, {'@': 55}), 39: (1, {'@': 55}), 7: (1, {'@': 55}), 5: (1, {'@': 55}), 36: (1, {'@': 55}), 37: (1, {'@': 55}), 41: (1, {'@': 55}), 6: (1, {'@': 55}), 4: (1, {'@': 55}), 38: (1, {'@': 55}), 3: (1, {'@': 55}), 40: (1, {'@': 55})}, 39: {4: (1, {'@': 56}), 1: (1, {'@': 56})}, 40: {35: (1, {'@': 57}), 2: (1, {'@': 57}), 36: (1, {'@': 57}), 37: (1, {'@': 57}), 38: (1, {'@': 57}), 6: (1, {'@': 57}), 0: (1, {'@': 57}), 1: (1, {'@': 57}), 39: (1, {'@': 57}), 7: (1, {'@': 57}), 5: (1, {'@': 57}), 40: (1, {'@': 57}), 41: (1, {'@': 57}), 4: (1, {'@': 57}), 3: (1, {'@': 57}), 42: (1, {'@': 57}), 43: (1, {'@': 57}), 44: (1, {'@': 57})}, 41: {41: (0, 4), 42: (0, 68), 40: (0, 65), 38: (0, 95), 35: (0, 100), 39: (0, 72), 37: (0, 81), 36: (0, 91)}, 42: {0: (1, {'@': 58}), 1: (1, {'@': 58}), 35: (1, {'@': 58}), 2: (1, {'@': 58}), 42: (1, {'@': 58}), 39: (1, {'@': 58}), 7: (1, {'@': 58}), 5: (1, {'@': 58}), 36: (1, {'@': 58}), 37: (1, {'@': 58}), 41: (1, {'@': 58}), 6: (1, {'@': 58}), 4: (1, {'@': 58}), 38: (1, {'@': 58}), 3: (1, {'@': 58}), 40: (1, {'@': 58})}, 43: {35: (1, {'@': 59}), 2: (1, {'@': 59}), 36: (1, {'@': 59}), 37: (1, {'@': 59}), 38: (1, {'@': 59}), 6: (1, {'@': 59}), 0: (1, {'@': 59}), 1: (1, {'@': 59}), 39: (1, {'@': 59}), 7: (1, {'@': 59}), 5: (1, {'@': 59}), 40: (1, {'@': 59}), 41: (1, {'@': 59}), 4: (1, {'@': 59}), 3: (1, {'@': 59}), 42: (1, {'@': 59}), 43: (1, {'@': 59}), 44: (1, {'@': 59})}, 44: {35: (1, {'@': 60}), 2: (1, {'@': 60}), 36: (1, {'@': 60}), 37: (1, {'@': 60}), 38: (1, {'@': 60}), 6: (1, {'@': 60}), 0: (1, {'@': 60}), 1: (1, {'@': 60}), 39: (1, {'@': 60}), 7: (1, {'@': 60}), 5: (1, {'@': 60}), 40: (1, {'@': 60}), 41: (1, {'@': 60}), 4: (1, {'@': 60}), 3: (1, {'@': 60}), 42: (1, {'@': 60}), 43: (1, {'@': 60}), 44: (1, {'@': 60})}, 45: {8: (0, 37), 9: (0, 41), 10: (0, 103), 11: (0, 85), 12: (0, 48), 13: (0, 32), 14: (0, 75), 15: (0, 94), 16: (0, 62), 17: (0, 87), 18: (0, 76), 19: (0, 106), 20: (0, 52), 21: (0, 80), 22: (0, 102), 23: (0, 69), 24: (0, 23), 25: (0, 64), 26: (0, 49), 27: (0, 51), 28: (0, 60), 29: (0, 15), 31: (0, 61), 30: (0, 83), 32: (0, 36), 33: (0, 21), 34: (0, 22)}, 46: {0: (1, {'@': 61}), 1: (1, {'@': 61}), 2: (1, {'@': 61}), 7: (1, {'@': 61}), 5: (1, {'@': 61}), 4: (1, {'@': 61}), 3: (1, {'@': 61}), 6: (1, {'@': 61})}, 47: {32: (0, 36), 16: (0, 25), 48: (0, 2), 33: (0, 21), 27: (0, 39), 34: (0, 22), 15: (0, 94)}, 48: {32: (0, 36), 16: (0, 89), 15: (0, 94)}, 49: {0: (1, {'@': 62}), 1: (1, {'@': 62}), 35: (1, {'@': 62}), 2: (1, {'@': 62}), 42: (1, {'@': 62}), 39: (1, {'@': 62}), 7: (1, {'@': 62}), 5: (1, {'@': 62}), 36: (1, {'@': 62}), 37: (1, {'@': 62}), 41: (1, {'@': 62}), 6: (1, {'@': 62}), 4: (1, {'@': 62}), 38: (1, {'@': 62}), 3: (1, {'@': 62}), 40: (1, {'@': 62}), 43: (1, {'@': 62}), 44: (1, {'@': 62})}, 50: {0: (1, {'@': 63}), 1: (1, {'@': 63}), 2: (1, {'@': 63}), 3: (1, {'@': 63}), 4: (1, {'@': 63}), 5: (1, {'@': 63}), 6: (1, {'@': 63}), 7: (1, {'@': 63})}, 51: {0: (1, {'@': 64}), 1: (1, {'@': 64}), 35: (1, {'@': 64}), 2: (1, {'@': 64}), 42: (1, {'@': 64}), 39: (1, {'@': 64}), 7: (1, {'@': 64}), 5: (1, {'@': 64}), 36: (1, {'@': 64}), 37: (1, {'@': 64}), 41: (1, {'@': 64}), 6: (1, {'@': 64}), 4: (1, {'@': 64}), 38: (1, {'@': 64}), 3: (1, {'@': 64}), 40: (1, {'@': 64}), 43: (1, {'@': 64}), 44: (1, {'@': 64})}, 52: {0: (1, {'@': 65}), 1: (1, {'@': 65}), 2: (1, {'@': 65}), 7: (1, {'@': 65}), 5: (1, {'@': 65}), 4: (1, {'@': 65}), 3: (1, {'@': 65}), 6: (1, {'@': 65})}, 53: {35: (1, {'@': 66}), 2: (1, {'@': 66}), 36: (1, {'@': 66}), 37: (1, {'@': 66}), 38: (1, {'@': 66}), 6: (1, {'@': 66}), 0: (1, {'@': 66}), 1: (1, {'@': 66}), 39: (1, {'@': 66}), 7: (1, {'@': 66}), 5: (1, {'@': 66}), 40: (1, {'@': 66}), 41: (1, {'@': 66}), 4: (1, {'@': 66}), 3: (1, {'@': 66}), 42: (1, {'@': 66}), 43: (1, {'@': 66}), 44: (1, {'@': 66})}, 54: {1: (0, 20)}, 55: {35: (1, {'@': 67}), 2: (1, {'@': 67}), 36: (1, {'@': 67}), 37: (1, {'@': 67}), 38: (1, {'@': 67}), 6: (1, {'@': 67}), 0: (1, {'@': 67}), 1: (1, {'@': 67}), 39: (1, {'@': 67}), 7: (1, {'@': 67}), 5: (1, {'@': 67}), 40: (1, {'@': 67}), 41: (1, {'@': 67}), 4: (1, {'@': 67}), 3: (1, {'@': 67}), 42: (1, {'@': 67}), 43: (1, {'@': 67}), 44: (1, {'@': 67})}, 56: {8: (0, 7), 9: (0, 41), 10: (0, 103), 45: (0, 5), 11: (0, 85), 46: (0, 3), 12: (0, 48), 13: (0, 32), 14: (0, 75), 15: (0, 94), 16: (0, 62), 18: (0, 76), 19: (0, 106), 17: (0, 87), 21: (0, 80), 22: (0, 102), 23: (0, 69), 24: (0, 23), 47: (0, 19), 25: (0, 64), 26: (0, 49), 27: (0, 51), 28: (0, 60), 29: (0, 15), 31: (0, 61), 20: (0, 50), 32: (0, 36), 33: (0, 21), 34: (0, 22)}, 57: {5: (0, 13), 0: (0, 70), 1: (0, 77), 3: (0, 79), 2: (0, 45)}, 58: {1: (0, 18)}, 59: {8: (0, 7), 9: (0, 41), 10: (0, 103), 45: (0, 88), 11: (0, 85), 46: (0, 3), 12: (0, 48), 13: (0, 32), 14: (0, 75), 15: (0, 94), 16: (0, 62), 18: (0, 76), 19: (0, 106), 17: (0, 87), 21: (0, 80), 22: (0, 102), 23: (0, 69), 24: (0, 23), 47: (0, 19), 25: (0, 64), 26: (0, 49), 27: (0, 51), 28: (0, 60), 29: (0, 15), 31: (0, 61), 20: (0, 50), 32: (0, 36), 33: (0, 21), 34: (0, 22)}, 60: {21: (0, 80), 18: (0, 38)}, 61: {21: (0, 80), 18: (0, 42)}, 62: {0: (1, {'@': 68}), 1: (1, {'@': 68}), 35: (1, {'@': 68}), 2: (1, {'@': 68}), 42: (1, {'@': 68}), 39: (1, {'@': 68}), 7: (1, {'@': 68}), 5: (1, {'@': 68}), 36: (1, {'@': 68}), 37: (1, {'@': 68}), 41: (1, {'@': 68}), 6: (1, {'@': 68}), 4: (1, {'@': 68}), 38: (1, {'@': 68}), 3: (1, {'@': 68}), 40: (1, {'@': 68}), 43: (1, {'@': 68}), 44: (1, {'@': 68})}, 63: {5: (0, 13), 2: (0, 45), 4: (0, 84), 51: (0, 34), 1: (0, 53), 0: (0, 70), 3: (0, 79)}, 64: {0: (1, {'@': 69}), 1: (1, {'@': 69}), 35: (1, {'@': 69}), 2: (1, {'@': 69}), 42: (1, {'@': 69}), 39: (1, {'@': 69}), 7: (1, {'@': 69}), 5: (1, {'@': 69}), 36: (1, {'@': 69}), 37: (1, {'@': 69}), 41: (1, {'@': 69}), 6: (1, {'@': 69}), 4: (1, {'@': 69}), 38: (1, {'@': 69}), 3: (1, {'@': 69}), 40: (1, {'@': 69}), 43: (1, {'@': 69}), 44: (1, {'@': 69})}, 65: {24: (0, 23), 10: (0, 103), 11: (0, 85), 25: (0, 64), 26: (0, 49), 27: (0, 51), 29: (0, 15), 12: (0, 48), 13: (0, 32), 15: (0, 94), 8: (0, 17), 14: (0, 75), 16: (0, 62), 17: (0, 87), 18: (0, 76), 19: (0, 106), 22: (0, 102), 21: (0, 80), 32: (0, 36), 33: (0, 21), 34: (0, 22)}, 66: {5: (0, 13), 0: (0, 70), 3: (0, 79), 2: (0, 45), 7: (1, {'@': 70})}, 67: {0: (1, {'@': 71}), 1: (1, {'@': 71}), 2: (1, {'@': 71}), 7: (1, {'@': 71}), 5: (1, {'@': 71}), 4: (1, {'@': 71}), 3: (1, {'@': 71}), 6: (1, {'@': 71})}, 68: {24: (0, 23), 10: (0, 103), 11: (0, 85), 25: (0, 64), 26: (0, 49), 27: (0, 51), 29: (0, 15), 12: (0, 48), 13: (0, 32), 8: (0, 104), 15: (0, 94), 14: (0, 75), 16: (0, 62), 17: (0, 87), 18: (0, 76), 19: (0, 106), 22: (0, 102), 21: (0, 80), 32: (0, 36), 33: (0, 21), 34: (0, 22)}, 69: {35: (1, {'@': 72}), 42: (1, {'@': 72}), 39: (1, {'@': 72}), 36: (1, {'@': 72}), 37: (1, {'@': 72}), 41: (1, {'@': 72}), 38: (1, {'@': 72}), 40: (1, {'@': 72}), 0: (1, {'@': 73}), 1: (1, {'@': 73}), 2: (1, {'@': 73}), 7: (1, {'@': 73}), 5: (1, {'@': 73}), 4: (1, {'@': 73}), 3: (1, {'@': 73}), 6: (1, {'@': 73})}, 70: {24: (0, 23), 10: (0, 103), 11: (0, 85), 25: (0, 64), 47: (0, 8), 26: (0, 49), 27: (0, 51), 29: (0, 15), 12: (0, 48), 13: (0, 32), 15: (0, 94), 14: (0, 75), 16: (0, 62), 17: (0, 87), 18: (0, 76), 19: (0, 106), 22: (0, 102), 21: (0, 80), 32: (0, 36), 8: (0, 26), 33: (0, 21), 34: (0, 22)}, 71: {0: (1, {'@': 74}), 1: (1, {'@': 74}), 2: (1, {'@': 74}), 7: (1, {'@': 74}), 5: (1, {'@': 74}), 4: (1, {'@': 74}), 3: (1, {'@': 74}), 6: (1, {'@': 74})}, 72: {24: (0, 23), 10: (0, 103), 11: (0, 85), 25: (0, 64), 26: (0, 49), 27: (0, 51), 8: (0, 67), 29: (0, 15), 12: (0, 48), 13: (0, 32), 15: (0, 94), 14: (0, 75), 16: (0, 62), 17: (0, 87), 18: (0, 76), 19: (0, 106), 22: (0, 102), 21: (0, 80), 32: (0, 36), 33: (0, 21), 34: (0, 22)}, 73: {4: (0, 56)}, 74: {0: (1, {'@': 75}), 1: (1, {'@': 75}), 2: (1, {'@': 75}), 43: (1, {'@': 75}), 5: (1, {'@': 75}), 4: (1, {'@': 75}), 44: (1, {'@': 75}), 3: (1, {'@': 75}), 6: (1, {'@': 75}), 7: (1, {'@': 75})}, 75: {35: (1, {'@': 76}), 2: (1, {'@': 76}), 36: (1, {'@': 76}), 37: (1, {'@': 76}), 38: (1, {'@': 76}), 6: (1, {'@': 76}), 0: (1, {'@': 76}), 1: (1, {'@': 76}), 39: (1, {'@': 76}), 7: (1, {'@': 76}), 5: (1, {'@': 76}), 40: (1, {'@': 76}), 41: (1, {'@': 76}), 4: (1, {'@': 76}), 3: (1, {'@': 76}), 42: (1, {'@': 76}), 43: (1, {'@': 76}), 44: (1, {'@': 76})}, 76: {0: (1, {'@': 77}), 1: (1, {'@': 77}), 35: (1, {'@': 77}), 2: (1, {'@': 77}), 42: (1, {'@': 77}), 39: (1, {'@': 77}), 7: (1, {'@': 77}), 5: (1, {'@': 77}), 36: (1, {'@': 77}), 37: (1, {'@': 77}), 41: (1, {'@': 77}), 6: (1, {'@': 77}), 4: (1, {'@': 77}), 38: (1, {'@': 77}), 3: (1, {'@': 77}), 40: (1, {'@': 77}), 43: (1, {'@': 77}), 44: (1, {'@': 77})}, 77: {0: (1, {'@': 78}), 1: (1, {'@': 78}), 35: (1, {'@': 78}), 2: (1, {'@': 78}), 42: (1, {'@': 78}), 39: (1, {'@': 78}), 7: (1, {'@': 78}), 5: (1, {'@': 78}), 36: (1, {'@': 78}), 37: (1, {'@': 78}), 41: (1, {'@': 78}), 6: (1, {'@': 78}), 4: (1, {'@': 78}), 38: (1, {'@': 78}), 3: (1, {'@': 78}), 40: (1, {'@': 78}), 43: (1, {'@': 78}), 44: (1, {'@': 78})}, 78: {4: (0, 59)}, 79: {8: (0, 37), 9: (0, 41), 10: (0, 103), 11: (0, 85), 12: (0, 48), 13: (0, 32), 14: (0, 75), 15: (0, 94), 16: (0, 62), 17: (0, 87), 18: (0, 76), 19: (0, 106), 20: (0, 52), 21: (0, 80), 30: (0, 0), 22: (0, 102), 23: (0, 69), 24: (0, 23), 25: (0, 64), 26: (0, 49), 27: (0, 51), 28: (0, 60), 29: (0, 15), 31: (0, 61), 32: (0, 36), 33: (0, 21), 34: (0, 22)}, 80: {8: (0, 7), 9: (0, 41), 10: (0, 103), 6: (0, 101), 11: (0, 85), 45: (0, 33), 46: (0, 3), 12: (0, 48), 13: (0, 32), 14: (0, 75), 15: (0, 94), 16: (0, 62), 17: (0, 87), 18: (0, 76), 19: (0, 106), 21: (0, 80), 22: (0, 102), 23: (0, 69), 24: (0, 23), 47: (0, 19), 25: (0, 64), 27: (0, 51), 26: (0, 49), 28: (0, 60), 29: (0, 15), 31: (0, 61), 20: (0, 50), 32: (0, 36), 33: (0, 21), 34: (0, 22)}, 81: {24: (0, 23), 10: (0, 103), 11: (0, 85), 25: (0, 64), 26: (0, 49), 27: (0, 51), 29: (0, 15), 12: (0, 48), 13: (0, 32), 15: (0, 94), 14: (0, 75), 16: (0, 62), 17: (0, 87), 18: (0, 76), 19: (0, 106), 22: (0, 102), 21: (0, 80), 8: (0, 90), 32: (0, 36), 33: (0, 21), 34: (0, 22)}, 82: {35: (1, {'@': 79}), 2: (1, {'@': 79}), 36: (1, {'@': 79}), 37: (1, {'@': 79}), 38: (1, {'@': 79}), 6: (1, {'@': 79}), 0: (1, {'@': 79}), 1: (1, {'@': 79}), 39: (1, {'@': 79}), 7: (1, {'@': 79}), 5: (1, {'@': 79}), 40: (1, {'@': 79}), 41: (1, {'@': 79}), 4: (1, {'@': 79}), 3: (1, {'@': 79}), 42: (1, {'@': 79}), 43: (1, {'@': 79}), 44: (1, {'@': 79})}, 83: {0: (1, {'@': 80}), 1: (1, {'@': 80}), 2: (1, {'@': 80}), 3: (1, {'@': 80}), 4: (1, {'@': 80}), 5: (1, {'@': 80}), 6: (1, {'@': 80}), 7: (1, {'@': 80})}, 84: {32: (0, 36), 16: (0, 25), 33: (0, 21), 27: (0, 39), 34: (0, 22), 48: (0, 78), 15: (0, 94)}, 85: {8: (0, 7), 9: (0, 41), 10: (0, 103), 11: (0, 85), 45: (0, 63), 46: (0, 3), 12: (0, 48), 13: (0, 32), 14: (0, 75), 15: (0, 94), 16: (0, 62), 17: (0, 87), 18: (0, 76), 19: (0, 106), 21: (0, 80), 22: (0, 102), 23: (0, 69), 24: (0, 23), 47: (0, 19), 25: (0, 64), 27: (0, 51), 26: (0, 49), 28: (0, 60), 29: (0, 15), 31: (0, 61), 20: (0, 50), 32: (0, 36), 33: (0, 21), 34: (0, 22)}, 86: {4: (0, 27), 6: (0, 55)}, 87: {0: (1, {'@': 81}), 1: (1, {'@': 81}), 35: (1, {'@': 81}), 2: (1, {'@': 81}), 42: (1, {'@': 81}), 39: (1, {'@': 81}), 7: (1, {'@': 81}), 5: (1, {'@': 81}), 36: (1, {'@': 81}), 37: (1, {'@': 81}), 41: (1, {'@': 81}), 6: (1, {'@': 81}), 4: (1, {'@': 81}), 38: (1, {'@': 81}), 3: (1, {'@': 81}), 40: (1, {'@': 81}), 43: (1, {'@': 81}), 44: (1, {'@': 81})}, 88: {5: (0, 13), 0: (0, 70), 3: (0, 79), 2: (0, 45), 1: (1, {'@': 82}), 4: (1, {'@': 82})}, 89: {49: (0, 31), 1: (0, 14), 4: (0, 10)}, 90: {0: (1, {'@': 83}), 1: (1, {'@': 83}), 2: (1, {'@': 83}), 7: (1, {'@': 83}), 5: (1, {'@': 83}), 4: (1, {'@': 83}), 3: (1, {'@': 83}), 6: (1, {'@': 83})}, 91: {24: (0, 23), 10: (0, 103), 11: (0, 85), 25: (0, 64), 26: (0, 49), 27: (0, 51), 29: (0, 15), 12: (0, 48), 13: (0, 32), 15: (0, 94), 14: (0, 75), 16: (0, 62), 17: (0, 87), 18: (0, 76), 19: (0, 106), 21: (0, 80), 22: (0, 102), 32: (0, 36), 33: (0, 21), 34: (0, 22), 8: (0, 1)}, 92: {8: (0, 7), 9: (0, 41), 45: (0, 66), 11: (0, 85), 46: (0, 3), 12: (0, 48), 13: (0, 32), 14: (0, 75), 15: (0, 94), 16: (0, 62), 18: (0, 76), 19: (0, 106), 17: (0, 87), 21: (0, 80), 22: (0, 102), 23: (0, 69), 24: (0, 23), 47: (0, 19), 25: (0, 64), 52: (0, 11), 26: (0, 49), 27: (0, 51), 28: (0, 60), 29: (0, 15), 31: (0, 61), 20: (0, 50), 32: (0, 36), 33: (0, 21), 34: (0, 22), 10: (0, 103)}, 93: {32: (0, 36), 16: (0, 25), 33: (0, 21), 27: (0, 39), 34: (0, 22), 48: (0, 58), 15: (0, 94)}, 94: {35: (1, {'@': 84}), 2: (1, {'@': 84}), 36: (1, {'@': 84}), 37: (1, {'@': 84}), 38: (1, {'@': 84}), 6: (1, {'@': 84}), 0: (1, {'@': 84}), 1: (1, {'@': 84}), 39: (1, {'@': 84}), 7: (1, {'@': 84}), 5: (1, {'@': 84}), 40: (1, {'@': 84}), 41: (1, {'@': 84}), 4: (1, {'@': 84}), 3: (1, {'@': 84}), 42: (1, {'@': 84}), 43: (1, {'@': 84}), 44: (1, {'@': 84})}, 95: {21: (0, 80), 18: (0, 71)}, 96: {32: (0, 99)}, 97: {0: (1, {'@': 85}), 1: (1, {'@': 85}), 2: (1, {'@': 85}), 43: (1, {'@': 85}), 5: (1, {'@': 85}), 4: (1, {'@': 85}), 44: (1, {'@': 85}), 3: (1, {'@': 85}), 6: (1, {'@': 85}), 7: (1, {'@': 85})}, 98: {0: (1, {'@': 86}), 1: (1, {'@': 86}), 2: (1, {'@': 86}), 3: (1, {'@': 86}), 4: (1, {'@': 86}), 5: (1, {'@': 86}), 6: (1, {'@': 86}), 7: (1, {'@': 86})}, 99: {35: (1, {'@': 87}), 2: (1, {'@': 87}), 36: (1, {'@': 87}), 37: (1, {'@': 87}), 38: (1, {'@': 87}), 6: (1, {'@': 87}), 0: (1, {'@': 87}), 1: (1, {'@': 87}), 39: (1, {'@': 87}), 7: (1, {'@': 87}), 5: (1, {'@': 87}), 40: (1, {'@': 87}), 41: (1, {'@': 87}), 4: (1, {'@': 87}), 3: (1, {'@': 87}), 42: (1, {'@': 87}), 43: (1, {'@': 87}), 44: (1, {'@': 87})}, 100: {21: (0, 80), 18: (0, 28)}, 101: {35: (1, {'@': 88}), 2: (1, {'@': 88}), 36: (1, {'@': 88}), 37: (1, {'@': 88}), 38: (1, {'@': 88}), 6: (1, {'@': 88}), 0: (1, {'@': 88}), 1: (1, {'@': 88}), 39: (1, {'@': 88}), 7: (1, {'@': 88}), 5: (1, {'@': 88}), 40: (1, {'@': 88}), 41: (1, {'@': 88}), 4: (1, {'@': 88}), 3: (1, {'@': 88}), 42: (1, {'@': 88}), 43: (1, {'@': 88}), 44: (1, {'@': 88})}, 102: {8: (0, 7), 9: (0, 41), 10: (0, 103), 45: (0, 30), 11: (0, 85), 46: (0, 3), 12: (0, 48), 13: (0, 32), 14: (0, 75), 15: (0, 94), 16: (0, 62), 18: (0, 76), 19: (0, 106), 17: (0, 87), 21: (0, 80), 22: (0, 102), 23: (0, 69), 24: (0, 23), 47: (0, 19), 25: (0, 64), 26: (0, 49), 27: (0, 51), 28: (0, 60), 29: (0, 15), 31: (0, 61), 20: (0, 50), 32: (0, 36), 33: (0, 21), 34: (0, 22)}, 103: {0: (1, {'@': 89}), 1: (1, {'@': 89}), 35: (1, {'@': 89}), 2: (1, {'@': 89}), 42: (1, {'@': 89}), 39: (1, {'@': 89}), 7: (1, {'@': 89}), 5: (1, {'@': 89}), 36: (1, {'@': 89}), 37: (1, {'@': 89}), 41: (1, {'@': 89}), 6: (1, {'@': 89}), 4: (1, {'@': 89}), 38: (1, {'@': 89}), 3: (1, {'@': 89}), 40: (1, {'@': 89}), 43: (1, {'@': 89}), 44: (1, {'@': 89})}, 104: {0: (1, {'@': 90}), 1: (1, {'@': 90}), 2: (1, {'@': 90}), 7: (1, {'@': 90}), 5: (1, {'@': 90}), 4: (1, {'@': 90}), 3: (1, {'@': 90}), 6: (1, {'@': 90})}, 105: {35: (1, {'@': 91}), 2: (1, {'@': 91}), 36: (1, {'@': 91}), 37: (1, {'@': 91}), 38: (1, {'@': 91}), 6: (1, {'@': 91}), 0: (1, {'@': 91}), 1: (1, {'@': 91}), 39: (1, {'@': 91}), 7: (1, {'@': 91}), 5: (1, {'@': 91}), 40: (1, {'@': 91}), 41: (1, {'@': 91}), 4: (1, {'@': 91}), 3: (1, {'@': 91}), 42: (1, {'@': 91}), 43: (1, {'@': 91}), 44: (1, {'@': 91})}, 106: {0: (1, {'@': 92}), 1: (1, {'@': 92}), 35: (1, {'@': 92}), 2: (1, {'@': 92}), 42: (1, {'@': 92}), 39: (1, {'@': 92}), 7: (1, {'@': 92}), 5: (1, {'@': 92}), 36: (1, {'@': 92}), 37: (1, {'@': 92}), 41: (1, {'@': 92}), 6: (1, {'@': 92}), 4: (1, {'@': 92}), 38: (1, {'@': 92}), 3: (1, {'@': 92}), 40: (1, {'@': 92}), 43: (1, {'@': 92}), 44: (1, {'@': 92})}, 107: {24: (0, 23), 10: (0, 103), 11: (0, 85), 25: (0, 64), 26: (0, 49), 27: (0, 51), 29: (0, 15), 12: (0, 48), 13: (0, 32), 15: (0, 94), 14: (0, 75), 16: (0, 62), 8: (0, 74), 17: (0, 87), 18: (0, 76), 19: (0, 106), 22: (0, 102), 21: (0, 80), 32: (0, 36), 33: (0, 21), 34: (0, 22)}}, 'start_states': {'start': 92}, 'end_states': {'start': 11}}, 'lexer_conf': {'tokens': [{'@': 0}, {'@': 1}, {'@': 2}, {'@': 3}, {'@': 4}, {'@': 5}, {'@': 6}, {'@': 7}, {'@': 8}, {'@': 9}, {'@': 10}, {'@': 11}, {'@': 12}, {'@': 13}, {'@': 14}, {'@': 15}, {'@': 16}, {'@': 17}, {'@': 18}, {'@': 19}, {'@': 20}, {'@': 21}, {'@': 22}, {'@': 23}, {'@': 24}, {'@': 25}, {'@': 26}, {'@': 27}, {'@': 28}, {'@': 29}, {'@': 30}, {'@': 31}, {'@': 32}, {'@': 33}, {'@': 34}, {'@': 35}, {'@': 36}], 'ignore': ['WS'], 'g_regex_flags': 0, '__type__': 'LexerConf'}, 'start': ['start'], '__type__': 'LALR_ContextualLexer'}, 'rules': [{'@': 70}, {'@': 48}, {'@': 63}, {'@': 86}, {'@': 80}, {'@': 37}, {'@': 43}, {'@': 52}, {'@': 42}, {'@': 85}, {'@': 75}, {'@': 65}, {'@': 54}, {'@': 73}, {'@': 61}, {'@': 71}, {'@': 74}, {'@': 51}, {'@': 46}, {'@': 38}, {'@': 90}, {'@': 83}, {'@': 72}, {'@': 41}, {'@': 58}, {'@': 55}, {'@': 89}, {'@': 68}, {'@': 77}, {'@': 92}, {'@': 62}, {'@': 81}, {'@': 78}, {'@': 69}, {'@': 64}, {'@': 67}, {'@': 91}, {'@': 88}, {'@': 49}, {'@': 76}, {'@': 40}, {'@': 45}, {'@': 60}, {'@': 66}, {'@': 59}, {'@': 47}, {'@': 50}, {'@': 56}, {'@': 79}, {'@': 57}, {'@': 87}, {'@': 84}, {'@': 44}, {'@': 53}, {'@': 82}, {'@': 39}], 'options': {'debug': False, 'keep_all_tokens': False, 'tree_class': None, 'cache': False, 'postlex': None, 'parser': 'lalr', 'lexer': 'contextual', 'transformer': None, 'start': ['start'], 'priority': None, 'ambiguity': 'auto', 'propagate_positions': False, 'lexer_callbacks': {}, 'maybe_placeholders': False, 'edit_terminals': None, 'g_regex_flags': 0}, '__type__': 'Lark'}
+)
+MEMO = (
+{0: {'name': '_IS_NOT', 'pattern': {'value': 'is not(?![a-zA-Z0-9_])', 'flags': [], '_width': [6, 6], '__type__': 'PatternRE'}, 'priority': 1, '__type__': 'TerminalDef'}, 1: {'name': '_IS_IN', 'pattern': {'value': 'is in(?![a-zA-Z0-9_])', 'flags': [], '_width': [5, 5], '__type__': 'PatternRE'}, 'priority': 1, '__type__': 'TerminalDef'}, 2: {'name': '_IS_NOT_IN', 'pattern': {'value': 'is not in(?![a-zA-Z0-9_])', 'flags': [], '_width': [9, 9], '__type__': 'PatternRE'}, 'priority': 1, '__type__': 'TerminalDef'}, 3: {'name': '_GTE', 'pattern': {'value': 'gte(?![a-zA-Z0-9_])', 'flags': [], '_width': [3, 3], '__type__': 'PatternRE'}, 'priority': 1, '__type__': 'TerminalDef'}, 4: {'name': '_LTE', 'pattern': {'value': 'lte(?![a-zA-Z0-9_])', 'flags': [], '_width': [3, 3], '__type__': 'PatternRE'}, 'priority': 1, '__type__': 'TerminalDef'}, 5: {'name': 'IDENT', 'pattern': {'value': '[a-zA-Z][a-zA-Z0-9_]*(?![a-zA-Z0-9_(])', 'flags': [], '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 1, '__type__': 'TerminalDef'}, 6: {'name': 'STRING', 'pattern': {'value': "((`['`])|([^']))+", 'flags': [], '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 1, '__type__': 'TerminalDef'}, 7: {'name': 'BOOL', 'pattern': {'value': '(True|False)(?![a-zA-Z0-9_])', 'flags': [], '_width': [4, 5], '__type__': 'PatternRE'}, 'priority': 2, '__type__': 'TerminalDef'}, 8: {'name': 'NULL', 'pattern': {'value': 'Null(?![a-zA-Z0-9_])', 'flags': [], '_width': [4, 4], '__type__': 'PatternRE'}, 'priority': 2, '__type__': 'TerminalDef'}, 9: {'name': 'SIGNED_NUMBER', 'pattern': {'value': '(?:(?:\\+|\\-))?(?:(?:(?:[0-9])+(?:e|E)(?:(?:\\+|\\-))?(?:[0-9])+|(?:(?:[0-9])+\\.(?:(?:[0-9])+)?|\\.(?:[0-9])+)(?:(?:e|E)(?:(?:\\+|\\-))?(?:[0-9])+)?)|(?:[0-9])+)', 'flags': [], '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 1, '__type__': 'TerminalDef'}, 10: {'name': 'WS', 'pattern': {'value': '(?:[ \t\x0c\r\n])+', 'flags': [], '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 1, '__type__': 'TerminalDef'}, 11: {'name': 'NOT', 'pattern': {'value': 'not', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 12: {'name': 'OR', 'pattern': {'value': 'or', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 13: {'name': 'AND', 'pattern': {'value': 'and', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 14: {'name': 'PLUS', 'pattern': {'value': '+', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 15: {'name': 'MINUS', 'pattern': {'value': '-', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 16: {'name': 'STAR', 'pattern': {'value': '*', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 17: {'name': 'SLASH', 'pattern': {'value': '/', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 18: {'name': 'IS', 'pattern': {'value': 'is', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 19: {'name': 'GT', 'pattern': {'value': 'gt', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 20: {'name': 'LT', 'pattern': {'value': 'lt', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 21: {'name': 'ANY', 'pattern': {'value': 'any', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 22: {'name': 'ALL', 'pattern': {'value': 'all', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 23: {'name': 'LPAR', 'pattern': {'value': '(', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 24: {'name': 'RPAR', 'pattern': {'value': ')', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 25: {'name': 'COMMA', 'pattern': {'value': ',', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 26: {'name': 'LSQB', 'pattern': {'value': '[', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 27: {'name': 'RSQB', 'pattern': {'value': ']', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 28: {'name': '__ANON_0', 'pattern': {'value': 'lookup(', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 29: {'name': '__ANON_1', 'pattern': {'value': 'join(', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 30: {'name': '__ANON_2', 'pattern': {'value': 'replace(', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 31: {'name': '__ANON_3', 'pattern': {'value': 'match(', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 32: {'name': '__ANON_4', 'pattern': {'value': 'search(', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 33: {'name': 'RE', 'pattern': {'value': 're', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 34: {'name': 'IRE', 'pattern': {'value': 'ire', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 35: {'name': 'QUOTE', 'pattern': {'value': "'", 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 36: {'name': '__ANON_5', 'pattern': {'value': "''", 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 37: {'origin': {'name': 'expression', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'AND', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'comparison', '__type__': 'NonTerminal'}], 'order': 4, 'alias': 'logical_and', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 38: {'origin': {'name': 'comparison_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison_lhs', '__type__': 'NonTerminal'}, {'name': '_GTE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 6, 'alias': 'gte', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 39: {'origin': {'name': '__string_manip_plus_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__string_manip_plus_1', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'pattern', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 40: {'origin': {'name': 'string_manip', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_1', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'string', '__type__': 'NonTerminal'}, {'name': '__array_star_0', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': 'str_join', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 41: {'origin': {'name': 'comparison_lhs', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 42: {'origin': {'name': 'product', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 43: {'origin': {'name': 'expression', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'PLUS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'product', '__type__': 'NonTerminal'}], 'order': 5, 'alias': 'add', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 44: {'origin': {'name': '__array_star_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 45: {'origin': {'name': 'string_manip', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_1', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'string', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': 'str_join', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 46: {'origin': {'name': 'comparison_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison_lhs', '__type__': 'NonTerminal'}, {'name': 'GT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 5, 'alias': 'gt', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 47: {'origin': {'name': 'string_manip', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_4', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'pattern', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 5, 'alias': 'str_search', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 48: {'origin': {'name': 'expression', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'product', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 49: {'origin': {'name': 'lookup', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_0', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'string', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': 'lookup', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 50: {'origin': {'name': 'pattern', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'string', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 51: {'origin': {'name': 'comparison_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison_lhs', '__type__': 'NonTerminal'}, {'name': '_IS_NOT_IN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'array', '__type__': 'NonTerminal'}], 'order': 4, 'alias': 'not_in', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 52: {'origin': {'name': 'expression', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'MINUS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'product', '__type__': 'NonTerminal'}], 'order': 6, 'alias': 'subtract', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 53: {'origin': {'name': '__array_star_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__array_star_0', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 54: {'origin': {'name': 'comparison', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 55: {'origin': {'name': 'group', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ALL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'array', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'all', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 56: {'origin': {'name': 'pattern', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'regex', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 57: {'origin': {'name': 'regex', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IRE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'string', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'iregex', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 58: {'origin': {'name': 'group', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ANY', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'array', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'any', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 59: {'origin': {'name': 'string_manip', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_3', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'pattern', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 4, 'alias': 'str_match', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 60: {'origin': {'name': 'string_manip', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_2', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': '__string_manip_plus_1', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': 'str_replace', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 61: {'origin': {'name': 'comparison_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison_lhs', '__type__': 'NonTerminal'}, {'name': 'IS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'eq', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 62: {'origin': {'name': 'atom', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NULL', 'filter_out': False, '__type__': 'Terminal'}], 'order': 4, 'alias': 'null', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 63: {'origin': {'name': 'expression', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison_op', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 64: {'origin': {'name': 'atom', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'regex', '__type__': 'NonTerminal'}], 'order': 8, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 65: {'origin': {'name': 'comparison', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison_op', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 66: {'origin': {'name': 'string_manip', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_2', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': 'str_replace', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 67: {'origin': {'name': 'array', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': '__array_star_0', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 68: {'origin': {'name': 'atom', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'string', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 69: {'origin': {'name': 'atom', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'string_manip', '__type__': 'NonTerminal'}], 'order': 7, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 70: {'origin': {'name': 'start', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 71: {'origin': {'name': 'comparison_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison_lhs', '__type__': 'NonTerminal'}, {'name': '_IS_NOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'not_eq', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 72: {'origin': {'name': 'comparison_lhs', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'group', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 73: {'origin': {'name': 'comparison_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'group', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 74: {'origin': {'name': 'comparison_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison_lhs', '__type__': 'NonTerminal'}, {'name': '_IS_IN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'array', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'is_in', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 75: {'origin': {'name': 'product', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'product', '__type__': 'NonTerminal'}, {'name': 'SLASH', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'divide', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 76: {'origin': {'name': 'lookup', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENT', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': 'lookup', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 77: {'origin': {'name': 'atom', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'array', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 78: {'origin': {'name': 'atom', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 6, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 79: {'origin': {'name': 'regex', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'RE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'string', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'regex', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 80: {'origin': {'name': 'expression', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'OR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'comparison', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'logical_or', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 81: {'origin': {'name': 'atom', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SIGNED_NUMBER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 5, 'alias': 'number', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 82: {'origin': {'name': '__string_manip_plus_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'pattern', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 83: {'origin': {'name': 'comparison_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison_lhs', '__type__': 'NonTerminal'}, {'name': '_LTE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 8, 'alias': 'lte', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 84: {'origin': {'name': 'string', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_5', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': 'string', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 85: {'origin': {'name': 'product', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'product', '__type__': 'NonTerminal'}, {'name': 'STAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'multiply', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 86: {'origin': {'name': 'expression', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'comparison', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'logical_not', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 87: {'origin': {'name': 'string', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'QUOTE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'STRING', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'QUOTE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': 'string', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 88: {'origin': {'name': 'array', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': [False, True, False], '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 89: {'origin': {'name': 'atom', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'lookup', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 90: {'origin': {'name': 'comparison_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison_lhs', '__type__': 'NonTerminal'}, {'name': 'LT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 7, 'alias': 'lt', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 91: {'origin': {'name': 'array', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 92: {'origin': {'name': 'atom', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'BOOL', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': 'boolean', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}}
+)
+Shift = 0
+Reduce = 1
+def Lark_StandAlone(transformer=None, postlex=None):
+  return Lark._load_from_dict(DATA, MEMO, transformer=transformer, postlex=postlex)
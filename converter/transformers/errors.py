@@ -19,3 +19,13 @@ class UnexpectedCharacters(ParserError):
             f"Unexpected character in '{expression}':"
             f" '{char}' at position {position}"
         )
+
+
+class UnexpectedEnd(ParserError):
+    """
+    Error raised when the transformation ends before the expression is
+    complete.
+    """
+
+    def __init__(self, expression):
+        super().__init__(f"Unexpected end of expression in '{expression}'")
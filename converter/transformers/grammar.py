@@ -1,11 +1,15 @@
-from lark import lark
+import io
+import os
+from contextlib import redirect_stdout
+
+from ._parser import Lark_StandAlone
 
 
 _grammar = r"""
 ?start: expression
 
 ?expression: product
-           | comparison
+           | comparison_op
            | "not" comparison -> logical_not
            | expression "or" comparison -> logical_or
            | expression "and" comparison -> logical_and
@@ -16,15 +20,20 @@ _grammar = r"""
         | product "*" atom -> multiply
         | product "/" atom -> divide
 
-?comparison: comparison_lhs
-           | comparison_lhs "is" atom -> eq
-           | comparison_lhs "is not" atom -> not_eq
-           | comparison_lhs "is in" array -> is_in
-           | comparison_lhs "is not in" array -> not_in
-           | comparison_lhs "gt" atom -> gt
-           | comparison_lhs "gte" atom -> gte
-           | comparison_lhs "lt" atom -> lt
-           | comparison_lhs "lte" atom -> lte
+// a bare atom is only reduced as a comparison on the right of a logical
+// operator, everywhere else it is a product so the grammar is LALR(1)
+?comparison: comparison_op
+           | atom
+
+?comparison_op: group
+              | comparison_lhs "is" atom -> eq
+              | comparison_lhs _IS_NOT atom -> not_eq
+              | comparison_lhs _IS_IN array -> is_in
+              | comparison_lhs _IS_NOT_IN array -> not_in
+              | comparison_lhs "gt" atom -> gt
+              | comparison_lhs _GTE atom -> gte
+              | comparison_lhs "lt" atom -> lt
+              | comparison_lhs _LTE atom -> lte
 
 ?comparison_lhs: group
                | atom
@@ -61,10 +70,18 @@ array: "[" [expression ("," expression)*] "]"
 ?string: "'" STRING "'" -> string
        | "''"  -> string
 
-IDENT: /[a-zA-Z][a-zA-Z0-9_]*/
+// operators that could be the start of an identifier have to end on a word
+// boundary and identifiers can't be followed by "(" so that the lexer doesn't
+// split identifiers or read function names as identifiers
+_IS_NOT: /is not(?![a-zA-Z0-9_])/
+_IS_IN: /is in(?![a-zA-Z0-9_])/
+_IS_NOT_IN: /is not in(?![a-zA-Z0-9_])/
+_GTE: /gte(?![a-zA-Z0-9_])/
+_LTE: /lte(?![a-zA-Z0-9_])/
+IDENT: /[a-zA-Z][a-zA-Z0-9_]*(?![a-zA-Z0-9_(])/
 STRING: /((`['`])|([^']))+/
-BOOL: /True|False/
-NULL: /Null/
+BOOL.2: /(True|False)(?![a-zA-Z0-9_])/
+NULL.2: /Null(?![a-zA-Z0-9_])/
 
 %import common.SIGNED_NUMBER
 %import common.WS
@@ -73,5 +90,41 @@ NULL: /Null/
 # ignore line length in this file as its not always possible to break lines
 # on the grammar
 
+#: Path of the pre-generated parser module
+STANDALONE_PARSER_PATH = os.path.join(os.path.dirname(__file__), "_parser.py")
+
+_standalone_header = """\
+# flake8: noqa
+# isort: skip_file
+# mypy: ignore-errors
+# fmt: off
+#
+# Generated from the grammar in converter/transformers/grammar.py, do not edit
+# this file directly. To regenerate it after changing the grammar run:
+#
+#    python -c "from converter.transformers.grammar import generate_standalone_parser; generate_standalone_parser()"
+#
+"""
+
+
+def generate_standalone_parser(path: str = STANDALONE_PARSER_PATH):
+    """
+    Generates the standalone LALR parser module for the grammar. The parse
+    tables are built once here rather than each time the package is
+    imported. This requires ``lark-parser`` to be installed.
+
+    :param path: The path to write the module to
+    """
+    from lark.tools import standalone
+
+    source = io.StringIO()
+    with redirect_stdout(source):
+        standalone.main(io.StringIO(_grammar), "start")
+
+    with open(path, "w") as f:
+        f.write(_standalone_header)
+        f.write(source.getvalue())
+
+
 #: Object for parsing the transformer strings and producing a tree
-parser = lark.Lark(_grammar)
+parser = Lark_StandAlone()
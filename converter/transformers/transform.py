@@ -1,15 +1,25 @@
 import re
-from functools import partial
+from functools import lru_cache
+from itertools import islice
 from operator import add, mul, sub
 from operator import truediv as div
-from typing import Any, Callable, Iterable, List, Pattern, TypedDict, Union
-
-from lark import Transformer as _LarkTransformer
-from lark import Tree
-from lark import exceptions as lark_exceptions
-from lark import v_args
-
-from .errors import UnexpectedCharacters
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+    TypedDict,
+    Union,
+)
+
+from . import _parser as lark_standalone
+from ._parser import Transformer as _LarkTransformer
+from ._parser import Tree, v_args
+from .errors import UnexpectedCharacters, UnexpectedEnd
 from .grammar import parser
 
 
@@ -298,6 +308,175 @@ def default_not_in_transformer(row, lhs, rhs):
         return lhs not in rhs
 
 
+def _can_overlap(a: str, b: str) -> bool:
+    """
+    Checks if occurrences of two strings could share any characters in a
+    larger string (including one containing the other).
+
+    :param a: The first string
+    :param b: The second string
+
+    :return: True if the strings can overlap, False otherwise
+    """
+    # slide b along a checking every position where they share characters
+    for offset in range(1 - len(b), len(a)):
+        a_start = max(0, offset)
+        a_end = min(len(a), offset + len(b))
+        b_start = a_start - offset
+        b_end = a_end - offset
+        if a[a_start:a_end] == b[b_start:b_end]:
+            return True
+
+    return False
+
+
+class LiteralReplacement:
+    """
+    A chain of literal replacements applied to a string in a single pass. The
+    result is always the same as applying each replacement in turn:
+
+    * values that exactly match a pattern are looked up in a table of the
+      results of the full chain
+    * values that contain patterns are replaced with a single regex pass if
+      no pattern can overlap another or the replacement of an earlier pattern
+    * otherwise the replacements are applied one after the other
+
+    :param pairs: The pattern and replacement pairs in the order they are
+        applied
+    """
+
+    def __init__(self, pairs: Tuple[Tuple[str, str], ...]):
+        self.pairs = pairs
+        self.replacements = dict(pairs)
+
+        alternation = "|".join(
+            re.escape(p) for p in sorted(self.replacements, key=len)[::-1]
+        )
+        self.pattern = re.compile(alternation)
+
+        #: Matches the whole value if it contains any of the patterns
+        self.contains_pattern = re.compile(
+            rf"\A(?=.*?(?:{alternation})).*", flags=re.DOTALL
+        )
+
+        self.exact = {p: self.replace_sequentially(p) for p, _ in pairs}
+        self.single_pass = self.is_single_pass()
+
+    def is_single_pass(self) -> bool:
+        """
+        Checks if the chain can be applied in a single pass. This is the case
+        when no patterns can overlap each other (so each character is only
+        ever matched by a single pattern) and no pattern can overlap the
+        replacement of an earlier pattern (so no new matches are produced).
+
+        :return: True if a single pass gives the same result as the chain
+        """
+        for i, (pattern, repl) in enumerate(self.pairs):
+            for later, _ in islice(self.pairs, i + 1, None):
+                if _can_overlap(pattern, later):
+                    return False
+
+                if repl and _can_overlap(repl, later):
+                    return False
+
+                if not repl and len(later) > 1:
+                    # removing a pattern joins the characters either side
+                    # which could form a later pattern
+                    return False
+
+        return True
+
+    def replace_sequentially(self, value: str) -> str:
+        """
+        Applies each replacement in turn
+
+        :param value: The value to perform the replacements on
+
+        :return: The replaced string
+        """
+        for pattern, repl in self.pairs:
+            value = value.replace(pattern, repl)
+
+        return value
+
+    def replace_match(self, match: re.Match) -> str:
+        """
+        Gets the replacement for a pattern matched in the single pass
+
+        :param match: The matched pattern
+
+        :return: The replacement string
+        """
+        return self.replacements[match.group(0)]
+
+    def __call__(self, value: str) -> str:
+        """
+        Applies the chain of replacements to the value
+
+        :param value: The value to perform the replacements on
+
+        :return: The replaced string
+        """
+        result = self.exact.get(value)
+        if result is not None:
+            return result
+
+        if self.single_pass:
+            return self.pattern.sub(self.replace_match, value)
+
+        return self.replace_sequentially(value)
+
+
+#: Characters that make a pattern behave differently when treated as a regex
+_REGEX_SPECIAL_CHARS = frozenset(".^$*+?{}[]\\|()")
+
+
+@lru_cache(maxsize=1024)
+def _get_literal_replacement(pattern_repl, strings_are_regex):
+    pairs = tuple(zip(pattern_repl[::2], pattern_repl[1::2]))
+    for pattern, repl in pairs:
+        if not isinstance(pattern, str) or not isinstance(repl, str):
+            return None
+
+        if not pattern:
+            return None
+
+        if strings_are_regex and len(pattern) > 1:
+            if _REGEX_SPECIAL_CHARS.intersection(pattern) or "\\" in repl:
+                return None
+
+    return LiteralReplacement(pairs)
+
+
+def get_literal_replacement(
+    pattern_repl: Tuple[Any, ...], strings_are_regex: bool = False
+) -> Optional[LiteralReplacement]:
+    """
+    Gets the single pass replacement for the pattern and replacement pairs
+    passed to ``replace``. This is only possible when there are multiple
+    pairs and all patterns and replacements are literal strings.
+
+    :param pattern_repl: The pattern and replacement pairs as passed to
+        ``replace``
+    :param strings_are_regex: Set when string patterns longer than 1
+        character are applied as regular expressions (as pandas does), in
+        this case patterns containing special characters and replacements
+        containing escapes are not considered literal
+
+    :return: The replacement or None if the pairs can't be compiled
+    """
+    if len(pattern_repl) < 4 or len(pattern_repl) % 2 != 0:
+        return None
+
+    try:
+        hash(pattern_repl)
+    except TypeError:
+        # values such as series can't be literal
+        return None
+
+    return _get_literal_replacement(pattern_repl, strings_are_regex)
+
+
 def default_replace(row, target, *pattern_repl):
     """
     Replaces the pattern in the target string with a given string. The pattern
@@ -313,6 +492,10 @@ def default_replace(row, target, *pattern_repl):
 
     :return: The transformed object
     """
+    replacement = get_literal_replacement(pattern_repl)
+    if replacement is not None:
+        return replacement(str(target))
+
     result = target
     patterns = (p for i, p in enumerate(pattern_repl) if i % 2 == 0)
     repls = (r for i, r in enumerate(pattern_repl) if i % 2 != 0)
@@ -375,39 +558,155 @@ def default_join(row, join, *elements):
     return str(join).join(map(str, elements))
 
 
+def get_transformer_mapping(
+    transformer_mapping: Optional[TransformerMapping] = None,
+) -> TransformerMapping:
+    """
+    Builds the full set of transformer functions, applying the provided
+    overrides on top of the defaults.
+
+    :param transformer_mapping: The overrides for the transform functions
+
+    :return: The complete transformer mapping
+    """
+    return {
+        "lookup": lambda r, name: r[name],
+        "add": lambda r, lhs, rhs: add(lhs, rhs),
+        "subtract": lambda r, lhs, rhs: sub(lhs, rhs),
+        "multiply": lambda r, lhs, rhs: mul(lhs, rhs),
+        "divide": lambda r, lhs, rhs: div(lhs, rhs),
+        "eq": lambda r, lhs, rhs: lhs == rhs,
+        "not_eq": lambda r, lhs, rhs: lhs != rhs,
+        "is_in": default_in_transformer,
+        "not_in": default_not_in_transformer,
+        "gt": lambda r, lhs, rhs: lhs > rhs,
+        "gte": lambda r, lhs, rhs: lhs >= rhs,
+        "lt": lambda r, lhs, rhs: lhs < rhs,
+        "lte": lambda r, lhs, rhs: lhs <= rhs,
+        "logical_or": lambda r, lhs, rhs: lhs or rhs,
+        "logical_and": lambda r, lhs, rhs: lhs and rhs,
+        "logical_not": lambda r, v: not v,
+        "any": lambda r, v: AnyWrapper(v),
+        "all": lambda r, v: AllWrapper(v),
+        "str_join": default_join,
+        "str_replace": default_replace,
+        "str_match": default_match,
+        "str_search": default_search,
+        **(transformer_mapping or {}),  # type: ignore
+    }
+
+
+#: A compiled expression, called with the row to transform and the full
+#: transformer mapping (see :func:`get_transformer_mapping`)
+CompiledExpression = Callable[[RowType, TransformerMapping], Any]
+
+
+class Constant:
+    """
+    Compiled expression for a literal value in the expression. The value is
+    exposed so that operations can inspect literal arguments when compiling.
+
+    :param value: The literal value
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __call__(self, row: RowType, transformer_mapping: TransformerMapping):
+        return self.value
+
+
+def compile_operation(name: str, *args: CompiledExpression):
+    """
+    Compiles a call to one of the transformer mapping functions. Each argument
+    is evaluated before being passed to the mapped function.
+
+    :param name: The name of the function in the transformer mapping
+    :param args: The compiled arguments for the operation
+
+    :return: The compiled expression
+    """
+    if len(args) == 1:
+        (arg,) = args
+        return lambda row, fns: fns[name](row, arg(row, fns))
+    elif len(args) == 2:
+        lhs, rhs = args
+        return lambda row, fns: fns[name](row, lhs(row, fns), rhs(row, fns))
+    else:
+        return lambda row, fns: fns[name](row, *(a(row, fns) for a in args))
+
+
+def _operation(name):
+    def _compile(self, *args):
+        return compile_operation(name, *args)
+
+    return _compile
+
+
 @v_args(inline=True)
-class BaseTreeTransformer(_LarkTransformer):
+class ExpressionCompiler(_LarkTransformer):
     """
-    Abstract implementation of the Tree transformer class
+    Converts the parsed expression tree into a python closure so that the tree
+    only needs to be walked once rather than once per row. The resulting
+    function is called with the row and the full transformer mapping.
     """
 
-    lookup: Callable[[RowType, str], Any]
-    add: Callable[[RowType, Any, Any], Any]
-    subtract: Callable[[RowType, Any, Any], Any]
-    multiply: Callable[[RowType, Any, Any], Any]
-    divide: Callable[[RowType, Any, Any], Any]
-    eq: Callable[[RowType, Any, Any], Any]
-    not_eq: Callable[[RowType, Any, Any], Any]
-    is_in: Callable[[RowType, Any, Any], Any]
-    not_in: Callable[[RowType, Any, Any], Any]
-    gt: Callable[[RowType, Any, Any], Any]
-    gte: Callable[[RowType, Any, Any], Any]
-    lt: Callable[[RowType, Any, Any], Any]
-    lte: Callable[[RowType, Any, Any], Any]
-    logical_not: Callable[[RowType, Any, Any], Any]
-    logical_or: Callable[[RowType, Any, Any], Any]
-    logical_and: Callable[[RowType, Any, Any], Any]
-    any: Callable[[RowType, List[Any]], GroupWrapper]
-    all: Callable[[RowType, List[Any]], GroupWrapper]
-    str_join: Callable[..., Any]
-    str_replace: Callable[[RowType, Any, Pattern, Any], Any]
-    str_match: Callable[[RowType, Any, Pattern, Any], Any]
-    str_search: Callable[[RowType, Any, Pattern, Any], Any]
+    add = _operation("add")
+    subtract = _operation("subtract")
+    multiply = _operation("multiply")
+    divide = _operation("divide")
+    eq = _operation("eq")
+    not_eq = _operation("not_eq")
+    is_in = _operation("is_in")
+    not_in = _operation("not_in")
+    gt = _operation("gt")
+    gte = _operation("gte")
+    lt = _operation("lt")
+    lte = _operation("lte")
+    logical_not = _operation("logical_not")
+    logical_or = _operation("logical_or")
+    logical_and = _operation("logical_and")
+    any = _operation("any")
+    all = _operation("all")
+    str_join = _operation("str_join")
+    str_replace = _operation("str_replace")
+    str_match = _operation("str_match")
+    str_search = _operation("str_search")
 
-    array = v_args(inline=False)(list)
     string_escape_re = re.compile(r"`([`'])")
 
-    def string(self, value=""):
+    def lookup(self, name):
+        """
+        Compiles a column lookup. The name is either the identifier token or
+        the compiled string passed to ``lookup(...)``.
+
+        :param name: The name of the column
+
+        :return: The compiled lookup
+        """
+        name = name.value if isinstance(name, Constant) else str(name)
+        return lambda row, fns: fns["lookup"](row, name)
+
+    @v_args(inline=False)
+    def array(self, elements):
+        """
+        Compiles an array so that each element is evaluated into a list
+
+        :param elements: The compiled elements of the array
+
+        :return: The compiled array
+        """
+        if all(isinstance(e, Constant) for e in elements):
+            # build a new list each time so the result can't be mutated
+            # between rows
+            values = [e.value for e in elements]
+            return lambda row, fns: list(values)
+
+        return lambda row, fns: [e(row, fns) for e in elements]
+
+    def parse_string(self, value=""):
         """
         Parses a string from the transformer language and performs any
         necessary escaping. `value` has a default value to account for the
@@ -420,25 +719,37 @@ class BaseTreeTransformer(_LarkTransformer):
         # process any escape characters
         return self.string_escape_re.sub(r"\1", value)
 
-    def regex(self, value=""):
+    def string(self, value=""):
+        """
+        Generates a string from the provided value
+
+        :param value: The value to parse
+
+        :return: The parsed string
+        """
+        return Constant(self.parse_string(value))
+
+    def regex(self, value: Constant):
         """
         Generates a regex from teh provided string
 
-        :param value: The pattern
+        :param value: The compiled pattern string
 
         :return: The regex object
         """
-        return re.compile(self.string(value))
+        return Constant(re.compile(self.parse_string(value.value)))
 
-    def iregex(self, value=""):
+    def iregex(self, value: Constant):
         """
         Generates a case insensitive regex from teh provided string
 
-        :param value: The pattern
+        :param value: The compiled pattern string
 
         :return: The regex object
         """
-        return re.compile(self.string(value), flags=re.IGNORECASE)
+        return Constant(
+            re.compile(self.parse_string(value.value), flags=re.IGNORECASE)
+        )
 
     def boolean(self, value):
         """
@@ -448,7 +759,7 @@ class BaseTreeTransformer(_LarkTransformer):
 
         :return: True if the value is "True", False otherwise
         """
-        return value == "True"
+        return Constant(value == "True")
 
     def null(self, value):
         """
@@ -458,7 +769,7 @@ class BaseTreeTransformer(_LarkTransformer):
 
         :return: None
         """
-        return None
+        return Constant(None)
 
     def number(self, value):
         """
@@ -470,80 +781,37 @@ class BaseTreeTransformer(_LarkTransformer):
         :return: The parsed value
         """
         try:
-            return int(value)
+            return Constant(int(value))
         except ValueError:
-            return float(value)
+            return Constant(float(value))
 
 
-def create_transformer_class(row, transformer_mapping):
-    """
-    Creates a transformer class from the provided mapping overrides.
+@lru_cache(maxsize=4096)
+def _parse_string(expression: str) -> Tree:
+    try:
+        return parser.parse(expression)
+    except lark_standalone.UnexpectedCharacters as e:
+        raise UnexpectedCharacters(
+            expression,
+            expression[e.pos_in_stream],  # type: ignore
+            e.column,
+        )
+    except lark_standalone.UnexpectedToken as e:
+        if e.token.type == "$END":
+            raise UnexpectedEnd(expression)
 
-    :param row: The row to transform
-    :param transformer_mapping: The overrides for the transform functions
+        raise UnexpectedCharacters(expression, e.token[0], e.column)
 
-    :return: The new transformer class
-    """
-    transformer_mapping = {
-        "lookup": lambda r, name: r[name],
-        "add": lambda r, lhs, rhs: add(lhs, rhs),
-        "subtract": lambda r, lhs, rhs: sub(lhs, rhs),
-        "multiply": lambda r, lhs, rhs: mul(lhs, rhs),
-        "divide": lambda r, lhs, rhs: div(lhs, rhs),
-        "eq": lambda r, lhs, rhs: lhs == rhs,
-        "not_eq": lambda r, lhs, rhs: lhs != rhs,
-        "is_in": default_in_transformer,
-        "not_in": default_not_in_transformer,
-        "gt": lambda r, lhs, rhs: lhs > rhs,
-        "gte": lambda r, lhs, rhs: lhs >= rhs,
-        "lt": lambda r, lhs, rhs: lhs < rhs,
-        "lte": lambda r, lhs, rhs: lhs <= rhs,
-        "logical_or": lambda r, lhs, rhs: lhs or rhs,
-        "logical_and": lambda r, lhs, rhs: lhs and rhs,
-        "logical_not": lambda r, v: not v,
-        "any": lambda r, v: AnyWrapper(v),
-        "all": lambda r, v: AllWrapper(v),
-        "str_join": default_join,
-        "str_replace": default_replace,
-        "str_match": default_match,
-        "str_search": default_search,
-        **(transformer_mapping or {}),
-    }
 
-    def mapped_function(name, *args, **kwargs):
-        return transformer_mapping[name](row, *args, **kwargs)
-
-    @v_args(inline=True)
-    class TreeTransformer(BaseTreeTransformer):
-        lookup = partial(mapped_function, "lookup")
-        add = partial(mapped_function, "add")
-        subtract = partial(mapped_function, "subtract")
-        multiply = partial(mapped_function, "multiply")
-        divide = partial(mapped_function, "divide")
-        eq = partial(mapped_function, "eq")
-        not_eq = partial(mapped_function, "not_eq")
-        is_in = partial(mapped_function, "is_in")
-        not_in = partial(mapped_function, "not_in")
-        gt = partial(mapped_function, "gt")
-        gte = partial(mapped_function, "gte")
-        lt = partial(mapped_function, "lt")
-        lte = partial(mapped_function, "lte")
-        logical_not = partial(mapped_function, "logical_not")
-        logical_or = partial(mapped_function, "logical_or")
-        logical_and = partial(mapped_function, "logical_and")
-        any = partial(mapped_function, "any")
-        all = partial(mapped_function, "all")
-        str_join = partial(mapped_function, "str_join")
-        str_replace = partial(mapped_function, "str_replace")
-        str_match = partial(mapped_function, "str_match")
-        str_search = partial(mapped_function, "str_search")
-
-    return TreeTransformer
+@lru_cache(maxsize=4096)
+def _compile_string(expression: str) -> CompiledExpression:
+    return ExpressionCompiler().transform(_parse_string(expression))
 
 
 def parse(expression: Union[str, Tree]) -> Tree:
     """
-    Parse an expression from the transformation language
+    Parse an expression from the transformation language. The result for each
+    distinct expression is cached so the same tree is returned each time.
 
     :param expression: The expression to pass
 
@@ -552,18 +820,62 @@ def parse(expression: Union[str, Tree]) -> Tree:
     if not isinstance(expression, str):
         return expression
 
-    try:
-        return parser.parse(expression)
-    except lark_exceptions.UnexpectedCharacters as e:
-        raise UnexpectedCharacters(
-            expression, expression[e.pos_in_stream], e.column
-        )
+    return _parse_string(expression)
+
+
+def compile_expression(
+    expression: Union[str, Tree, Any]
+) -> CompiledExpression:
+    """
+    Compiles an expression from the transformation language into a function
+    that can be called for each row. Values that are not expressions are
+    compiled into a function returning the value unchanged. Compiled string
+    expressions are cached so repeated expressions are only compiled once.
+
+    :param expression: The expression or parsed tree to compile
+
+    :return: The compiled expression
+    """
+    if isinstance(expression, str):
+        return _compile_string(expression)
+
+    if not isinstance(expression, Tree):
+        return Constant(expression)
+
+    return ExpressionCompiler().transform(expression)
+
+
+def get_lookups(expression: Union[str, Tree, Any]) -> Set[str]:
+    """
+    Gets the names of all the columns looked up by an expression
+
+    :param expression: The expression or parsed tree
+
+    :return: The set of column names
+    """
+    if not isinstance(expression, (str, Tree)):
+        return set()
+
+    names = set()
+    trees = [parse(expression)]
+    while trees:
+        tree = trees.pop()
+        if tree.data == "lookup":
+            (name,) = tree.children
+            if isinstance(name, Tree):
+                # lookup('...') has the name as a parsed string
+                name = ExpressionCompiler().parse_string(*name.children)
+            names.add(str(name))
+        else:
+            trees.extend(c for c in tree.children if isinstance(c, Tree))
+
+    return names
 
 
 def transform(
     row,
     tree: Tree,
-    transformer_mapping: TransformerMapping = None,
+    transformer_mapping: Optional[TransformerMapping] = None,
 ):
     """
     Performs the transformation on the row
@@ -574,16 +886,15 @@ def transform(
 
     :return: The transformation result
     """
-    transformer_class = create_transformer_class(row, transformer_mapping)
-    transformer = transformer_class()
-
-    return transformer.transform(tree)
+    return compile_expression(tree)(
+        row, get_transformer_mapping(transformer_mapping)
+    )
 
 
 def run(
     row,
     expression: Union[str, Tree],
-    transformer_mapping: TransformerMapping = None,
+    transformer_mapping: Optional[TransformerMapping] = None,
 ):
     """
     Runs a transformation expression on a row
@@ -597,6 +908,6 @@ def run(
     if not isinstance(expression, (str, Tree)):
         return expression
 
-    return transform(
-        row, parse(expression), transformer_mapping=transformer_mapping
+    return compile_expression(expression)(
+        row, get_transformer_mapping(transformer_mapping)
     )
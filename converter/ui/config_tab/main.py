@@ -7,6 +7,8 @@ from PySide6.QtWidgets import QPushButton, QVBoxLayout, QWidget
 from converter.connector import (
     BaseConnector,
     CsvConnector,
+    FeatherConnector,
+    ParquetConnector,
     PostgresConnector,
     SQLiteConnector,
     SQLServerConnector,
@@ -20,6 +22,8 @@ CONNECTOR_CLASSES: List[Type[BaseConnector]] = list(
     sorted(
         [
             CsvConnector,
+            FeatherConnector,
+            ParquetConnector,
             PostgresConnector,
             SQLiteConnector,
             SQLServerConnector,
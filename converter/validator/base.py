@@ -53,6 +53,11 @@ class ValidatorConfigEntry:
         self.operator = config.get("operator", "sum")
         self.group_by = config.get("group_by", None)
 
+        # count-unique entries can be estimated using a HyperLogLog sketch
+        # rather than storing every distinct value
+        self.approximate = config.get("approximate", False)
+        self.precision = config.get("precision", None)
+
     def __eq__(self, other):
         return all(
             [
@@ -60,6 +65,8 @@ class ValidatorConfigEntry:
                 self.fields == other.fields,
                 self.operator == other.operator,
                 self.group_by == other.group_by,
+                self.approximate == other.approximate,
+                self.precision == other.precision,
             ]
         )
 
@@ -127,17 +134,61 @@ class BaseValidator(Generic[DataType, GroupedDataType]):
         return ValidatorConfig(config_path)
 
     def run(self, data: DataType, fmt: str, version: str, file_type: str):
-        config = self.load_config(fmt, version, file_type)
+        return self.run_config(
+            data, self.load_config(fmt, version, file_type), fmt, file_type
+        )
 
+    def run_config(
+        self,
+        data: DataType,
+        config: Optional[ValidatorConfig],
+        fmt: str,
+        file_type: str,
+    ):
+        """
+        Runs each entry of the validation config against the data and logs
+        the results
+
+        :param data: The data to validate
+        :param config: The validation config, if ``None`` no validations are
+            run
+        :param fmt: The format of the data
+        :param file_type: The file type of the data
+
+        :return: The validation results
+        """
+        return self.log_result(
+            config,
+            fmt,
+            file_type,
+            [self.run_entry(data, entry) for entry in config.entries]
+            if config
+            else [],
+        )
+
+    def log_result(
+        self,
+        config: Optional[ValidatorConfig],
+        fmt: str,
+        file_type: str,
+        validations: List[ValidationResult],
+    ) -> ValidationLogEntry:
+        """
+        Logs the results of the validation entries
+
+        :param config: The validation config the results were created from
+        :param fmt: The format of the data
+        :param file_type: The file type of the data
+        :param validations: The results of each validation entry
+
+        :return: The validation log entry
+        """
         result: ValidationLogEntry = {
             "file_type": file_type,
             "format": fmt,
             "validation_file": config.path if config else None,
-            "validations": [],
+            "validations": validations,
         }
-        if config:
-            for entry in config.entries:
-                result["validations"].append(self.run_entry(data, entry))
 
         get_logger().info(yaml.safe_dump([result]))
         return result
@@ -0,0 +1,135 @@
+import math
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from pandas.util import hash_array
+
+
+#: The default number of bits of each hash used to select the register, the
+#: sketch uses ``2 ** precision`` registers with a standard error of about
+#: ``1.04 / sqrt(2 ** precision)`` (0.8% for the default)
+DEFAULT_PRECISION = 14
+
+
+def hash_values(values: pd.Series) -> np.ndarray:
+    """
+    Hashes each value in the series. Values are hashed by their string
+    representation so that the hashes don't depend on the type of the
+    column the values are stored in.
+
+    :param values: The values to hash
+
+    :return: The 64 bit hashes of the values
+    """
+    return hash_array(values.astype(str).to_numpy(dtype=object))
+
+
+def leading_zeros(values: np.ndarray) -> np.ndarray:
+    """
+    Counts the leading zero bits of each non zero 64 bit value.
+
+    :param values: The values to check
+
+    :return: The number of leading zeros in each value
+    """
+    values = values.copy()
+    zeros = np.zeros(len(values), dtype=np.uint8)
+    for shift in (32, 16, 8, 4, 2, 1):
+        top_is_zero = values < np.uint64(1 << (64 - shift))
+        zeros[top_is_zero] += shift
+        values[top_is_zero] <<= np.uint64(shift)
+
+    return zeros
+
+
+class HyperLogLog:
+    """
+    Sketch for estimating the number of distinct values in one or more
+    groups without storing the values. Sketches built from separate parts
+    of a dataset can be merged to give the same sketch as the whole dataset.
+
+    :param precision: The number of bits of each hash used to select the
+        register
+    :param registers: The initial registers of the sketch
+    """
+
+    def __init__(
+        self,
+        precision: int = DEFAULT_PRECISION,
+        registers: Optional[np.ndarray] = None,
+    ):
+        self.precision = precision
+        self.registers = (
+            registers
+            if registers is not None
+            else np.zeros(1 << precision, dtype=np.uint8)
+        )
+
+    @classmethod
+    def from_hashes(
+        cls,
+        hashes: np.ndarray,
+        groups: np.ndarray,
+        n_groups: int,
+        precision: int = DEFAULT_PRECISION,
+    ):
+        """
+        Builds a sketch for each group from the hashes of its values.
+
+        :param hashes: The hashes of the values
+        :param groups: The group number of each hash
+        :param n_groups: The total number of groups
+        :param precision: The number of bits of each hash used to select the
+            register
+
+        :return: A list of the sketches for each group
+        """
+        registers = np.zeros((n_groups, 1 << precision), dtype=np.uint8)
+
+        register = (hashes >> np.uint64(64 - precision)).astype(np.intp)
+        # the bit after the register bits is set so that the rank is at most
+        # ``65 - precision``
+        remaining = (hashes << np.uint64(precision)) | np.uint64(
+            1 << (precision - 1)
+        )
+        np.maximum.at(
+            registers, (groups, register), leading_zeros(remaining) + 1
+        )
+
+        return [cls(precision, r) for r in registers]
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """
+        Merges the sketches giving a sketch of the distinct values in
+        either.
+
+        :param other: The sketch to merge with
+
+        :return: The merged sketch
+        """
+        if other.precision != self.precision:
+            raise ValueError("Only sketches with the same precision can merge")
+
+        return HyperLogLog(
+            self.precision, np.maximum(self.registers, other.registers)
+        )
+
+    def estimate(self) -> int:
+        """
+        Estimates the number of distinct values added to the sketch.
+
+        :return: The estimated number of distinct values
+        """
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = (
+            alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(int)))
+        )
+
+        empty = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and empty:
+            # linear counting is more accurate for small cardinalities
+            estimate = m * math.log(m / empty)
+
+        return int(round(estimate))
@@ -1,22 +1,36 @@
 from itertools import product
-from typing import List, Union
+from typing import Any, Dict, List, Optional, Union
 from uuid import uuid4
 
+import numpy as np
 import pandas as pd
 from pandas.core.groupby.generic import DataFrameGroupBy
 
 from converter.validator.base import (
     BaseValidator,
+    ValidationLogEntry,
     ValidationResult,
     ValidationResultEntry,
     ValidatorConfigEntry,
 )
+from converter.validator.hyperloglog import (
+    DEFAULT_PRECISION,
+    HyperLogLog,
+    hash_values,
+)
 
 
 class PandasValidator(BaseValidator):
     def run_entry(
         self, data: pd.DataFrame, entry: ValidatorConfigEntry
     ) -> ValidationResult:
+        if entry.operator == "count-unique" and entry.approximate:
+            # the estimate is built the same way as when the data is
+            # processed in chunks so that both give the same results
+            accumulator = self.get_accumulator(entry)
+            accumulator.add(data)
+            return accumulator.result()
+
         fields = set(entry.fields + (entry.group_by or []))
 
         if not entry.fields:
@@ -33,6 +47,28 @@ class PandasValidator(BaseValidator):
         else:
             return super().run_entry(data[fields], entry)
 
+    def get_accumulator(
+        self, entry: ValidatorConfigEntry
+    ) -> "PandasEntryAccumulator":
+        """
+        Gets the accumulator used to build the result of the entry from
+        chunks of the data
+
+        :param entry: The validation entry to accumulate
+
+        :return: The accumulator for the entry's operator
+        """
+        if entry.operator == "sum":
+            return PandasSumAccumulator(self, entry)
+        elif entry.operator == "count":
+            return PandasCountAccumulator(self, entry)
+        elif entry.operator == "count-unique" and entry.approximate:
+            return PandasApproximateCountUniqueAccumulator(self, entry)
+        elif entry.operator == "count-unique":
+            return PandasCountUniqueAccumulator(self, entry)
+        else:
+            return PandasEntryAccumulator(self, entry)
+
     def group_data(
         self,
         data: pd.DataFrame,
@@ -104,3 +140,371 @@ class PandasValidator(BaseValidator):
             results.append(res_entry)
 
         return results
+
+
+class PandasEntryAccumulator:
+    """
+    Builds the result of a validation entry from chunks of a dataset. Each
+    chunk is reduced to a partial result which is combined with the
+    partial results of the previous chunks so only the partial results are
+    kept in memory.
+
+    The base accumulator is used for unknown operators and produces the
+    same error as running the entry on the whole dataset.
+
+    :param validator: The validator the entry belongs to
+    :param entry: The validation entry to accumulate
+    """
+
+    def __init__(
+        self, validator: PandasValidator, entry: ValidatorConfigEntry
+    ):
+        self.validator = validator
+        self.entry = entry
+        self.group_by: List[str] = entry.group_by or []
+
+        # if no fields are selected a temp column of ones is used so that
+        # counts can still be performed
+        self.fields: List[str] = entry.fields or [uuid4().hex]
+        self.state: Any = None
+
+    def select(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Selects the columns of the data needed by the entry
+
+        :param data: The chunk of data
+
+        :return: The group and field columns of the chunk
+        """
+        selected = data[list(dict.fromkeys(self.group_by + self.entry.fields))]
+        if not self.entry.fields:
+            selected = selected.assign(**{self.fields[0]: 1})
+
+        return selected
+
+    def add(self, data: pd.DataFrame):
+        """
+        Adds a chunk of data to the partial result
+
+        :param data: The chunk of data
+        """
+        partial = self.reduce(self.select(data))
+        self.state = (
+            partial
+            if self.state is None
+            else self.combine(self.state, partial)
+        )
+
+    def merge(self, other: "PandasEntryAccumulator"):
+        """
+        Merges the partial result of another accumulator for the same entry
+        into this one
+
+        :param other: The accumulator to merge
+        """
+        if other.state is None:
+            return
+
+        self.state = (
+            other.state
+            if self.state is None
+            else self.combine(self.state, other.state)
+        )
+
+    def result(self) -> ValidationResult:
+        """
+        Builds the validation result from the partial results of all the
+        chunks added
+
+        :return: The validation result for the entry
+        """
+        state = self.state
+        if state is None:
+            state = self.reduce(
+                self.select(
+                    pd.DataFrame(columns=self.group_by + self.entry.fields)
+                )
+            )
+
+        return ValidationResult(
+            name=self.entry.validator_name,
+            operator=self.entry.operator,
+            entries=self.finalize(state),
+        )
+
+    def reduce(self, data: pd.DataFrame) -> Any:
+        """
+        Reduces a chunk of data to a partial result
+
+        :param data: The selected columns of the chunk
+
+        :return: The partial result
+        """
+        return None
+
+    def combine(self, state: Any, partial: Any) -> Any:
+        """
+        Combines two partial results
+
+        :param state: The current partial result
+        :param partial: The partial result to combine with
+
+        :return: The combined partial result
+        """
+        return None
+
+    def finalize(self, state: Any) -> List[ValidationResultEntry]:
+        """
+        Converts the partial result into the result entries
+
+        :param state: The partial result of all the chunks
+
+        :return: The result entries
+        """
+        return [{"error": "Unknown operator"}]  # type: ignore
+
+
+class PandasSumAccumulator(PandasEntryAccumulator):
+    """
+    Accumulates the sum of each field. The partial result is a row of
+    running totals for each group.
+    """
+
+    def reduce(self, data: pd.DataFrame) -> pd.DataFrame:
+        if self.group_by:
+            return data.groupby(self.group_by).sum()
+
+        return data.sum().to_frame().transpose()
+
+    def combine(self, state: pd.DataFrame, partial: pd.DataFrame) -> Any:
+        # chunks where all the groups are null have no totals and are
+        # skipped so that their empty columns don't change the column types
+        if partial.empty or state.empty:
+            return state if partial.empty else partial
+
+        # the running totals are summed in the order the chunks were added
+        # so that object columns are summed in the same order as the whole
+        # dataset
+        return self.reduce(
+            pd.concat(
+                [state.reset_index(), partial.reset_index()]
+                if self.group_by
+                else [state, partial]
+            )
+        )
+
+    def finalize(self, state: pd.DataFrame) -> List[ValidationResultEntry]:
+        return self.validator._generate_result(state, self.entry)
+
+
+class PandasCountAccumulator(PandasEntryAccumulator):
+    """
+    Accumulates the number of non null values of each field. The partial
+    result is the count for each group.
+    """
+
+    def reduce(self, data: pd.DataFrame) -> pd.DataFrame:
+        if self.group_by:
+            return data.groupby(self.group_by).count()
+
+        return data.count().to_frame().transpose()
+
+    def combine(self, state: pd.DataFrame, partial: pd.DataFrame) -> Any:
+        if partial.empty or state.empty:
+            return state if partial.empty else partial
+
+        if self.group_by:
+            return (
+                pd.concat([state, partial])
+                .groupby(level=list(range(len(self.group_by))))
+                .sum()
+            )
+
+        return state + partial
+
+    def finalize(self, state: pd.DataFrame) -> List[ValidationResultEntry]:
+        return self.validator._generate_result(state, self.entry)
+
+
+class PandasCountUniqueAccumulator(PandasEntryAccumulator):
+    """
+    Accumulates the number of distinct values of each field. The partial
+    result is the distinct combinations of the groups and each field.
+    """
+
+    def reduce(self, data: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        return {
+            field: data[
+                list(dict.fromkeys(self.group_by + [field]))
+            ].drop_duplicates()
+            for field in self.fields
+        }
+
+    def combine(
+        self,
+        state: Dict[str, pd.DataFrame],
+        partial: Dict[str, pd.DataFrame],
+    ) -> Any:
+        return {
+            field: pd.concat([state[field], partial[field]]).drop_duplicates()
+            for field in self.fields
+        }
+
+    def finalize(
+        self, state: Dict[str, pd.DataFrame]
+    ) -> List[ValidationResultEntry]:
+        if self.group_by:
+            counts = pd.DataFrame(
+                {
+                    field: values.groupby(self.group_by)[field].nunique()
+                    for field, values in state.items()
+                }
+            )
+        else:
+            counts = pd.DataFrame(
+                {
+                    field: [values[field].nunique()]
+                    for field, values in state.items()
+                }
+            )
+
+        return self.validator._generate_result(counts, self.entry)
+
+
+class PandasApproximateCountUniqueAccumulator(PandasEntryAccumulator):
+    """
+    Estimates the number of distinct values of each field using a
+    HyperLogLog sketch so that memory doesn't grow with the number of
+    distinct values. The partial result is a sketch for each group and
+    field. Values are compared by their string representation.
+    """
+
+    @property
+    def precision(self) -> int:
+        return self.entry.precision or DEFAULT_PRECISION
+
+    def reduce(self, data: pd.DataFrame) -> Dict[str, Dict[Any, HyperLogLog]]:
+        if self.group_by:
+            grouped = data.groupby(self.group_by, sort=False)
+            keys = list(grouped.size().index)
+            groups = grouped.ngroup().to_numpy()
+        else:
+            keys = [None]
+            groups = np.zeros(len(data), dtype=np.intp)
+
+        state = {}
+        for field in self.fields:
+            # nulls aren't counted and rows with null groups are excluded
+            # in the same way as ``nunique``
+            selected = data[field].notna().to_numpy() & (groups >= 0)
+            sketches = HyperLogLog.from_hashes(
+                hash_values(data[field][selected]),
+                groups[selected].astype(np.intp),
+                len(keys),
+                self.precision,
+            )
+            state[field] = dict(zip(keys, sketches))
+
+        return state
+
+    def combine(
+        self,
+        state: Dict[str, Dict[Any, HyperLogLog]],
+        partial: Dict[str, Dict[Any, HyperLogLog]],
+    ) -> Any:
+        combined = {}
+        for field in self.fields:
+            sketches = dict(state[field])
+            for key, sketch in partial[field].items():
+                sketches[key] = (
+                    sketches[key].merge(sketch) if key in sketches else sketch
+                )
+            combined[field] = sketches
+
+        return combined
+
+    def finalize(
+        self, state: Dict[str, Dict[Any, HyperLogLog]]
+    ) -> List[ValidationResultEntry]:
+        keys = list(state[self.fields[0]])
+        index: Optional[pd.Index] = None
+        if len(self.group_by) > 1:
+            index = pd.MultiIndex.from_tuples(keys, names=self.group_by)
+        elif self.group_by:
+            index = pd.Index(keys, name=self.group_by[0])
+
+        counts = pd.DataFrame(
+            {
+                field: [sketches[key].estimate() for key in keys]
+                for field, sketches in state.items()
+            },
+            index=index,
+        )
+        if self.group_by:
+            counts = counts.sort_index()
+
+        return self.validator._generate_result(counts, self.entry)
+
+
+class PandasValidationCollector:
+    """
+    Collects the partial results of each validation entry for a dataset
+    that is processed in chunks so that the validation can be completed
+    once all chunks have been processed without keeping the chunks in
+    memory.
+
+    :param validator: The validator to run
+    :param fmt: The format of the data
+    :param version: The version of the format
+    :param file_type: The file type of the data
+    """
+
+    def __init__(
+        self,
+        validator: PandasValidator,
+        fmt: str,
+        version: str,
+        file_type: str,
+    ):
+        self.validator = validator
+        self.fmt = fmt
+        self.file_type = file_type
+        self.config = validator.load_config(fmt, version, file_type)
+        self.accumulators = [
+            validator.get_accumulator(entry)
+            for entry in (self.config.entries if self.config else [])
+        ]
+
+    def add(self, chunk: pd.DataFrame):
+        """
+        Adds the chunk to the partial results of each entry
+
+        :param chunk: The chunk of data to add
+        """
+        for accumulator in self.accumulators:
+            accumulator.add(chunk)
+
+    def merge(self, other: "PandasValidationCollector"):
+        """
+        Merges the partial results of another collector for the same
+        validation config into this one
+
+        :param other: The collector to merge
+        """
+        for accumulator, other_accumulator in zip(
+            self.accumulators, other.accumulators
+        ):
+            accumulator.merge(other_accumulator)
+
+    def run(self) -> ValidationLogEntry:
+        """
+        Completes the validation from the partial results of all the chunks
+
+        :return: The validation results
+        """
+        return self.validator.log_result(
+            self.config,
+            self.fmt,
+            self.file_type,
+            [accumulator.result() for accumulator in self.accumulators],
+        )
@@ -0,0 +1,134 @@
+"""
+Compares the pre-generated standalone LALR parser with a parser built by
+lark from the same grammar when it is imported. Both parsers are timed on
+every distinct transformation and ``when`` expression in the bundled and
+example mapping files.
+
+This requires ``lark-parser`` to be installed and is run from the root of
+the repository::
+
+    python docs/benchmarks/parser.py
+"""
+import glob
+import os
+import subprocess
+import sys
+import time
+
+import yaml
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+IMPORT_STATEMENTS = {
+    "lark": (
+        "import lark; "
+        "from converter.transformers.grammar import _grammar; "
+        "lark.Lark(_grammar, parser='lalr')"
+    ),
+    "standalone": "from converter.transformers.grammar import parser",
+}
+
+
+def find_expressions(value):
+    """
+    Finds all the transformation and when expressions in a loaded mapping
+
+    :param value: The loaded mapping or part of it
+
+    :return: A generator of the expressions
+    """
+    if isinstance(value, dict):
+        for k, v in value.items():
+            if k in ("transformation", "when") and isinstance(v, str):
+                yield v
+            else:
+                yield from find_expressions(v)
+    elif isinstance(value, list):
+        for v in value:
+            yield from find_expressions(v)
+
+
+def load_expressions():
+    """
+    Loads the distinct expressions from the bundled and example mappings,
+    files that can't be loaded are skipped
+
+    :return: The sorted list of expressions
+    """
+    expressions = set()
+    for pattern in (
+        "converter/data/mappings/**/*.yaml",
+        "examples/**/*.yaml",
+        "examples/**/*.yml",
+    ):
+        for path in glob.glob(os.path.join(ROOT, pattern), recursive=True):
+            with open(path) as f:
+                try:
+                    expressions.update(find_expressions(yaml.safe_load(f)))
+                except yaml.YAMLError:
+                    # some of the examples aren't valid yaml
+                    continue
+
+    return sorted(expressions)
+
+
+def time_import(name):
+    """
+    Times importing the parser in a fresh interpreter so that nothing is
+    already imported
+
+    :param name: The name of the parser to import
+
+    :return: The time taken in seconds
+    """
+    statement = (
+        "import time; start = time.perf_counter(); "
+        f"{IMPORT_STATEMENTS[name]}; "
+        "print(time.perf_counter() - start)"
+    )
+    output = subprocess.check_output(
+        [sys.executable, "-c", statement], cwd=ROOT
+    )
+    return float(output)
+
+
+def time_parse(parser, expressions):
+    """
+    Times parsing each of the expressions once
+
+    :param parser: The parser to use
+    :param expressions: The expressions to parse
+
+    :return: The time taken in seconds
+    """
+    start = time.perf_counter()
+    for expression in expressions:
+        parser.parse(expression)
+    return time.perf_counter() - start
+
+
+def main():
+    sys.path.insert(0, ROOT)
+
+    import lark
+
+    from converter.transformers.grammar import _grammar, parser
+
+    expressions = load_expressions()
+    parsers = {
+        "lark": lark.Lark(_grammar, parser="lalr"),
+        "standalone": parser,
+    }
+
+    print(f"{len(expressions)} distinct expressions")
+    for name, p in parsers.items():
+        print(
+            f"{name:>10}: "
+            f"import {time_import(name) * 1000:.1f}ms, "
+            f"parse {time_parse(p, expressions) * 1000:.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
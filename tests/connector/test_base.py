@@ -1,7 +1,9 @@
+import pandas as pd
 import pytest
 
 from converter.connector import BaseConnector
 from tests.config.fakes import fake_transformation_config
+from tests.connector.fakes import FakeConnector
 
 
 def test_extract_is_not_implemented():
@@ -14,6 +16,48 @@ def test_load_is_not_implemented():
         BaseConnector(fake_transformation_config()).load([])
 
 
+def test_load_batches___rows_match_iterrows():
+    batches = [
+        pd.DataFrame({"a": [1, 2], "b": [1.5, 2.5]}),
+        pd.DataFrame({"a": [3], "b": ["c"]}),
+        pd.DataFrame({"a": [4]}, dtype=object).assign(b=None),
+    ]
+
+    loader = FakeConnector()
+    loader.load_batches(batches)
+
+    assert loader.data == [
+        r.to_dict() for batch in batches for _, r in batch.iterrows()
+    ]
+    assert loader.data[0] == {"a": 1.0, "b": 1.5}
+
+
+def test_extract_batches_no_batch_size___rows_are_extracted_as_one_batch():
+    data = [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}, {"a": 3, "b": "z"}]
+
+    batches = list(FakeConnector(data=data).extract_batches())
+
+    assert len(batches) == 1
+    assert batches[0].to_dict("records") == data
+    assert list(batches[0].dtypes) == [object, object]
+
+
+def test_extract_batches_with_batch_size___rows_are_split_into_batches():
+    data = [{"a": i} for i in range(5)]
+
+    batches = list(FakeConnector(data=data).extract_batches(2))
+
+    assert [b.to_dict("records") for b in batches] == [
+        data[:2],
+        data[2:4],
+        data[4:],
+    ]
+
+
+def test_extract_batches_with_batch_size_no_data___no_batches_are_extracted():
+    assert list(FakeConnector(data=[]).extract_batches(2)) == []
+
+
 @pytest.mark.asyncio
 async def test_aextract_is_not_implemented():
     with pytest.raises(NotImplementedError):
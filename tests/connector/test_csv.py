@@ -1,10 +1,17 @@
 import csv
+import datetime
+import gzip
 import os
+import zipfile
 from tempfile import NamedTemporaryFile, TemporaryDirectory
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from converter.connector import CsvConnector
+from converter.files.compression import infer_compression, open_compressed
+from converter.types.notset import NotSet
 from tests.config.fakes import fake_transformation_config
 
 
@@ -97,3 +104,440 @@ def test_data_is_passed_to_loader_no_header___data_is_written_to_file():
                 )
                 == expected_data
             )
+
+
+@pytest.mark.parametrize("quoting", ["all", "minimal", "nonnumeric"])
+@pytest.mark.parametrize(
+    "format_options",
+    [
+        {},
+        {"format_workers": 2},
+        {"format_workers": 2, "format_executor": "process"},
+    ],
+)
+def test_batches_are_passed_to_loader___file_matches_loading_rows(
+    quoting, format_options
+):
+    batches = [
+        pd.DataFrame({"a": [1, 2], "b": [1.5, None]}),
+        pd.DataFrame({"a": [], "b": []}),
+        pd.DataFrame({"a": [3, None], "b": ["c", NotSet]}, dtype=object),
+        pd.DataFrame({"a": [0.1, 1e20], "b": [float("nan"), -2.5]}),
+        pd.DataFrame({"a": [True, 4], "b": ['q"x', "d,e\nf"]}),
+        pd.DataFrame(
+            {"a": [np.int64(5), ""], "b": [np.float64(0.5), "g"]},
+            dtype=object,
+        ),
+        pd.DataFrame({"a": [pd.NaT], "b": [datetime.date(2020, 1, 2)]}),
+    ]
+
+    with TemporaryDirectory() as p:
+        rows_path = os.path.join(p, "rows.csv")
+        batches_path = os.path.join(p, "batches.csv")
+
+        CsvConnector(
+            fake_transformation_config(), path=rows_path, quoting=quoting
+        ).load(r.to_dict() for batch in batches for _, r in batch.iterrows())
+        CsvConnector(
+            fake_transformation_config(),
+            path=batches_path,
+            quoting=quoting,
+            **format_options,
+        ).load_batches(batches)
+
+        with open(rows_path, newline="") as rows_file, open(
+            batches_path, newline=""
+        ) as batches_file:
+            assert rows_file.read() == batches_file.read()
+
+
+def test_single_empty_column___file_matches_loading_rows():
+    batch = pd.DataFrame({"a": ["", None, NotSet]}, dtype=object)
+
+    with TemporaryDirectory() as p:
+        rows_path = os.path.join(p, "rows.csv")
+        batches_path = os.path.join(p, "batches.csv")
+
+        CsvConnector(
+            fake_transformation_config(), path=rows_path, quoting="minimal"
+        ).load(r.to_dict() for _, r in batch.iterrows())
+        CsvConnector(
+            fake_transformation_config(),
+            path=batches_path,
+            quoting="minimal",
+        ).load_batches([batch])
+
+        with open(rows_path, newline="") as rows_file, open(
+            batches_path, newline=""
+        ) as batches_file:
+            assert (
+                rows_file.read()
+                == batches_file.read()
+                == 'a\r\n""\r\n""\r\n""\r\n'
+            )
+
+
+def test_no_batches_are_passed_to_loader___no_file_is_written():
+    with TemporaryDirectory() as p:
+        output_path = os.path.join(p, "result.csv")
+
+        CsvConnector(
+            fake_transformation_config(), path=output_path
+        ).load_batches([pd.DataFrame({"a": []})])
+
+        assert not os.path.exists(output_path)
+
+
+def write_csv(path, rows, quoting=csv.QUOTE_MINIMAL):
+    with open(path, "w", newline="") as f:
+        csv.writer(f, quoting=quoting).writerows(rows)
+
+
+@pytest.mark.parametrize("batch_size", [None, 1, 2])
+def test_columnar_read___batches_match_rows(batch_size):
+    with TemporaryDirectory() as p:
+        path = os.path.join(p, "data.csv")
+        write_csv(
+            path,
+            [
+                ["a", "b"],
+                ["1", "x,y"],
+                ["", 'q"uote'],
+                ["2.5", "new\nline"],
+            ],
+        )
+
+        connector = CsvConnector(
+            fake_transformation_config(), path=path, quoting="minimal"
+        )
+        batches = list(connector.extract_batches(batch_size))
+
+        assert all(len(b) <= (batch_size or 3) for b in batches)
+        assert (
+            pd.concat(batches).to_dict("records")
+            == list(connector.extract())
+            == [
+                {"a": "1", "b": "x,y"},
+                {"a": "", "b": 'q"uote'},
+                {"a": "2.5", "b": "new\nline"},
+            ]
+        )
+
+
+def test_columnar_read_with_block_size___batches_are_block_size():
+    with TemporaryDirectory() as p:
+        path = os.path.join(p, "data.csv")
+        write_csv(path, [["a"]] + [[str(i)] for i in range(5)])
+
+        connector = CsvConnector(
+            fake_transformation_config(),
+            path=path,
+            quoting="minimal",
+            block_size=2,
+        )
+
+        assert [len(b) for b in connector.extract_batches()] == [2, 2, 1]
+        assert [len(b) for b in connector.extract_batches(10)] == [2, 2, 1]
+
+
+def test_usecols_is_set___only_selected_columns_are_read():
+    with TemporaryDirectory() as p:
+        path = os.path.join(p, "data.csv")
+        write_csv(path, [["a", "b", "c"], ["1", "2", "3"], ["4", "5", "6"]])
+
+        connector = CsvConnector(
+            fake_transformation_config(),
+            path=path,
+            quoting="minimal",
+            usecols="c, a",
+        )
+        expected = [{"a": "1", "c": "3"}, {"a": "4", "c": "6"}]
+
+        assert list(connector.extract()) == expected
+        assert (
+            pd.concat(connector.extract_batches()).to_dict("records")
+            == expected
+        )
+
+
+def test_usecols_column_is_missing___error_is_raised():
+    with TemporaryDirectory() as p:
+        path = os.path.join(p, "data.csv")
+        write_csv(path, [["a"], ["1"]])
+
+        connector = CsvConnector(
+            fake_transformation_config(), path=path, usecols=["a", "b"]
+        )
+
+        with pytest.raises(ValueError):
+            list(connector.extract())
+
+
+def test_nonnumeric_quoting___batches_are_read_from_rows():
+    with TemporaryDirectory() as p:
+        path = os.path.join(p, "data.csv")
+        write_csv(path, [["a", "b"], [1, "1"]], quoting=csv.QUOTE_NONNUMERIC)
+
+        connector = CsvConnector(fake_transformation_config(), path=path)
+
+        assert pd.concat(connector.extract_batches()).to_dict("records") == [
+            {"a": 1.0, "b": "1"}
+        ]
+
+
+def test_columnar_read_empty_file___no_batches_are_read():
+    with TemporaryDirectory() as p:
+        path = os.path.join(p, "data.csv")
+        write_csv(path, [])
+
+        connector = CsvConnector(
+            fake_transformation_config(), path=path, quoting="minimal"
+        )
+
+        assert list(connector.extract_batches()) == []
+
+
+@pytest.mark.parametrize("parse_range_size", [1, 10, 1000])
+@pytest.mark.parametrize("line_terminator", ["\n", "\r\n"])
+def test_parse_workers_is_set___batches_match_single_process(
+    parse_range_size, line_terminator
+):
+    with TemporaryDirectory() as p:
+        path = os.path.join(p, "data.csv")
+        with open(path, "w", newline="") as f:
+            csv.writer(f, lineterminator=line_terminator).writerows(
+                [["a", "b"]]
+                + [
+                    [str(i), ["x,y", 'q"uote', "new\nline", "", "\r\n"][i % 5]]
+                    for i in range(20)
+                ]
+            )
+
+        connector = CsvConnector(
+            fake_transformation_config(),
+            path=path,
+            quoting="minimal",
+            block_size=3,
+        )
+        parallel_connector = CsvConnector(
+            fake_transformation_config(),
+            path=path,
+            quoting="minimal",
+            block_size=3,
+            parse_workers=2,
+        )
+        parallel_connector.parse_range_size = parse_range_size
+        batches = list(parallel_connector.extract_batches())
+
+        assert all(len(b) <= 3 for b in batches)
+        assert pd.concat(batches, ignore_index=True).equals(
+            pd.concat(connector.extract_batches(), ignore_index=True)
+        )
+
+
+def test_parse_workers_is_set_with_usecols___only_selected_columns_are_read():
+    with TemporaryDirectory() as p:
+        path = os.path.join(p, "data.csv")
+        write_csv(path, [["a", "b", "c"], ["1", "2", "3"], ["4", "5", "6"]])
+
+        connector = CsvConnector(
+            fake_transformation_config(),
+            path=path,
+            quoting="minimal",
+            usecols="c, a",
+            parse_workers=2,
+        )
+
+        assert pd.concat(connector.extract_batches()).to_dict("records") == [
+            {"a": "1", "c": "3"},
+            {"a": "4", "c": "6"},
+        ]
+
+
+@pytest.mark.parametrize("rows", [[], [["a", "b"]]])
+def test_parse_workers_is_set_no_data___no_batches_are_read(rows):
+    with TemporaryDirectory() as p:
+        path = os.path.join(p, "data.csv")
+        write_csv(path, rows)
+
+        connector = CsvConnector(
+            fake_transformation_config(),
+            path=path,
+            quoting="minimal",
+            parse_workers=2,
+        )
+
+        assert list(connector.extract_batches()) == []
+
+
+@pytest.mark.parametrize("extension", [".gz", ".bz2", ".xz", ".zst", ".zip"])
+@pytest.mark.parametrize("compression_workers", [None, 2])
+def test_compressed_file___data_matches_uncompressed_file(
+    extension, compression_workers
+):
+    if extension == ".zst":
+        pytest.importorskip("zstandard")
+
+    batches = [
+        pd.DataFrame({"a": [1, None], "b": ["x,y", "new\nline"]}),
+        pd.DataFrame({"a": [2.5, 3], "b": ['q"uote', ""]}),
+    ]
+
+    with TemporaryDirectory() as p:
+        path = os.path.join(p, "data.csv")
+        CsvConnector(
+            fake_transformation_config(), path=path, quoting="minimal"
+        ).load_batches(batches)
+
+        compressed_path = path + extension
+        CsvConnector(
+            fake_transformation_config(),
+            path=compressed_path,
+            quoting="minimal",
+            compression_workers=compression_workers,
+        ).load_batches(batches)
+
+        with open(path, newline="") as f, open_compressed(
+            compressed_path,
+            compression=infer_compression(compressed_path),
+            newline="",
+        ) as compressed_f:
+            assert compressed_f.read() == f.read()
+
+        connector = CsvConnector(
+            fake_transformation_config(), path=path, quoting="minimal"
+        )
+        compressed_connector = CsvConnector(
+            fake_transformation_config(),
+            path=compressed_path,
+            quoting="minimal",
+        )
+
+        assert list(compressed_connector.extract()) == list(
+            connector.extract()
+        )
+        assert pd.concat(compressed_connector.extract_batches(1)).equals(
+            pd.concat(connector.extract_batches(1))
+        )
+
+
+def test_compression_is_set___extension_is_not_used():
+    with TemporaryDirectory() as p:
+        path = os.path.join(p, "data.csv")
+        CsvConnector(
+            fake_transformation_config(), path=path, compression="gzip"
+        ).load([{"a": "1"}])
+
+        with gzip.open(path, "rt", newline="") as f:
+            assert f.read() == '"a"\r\n"1"\r\n'
+
+        assert list(
+            CsvConnector(
+                fake_transformation_config(), path=path, compression="gzip"
+            ).extract()
+        ) == [{"a": "1"}]
+
+
+def test_zip_archive_has_several_files___selected_file_is_read():
+    with TemporaryDirectory() as p:
+        path = os.path.join(p, "data.zip")
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr("first.csv", "a\r\n1\r\n")
+            archive.writestr("second.csv", "b\r\n2\r\n")
+
+        connector = CsvConnector(
+            fake_transformation_config(), path=path, quoting="minimal"
+        )
+        with pytest.raises(ValueError):
+            list(connector.extract())
+
+        connector = CsvConnector(
+            fake_transformation_config(),
+            path=path,
+            quoting="minimal",
+            archive_member="second.csv",
+        )
+        assert list(connector.extract()) == [{"b": "2"}]
+        assert pd.concat(connector.extract_batches()).to_dict("records") == [
+            {"b": "2"}
+        ]
+
+
+@pytest.mark.parametrize("read_workers", [None, 1, 3])
+@pytest.mark.parametrize("quoting", ["minimal", "nonnumeric"])
+def test_path_is_a_pattern___files_are_read_in_name_order(
+    read_workers, quoting
+):
+    with TemporaryDirectory() as p:
+        for i in [3, 1, 4, 2]:
+            write_csv(
+                os.path.join(p, f"data_{i}.csv"),
+                [["a"]] + [[f"{i}-{j}"] for j in range(i)],
+                quoting=csv.QUOTE_NONNUMERIC,
+            )
+
+        connector = CsvConnector(
+            fake_transformation_config(),
+            path=os.path.join(p, "data_*.csv"),
+            quoting=quoting,
+            block_size=2,
+            read_workers=read_workers,
+        )
+        expected = [{"a": f"{i}-{j}"} for i in range(1, 5) for j in range(i)]
+
+        assert list(connector.extract()) == expected
+        assert (
+            pd.concat(connector.extract_batches()).to_dict("records")
+            == expected
+        )
+
+
+@pytest.mark.parametrize("read_workers", [None, 2])
+def test_path_is_a_list_with_source_column___paths_are_read_in_order(
+    read_workers,
+):
+    with TemporaryDirectory() as p:
+        paths = [os.path.join(p, n) for n in ["b.csv", "a.csv.gz"]]
+        write_csv(paths[0], [["a"], ["1"], ["2"]])
+        with gzip.open(paths[1], "wt", newline="") as f:
+            csv.writer(f).writerows([["a"], ["3"]])
+
+        connector = CsvConnector(
+            fake_transformation_config(),
+            path=paths,
+            quoting="minimal",
+            read_workers=read_workers,
+            source_column="file",
+        )
+        expected = [
+            {"a": "1", "file": paths[0]},
+            {"a": "2", "file": paths[0]},
+            {"a": "3", "file": paths[1]},
+        ]
+
+        assert list(connector.extract()) == expected
+        assert (
+            pd.concat(connector.extract_batches(1)).to_dict("records")
+            == expected
+        )
+
+
+def test_pattern_matches_no_files___error_is_raised():
+    with TemporaryDirectory() as p:
+        connector = CsvConnector(
+            fake_transformation_config(), path=os.path.join(p, "*.csv")
+        )
+
+        with pytest.raises(FileNotFoundError):
+            list(connector.extract_batches())
+
+
+@pytest.mark.parametrize("path", ["*.csv", ["a.csv", "b.csv"]])
+def test_path_is_a_pattern_or_list___data_cant_be_loaded(path):
+    connector = CsvConnector(fake_transformation_config(), path=path)
+
+    with pytest.raises(ValueError):
+        connector.load([{"a": 1}])
+
+    with pytest.raises(ValueError):
+        connector.load_batches([pd.DataFrame({"a": [1]})])
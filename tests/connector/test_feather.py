@@ -0,0 +1,103 @@
+import os
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pytest
+
+from converter.connector import FeatherConnector
+from converter.types.notset import NotSet
+from tests.config.fakes import fake_transformation_config
+
+
+@pytest.mark.parametrize("fmt", ["file", "stream"])
+@pytest.mark.parametrize("compression", ["none", "lz4", "zstd"])
+def test_batches_are_loaded___batches_are_extracted(fmt, compression):
+    batches = [
+        pd.DataFrame({"a": [1, 2, 3], "b": ["x", None, NotSet]}),
+        pd.DataFrame({"a": [4, np.nan], "b": ["y", "z"]}),
+    ]
+
+    with TemporaryDirectory() as p:
+        path = os.path.join(p, "data.arrow")
+        FeatherConnector(
+            fake_transformation_config(),
+            path=path,
+            format=fmt,
+            compression=compression,
+        ).load_batches(batches)
+
+        connector = FeatherConnector(fake_transformation_config(), path=path)
+
+        batches = list(connector.extract_batches())
+
+        assert [len(b) for b in batches] == [3, 2]
+        assert pd.concat(batches, ignore_index=True).equals(
+            pd.DataFrame(
+                {"a": [1, 2, 3, 4, np.nan], "b": ["x", None, None, "y", "z"]}
+            )
+        )
+
+
+def test_feather_file_is_written___file_is_read_by_pyarrow():
+    with TemporaryDirectory() as p:
+        path = os.path.join(p, "data.feather")
+        FeatherConnector(fake_transformation_config(), path=path).load(
+            [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}]
+        )
+
+        assert feather.read_table(path).to_pydict() == {
+            "a": [1, 2],
+            "b": ["x", "y"],
+        }
+
+
+@pytest.mark.parametrize("batch_size", [None, 1, 3])
+def test_batches_are_larger_than_batch_size___batches_are_split(batch_size):
+    with TemporaryDirectory() as p:
+        path = os.path.join(p, "data.feather")
+        feather.write_feather(
+            pa.table({"a": range(10)}), path, chunksize=4, compression=None
+        )
+
+        connector = FeatherConnector(
+            fake_transformation_config(), path=path, block_size=5
+        )
+        batches = list(connector.extract_batches(batch_size))
+
+        assert all(len(b) <= (batch_size or 5) for b in batches)
+        assert list(pd.concat(batches)["a"]) == list(range(10))
+
+
+def test_used_columns_are_given___only_used_columns_are_read():
+    with TemporaryDirectory() as p:
+        path = os.path.join(p, "data.feather")
+        feather.write_feather(pa.table({"a": [1], "b": [2], "c": [3]}), path)
+
+        connector = FeatherConnector(fake_transformation_config(), path=path)
+        (batch,) = connector.extract_batches(columns=["c", "a", "missing"])
+
+        assert batch.to_dict("records") == [{"a": 1, "c": 3}]
+
+
+def test_columns_column_is_missing___error_is_raised():
+    with TemporaryDirectory() as p:
+        path = os.path.join(p, "data.feather")
+        feather.write_feather(pa.table({"a": [1]}), path)
+
+        connector = FeatherConnector(
+            fake_transformation_config(), path=path, columns=["a", "b"]
+        )
+
+        with pytest.raises(ValueError):
+            list(connector.extract())
+
+
+def test_no_data_is_passed_to_loader___no_file_is_written():
+    with TemporaryDirectory() as p:
+        path = os.path.join(p, "data.feather")
+        FeatherConnector(fake_transformation_config(), path=path).load([])
+
+        assert not os.path.exists(path)
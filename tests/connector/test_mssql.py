@@ -0,0 +1,103 @@
+import os
+from tempfile import TemporaryDirectory
+
+import pyodbc
+import pytest
+
+from converter.connector.db import SQLServerConnector
+from converter.connector.db.mssql import parameter_type
+from converter.types.notset import NotSet
+from tests.config.fakes import fake_transformation_config
+
+
+class FakeCursor:
+    def __init__(self, calls):
+        self.calls = calls
+        self.fast_executemany = None
+
+    def setinputsizes(self, sizes):
+        self.calls.append(("setinputsizes", sizes))
+
+    def executemany(self, sql, params):
+        self.calls.append(
+            ("executemany", self.fast_executemany, sql, list(params))
+        )
+
+
+class FakeConnection:
+    def __init__(self):
+        self.calls = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def cursor(self):
+        return FakeCursor(self.calls)
+
+
+class FakeSQLServerConnector(SQLServerConnector):
+    def __init__(self, conn, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.conn = conn
+
+    def _create_connection(self, database):
+        return self.conn
+
+
+@pytest.mark.parametrize(
+    "values,expected",
+    [
+        ([None, None], None),
+        ([True, None, False], (pyodbc.SQL_BIT, 0, 0)),
+        ([1, None, 2], (pyodbc.SQL_BIGINT, 0, 0)),
+        ([1, 2.5], (pyodbc.SQL_DOUBLE, 0, 0)),
+        (["a", None, "ab\U0001f600"], (pyodbc.SQL_WVARCHAR, 4, 0)),
+        (["a" * 4001], (pyodbc.SQL_WVARCHAR, 0, 0)),
+        (["a", 1], None),
+    ],
+)
+def test_parameter_type___type_fits_all_values(values, expected):
+    assert parameter_type(values) == expected
+
+
+@pytest.mark.parametrize("fast_executemany", [False, True])
+def test_data_is_loaded___batches_are_executed(fast_executemany):
+    with TemporaryDirectory() as p:
+        sql_statement = os.path.join(p, "insert.sql")
+        with open(sql_statement, "w") as f:
+            f.write("INSERT INTO a (x, y) VALUES (:x, :y)")
+
+        conn = FakeConnection()
+        FakeSQLServerConnector(
+            conn,
+            fake_transformation_config(),
+            database="db",
+            sql_statement=sql_statement,
+            insert_batch_size=2,
+            fast_executemany=fast_executemany,
+        ).load(
+            [{"x": 1, "y": "a"}, {"x": 2, "y": NotSet}, {"x": 3, "y": "bc"}]
+        )
+
+        sql = "INSERT INTO a (x, y) VALUES (?, ?)"
+        if fast_executemany:
+            assert conn.calls == [
+                (
+                    "setinputsizes",
+                    [(pyodbc.SQL_BIGINT, 0, 0), (pyodbc.SQL_WVARCHAR, 1, 0)],
+                ),
+                ("executemany", True, sql, [[1, "a"], [2, None]]),
+                (
+                    "setinputsizes",
+                    [(pyodbc.SQL_BIGINT, 0, 0), (pyodbc.SQL_WVARCHAR, 2, 0)],
+                ),
+                ("executemany", True, sql, [[3, "bc"]]),
+            ]
+        else:
+            assert conn.calls == [
+                ("executemany", False, sql, [[1, "a"], [2, NotSet]]),
+                ("executemany", False, sql, [[3, "bc"]]),
+            ]
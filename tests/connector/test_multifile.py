@@ -0,0 +1,42 @@
+import threading
+
+import pandas as pd
+import pytest
+
+from converter.connector.multifile import read_files
+
+
+def read_numbers(path):
+    for i in range(int(path)):
+        yield pd.DataFrame({"n": [i]})
+
+
+@pytest.mark.parametrize("workers", [0, 1, 2, 8])
+def test_files_are_read___batches_are_in_path_order(workers):
+    batches = read_files(["3", "0", "5", "1"], read_numbers, workers, "src")
+
+    assert pd.concat(batches).to_dict("records") == [
+        {"n": n, "src": p} for p in ["3", "0", "5", "1"] for n in range(int(p))
+    ]
+
+
+def test_file_read_fails___error_is_raised_after_earlier_files():
+    def read(path):
+        if path == "bad":
+            raise ValueError(path)
+
+        yield from read_numbers(path)
+
+    batches = iter(read_files(["2", "bad", "3"], read, 2))
+
+    assert len(next(batches)) == len(next(batches)) == 1
+    with pytest.raises(ValueError):
+        next(batches)
+
+
+def test_consumer_stops_early___readers_are_stopped():
+    batches = iter(read_files(["1000"] * 4, read_numbers, 2))
+    next(batches)
+    batches.close()
+
+    assert threading.active_count() == 1
@@ -0,0 +1,236 @@
+import os
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from converter.connector import ParquetConnector
+from converter.types.notset import NotSet
+from tests.config.fakes import fake_transformation_config
+
+
+def write_parquet(path, data, row_group_size=None):
+    pq.write_table(
+        pa.Table.from_pandas(data, preserve_index=False),
+        path,
+        row_group_size=row_group_size,
+    )
+
+
+def test_file_contains_data___all_entries_are_extracted():
+    with TemporaryDirectory() as p:
+        path = os.path.join(p, "data.parquet")
+        write_parquet(path, pd.DataFrame({"a": [1, 2], "b": ["x", None]}))
+
+        connector = ParquetConnector(fake_transformation_config(), path=path)
+
+        assert list(connector.extract()) == [
+            {"a": 1, "b": "x"},
+            {"a": 2, "b": None},
+        ]
+
+
+@pytest.mark.parametrize("batch_size", [None, 1, 3])
+def test_file_has_row_groups___batches_are_at_most_batch_size(batch_size):
+    with TemporaryDirectory() as p:
+        path = os.path.join(p, "data.parquet")
+        write_parquet(path, pd.DataFrame({"a": range(10)}), row_group_size=4)
+
+        connector = ParquetConnector(
+            fake_transformation_config(), path=path, block_size=5
+        )
+        batches = list(connector.extract_batches(batch_size))
+
+        assert all(len(b) <= (batch_size or 5) for b in batches)
+        assert list(pd.concat(batches)["a"]) == list(range(10))
+
+
+def test_used_columns_are_given___only_used_columns_are_read():
+    with TemporaryDirectory() as p:
+        path = os.path.join(p, "data.parquet")
+        write_parquet(path, pd.DataFrame({"a": [1], "b": [2], "c": [3]}))
+
+        connector = ParquetConnector(fake_transformation_config(), path=path)
+        (batch,) = connector.extract_batches(columns=["c", "a", "missing"])
+
+        assert batch.to_dict("records") == [{"a": 1, "c": 3}]
+
+
+def test_columns_is_set___only_selected_columns_are_read():
+    with TemporaryDirectory() as p:
+        path = os.path.join(p, "data.parquet")
+        write_parquet(path, pd.DataFrame({"a": [1], "b": [2], "c": [3]}))
+
+        connector = ParquetConnector(
+            fake_transformation_config(), path=path, columns="c, a"
+        )
+
+        assert list(connector.extract()) == [{"a": 1, "c": 3}]
+
+
+def test_columns_column_is_missing___error_is_raised():
+    with TemporaryDirectory() as p:
+        path = os.path.join(p, "data.parquet")
+        write_parquet(path, pd.DataFrame({"a": [1]}))
+
+        connector = ParquetConnector(
+            fake_transformation_config(), path=path, columns=["a", "b"]
+        )
+
+        with pytest.raises(ValueError):
+            list(connector.extract())
+
+
+@pytest.mark.parametrize(
+    "filters,expected",
+    [
+        ([["a", ">=", 7]], [7, 8, 9]),
+        ([["a", "in", [1, 4]], ["b", "==", "x"]], [1]),
+        ([[["a", "<", 1]], [["a", ">", 8]]], [0, 9]),
+    ],
+)
+def test_filters_are_set___matching_rows_are_read(filters, expected):
+    with TemporaryDirectory() as p:
+        path = os.path.join(p, "data.parquet")
+        write_parquet(
+            path,
+            pd.DataFrame({"a": range(10), "b": ["y", "x"] * 5}),
+            row_group_size=3,
+        )
+
+        connector = ParquetConnector(
+            fake_transformation_config(), path=path, filters=filters
+        )
+
+        assert [r["a"] for r in connector.extract()] == expected
+
+
+@pytest.mark.parametrize("compression", ["none", "snappy", "gzip", "zstd"])
+def test_batches_are_loaded___file_has_row_groups_and_compression(
+    compression,
+):
+    batches = [
+        pd.DataFrame({"a": [1, 2, 3], "b": ["x", None, NotSet]}),
+        pd.DataFrame({"a": [4, np.nan], "b": ["y", "z"]}),
+    ]
+
+    with TemporaryDirectory() as p:
+        path = os.path.join(p, "data.parquet")
+        connector = ParquetConnector(
+            fake_transformation_config(),
+            path=path,
+            row_group_size=2,
+            compression=compression,
+        )
+        connector.load_batches(batches)
+
+        metadata = pq.ParquetFile(path).metadata
+        assert [
+            metadata.row_group(i).num_rows
+            for i in range(metadata.num_row_groups)
+        ] == [2, 2, 1]
+        assert metadata.row_group(0).column(0).compression == (
+            "UNCOMPRESSED" if compression == "none" else compression.upper()
+        )
+        assert pq.read_table(path).to_pydict() == {
+            "a": [1, 2, 3, 4, None],
+            "b": ["x", None, None, "y", "z"],
+        }
+
+
+def test_column_types_differ___first_row_group_sets_the_type():
+    with TemporaryDirectory() as p:
+        path = os.path.join(p, "data.parquet")
+        connector = ParquetConnector(
+            fake_transformation_config(), path=path, row_group_size=2
+        )
+        connector.load(
+            [
+                {"a": 1, "b": None, "c": 1},
+                {"a": "x", "b": None, "c": 2},
+                {"a": 2, "b": "y", "c": 3.0},
+            ]
+        )
+
+        table = pq.read_table(path)
+        assert table.schema.types == [pa.string(), pa.string(), pa.int64()]
+        assert table.to_pydict() == {
+            "a": ["1", "x", "2"],
+            "b": [None, None, "y"],
+            "c": [1, 2, 3],
+        }
+
+
+def test_values_cant_be_converted_to_column_type___error_is_raised():
+    with TemporaryDirectory() as p:
+        path = os.path.join(p, "data.parquet")
+        connector = ParquetConnector(
+            fake_transformation_config(), path=path, row_group_size=1
+        )
+
+        with pytest.raises(ValueError):
+            connector.load([{"a": 1}, {"a": "x"}])
+
+
+def test_no_data_is_passed_to_loader___no_file_is_written():
+    with TemporaryDirectory() as p:
+        path = os.path.join(p, "data.parquet")
+        ParquetConnector(fake_transformation_config(), path=path).load([])
+
+        assert not os.path.exists(path)
+
+
+@pytest.mark.parametrize("read_workers", [None, 1, 3])
+def test_path_is_a_pattern___files_are_read_in_name_order(read_workers):
+    with TemporaryDirectory() as p:
+        for i in [3, 1, 4, 2]:
+            write_parquet(
+                os.path.join(p, f"data_{i}.parquet"),
+                pd.DataFrame({"a": [i] * i, "b": range(i)}),
+                row_group_size=1,
+            )
+
+        connector = ParquetConnector(
+            fake_transformation_config(),
+            path=os.path.join(p, "data_*.parquet"),
+            filters=[["b", "<", 3]],
+            read_workers=read_workers,
+            source_column="file",
+        )
+
+        assert [
+            (r["a"], r["b"], os.path.basename(r["file"]))
+            for r in connector.extract()
+        ] == [
+            (i, j, f"data_{i}.parquet")
+            for i in range(1, 5)
+            for j in range(min(i, 3))
+        ]
+
+
+@pytest.mark.parametrize("read_workers", [None, 2])
+def test_path_is_a_list_with_missing_file___error_is_raised(read_workers):
+    with TemporaryDirectory() as p:
+        path = os.path.join(p, "data.parquet")
+        write_parquet(path, pd.DataFrame({"a": [1]}))
+
+        connector = ParquetConnector(
+            fake_transformation_config(),
+            path=[path, os.path.join(p, "missing.parquet")],
+            read_workers=read_workers,
+        )
+
+        with pytest.raises(FileNotFoundError):
+            list(connector.extract_batches())
+
+
+def test_path_is_a_pattern___data_cant_be_loaded():
+    connector = ParquetConnector(
+        fake_transformation_config(), path="*.parquet"
+    )
+
+    with pytest.raises(ValueError):
+        connector.load([{"a": 1}])
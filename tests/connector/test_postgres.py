@@ -0,0 +1,207 @@
+import os
+import threading
+from tempfile import TemporaryDirectory
+
+import pandas as pd
+import pytest
+
+from converter.connector.db import PostgresConnector
+from converter.connector.db.errors import DBQueryError
+from converter.connector.db.postgres import copy_target, format_copy_rows
+from converter.types.notset import NotSet
+from tests.config.fakes import fake_transformation_config
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def execute(self, sql, params=None):
+        self.conn.calls.append(("execute", sql))
+
+    def executemany(self, sql, params):
+        self.conn.calls.append(("executemany", sql, list(params)))
+
+    def copy_expert(self, sql, f):
+        if "TO STDOUT" in sql:
+            self.conn.calls.append(("copy", sql))
+            if self.conn.error:
+                raise self.conn.error
+            f.write(self.conn.output.encode())
+        else:
+            self.conn.calls.append(("copy", sql, f.read()))
+            if self.conn.error:
+                raise self.conn.error
+
+
+class FakeConnection:
+    encoding = "UTF8"
+
+    def __init__(self, output="", error=None):
+        self.output = output
+        self.error = error
+        self.calls = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def cursor(self, **kwargs):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.calls.append(("commit",))
+
+
+class FakePostgresConnector(PostgresConnector):
+    def __init__(self, conn, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.conn = conn
+
+    def _create_connection(self, database):
+        return self.conn
+
+
+def create_connector(p, sql, conn, **options):
+    sql_statement = os.path.join(p, "statement.sql")
+    with open(sql_statement, "w") as f:
+        f.write(sql)
+
+    return FakePostgresConnector(
+        conn,
+        fake_transformation_config(),
+        database="db",
+        sql_statement=sql_statement,
+        use_copy=True,
+        **options,
+    )
+
+
+@pytest.mark.parametrize(
+    "statement,expected",
+    [
+        (
+            'INSERT INTO public."B" (c, d) VALUES (:id, :c);',
+            ('public."B"', "c, d", ["id", "c"]),
+        ),
+        (
+            "insert into rev(a,b)\nvalues (%(a)s, %(b)s)",
+            ("rev", "a,b", ["a", "b"]),
+        ),
+        ("INSERT INTO a (b) VALUES (:b + 1)", None),
+        ("INSERT INTO a (b, c) VALUES (:b)", None),
+        ("INSERT INTO a SELECT * FROM b", None),
+        ("DELETE FROM a", None),
+    ],
+)
+def test_copy_target___statement_is_parsed(statement, expected):
+    assert copy_target(statement) == expected
+
+
+def test_format_copy_rows___values_are_escaped_and_nulls_are_marked():
+    rows = [
+        {"a": 1, "b": "tab\there", "c": None},
+        {"a": float("nan"), "b": "back\\slash\nline", "c": NotSet},
+    ]
+
+    assert format_copy_rows(rows, ["c", "a", "b", "missing"]) == (
+        "\\N\t1\ttab\\there\t\\N\n" "\\N\tNaN\tback\\\\slash\\nline\t\\N\n"
+    )
+
+
+def test_use_copy_is_set___inserts_are_copied_in_batches():
+    with TemporaryDirectory() as p:
+        conn = FakeConnection()
+        connector = create_connector(
+            p,
+            "DELETE FROM a;\n"
+            "INSERT INTO a (x, y) VALUES (:x, :y);\n"
+            "INSERT INTO b (x) VALUES (:x + 1);",
+            conn,
+            insert_batch_size=2,
+        )
+        connector.load({"x": i, "y": str(i)} for i in range(3))
+
+        assert conn.calls == [
+            ("execute", "DELETE FROM a;"),
+            ("copy", "COPY a (x, y) FROM STDIN", "0\t0\n1\t1\n"),
+            (
+                "executemany",
+                "INSERT INTO b (x) VALUES (%(x)s + 1);",
+                [{"x": 0}, {"x": 1}],
+            ),
+            ("copy", "COPY a (x, y) FROM STDIN", "2\t2\n"),
+            (
+                "executemany",
+                "INSERT INTO b (x) VALUES (%(x)s + 1);",
+                [{"x": 2}],
+            ),
+        ]
+
+
+def test_copy_fails___batch_is_reported():
+    with TemporaryDirectory() as p:
+        connector = create_connector(
+            p,
+            "INSERT INTO a (x) VALUES (:x)",
+            FakeConnection(error=ValueError()),
+        )
+
+        with pytest.raises(DBQueryError) as e:
+            connector.load([{"x": 1}])
+
+        assert e.value.batch == 1
+        assert e.value.data == [{"x": 1}]
+
+
+@pytest.mark.parametrize("batch_size", [None, 1, 2])
+def test_use_copy_is_set___result_is_copied_and_parsed_in_batches(
+    batch_size,
+):
+    with TemporaryDirectory() as p:
+        conn = FakeConnection('a,b\n1,""\n2,\\N\n3,"x,\\N"\n')
+        connector = create_connector(p, "SELECT a, b FROM t;\n", conn)
+        batches = list(connector.extract_batches(batch_size))
+
+        assert conn.calls == [
+            (
+                "copy",
+                "COPY (SELECT a, b FROM t) TO STDOUT "
+                "WITH (FORMAT csv, HEADER, NULL '\\N')",
+            )
+        ]
+        assert all(len(b) <= (batch_size or 3) for b in batches)
+        assert pd.concat(batches).to_dict("records") == [
+            {"a": "1", "b": ""},
+            {"a": "2", "b": None},
+            {"a": "3", "b": "x,\\N"},
+        ]
+        assert list(connector.extract()) == [
+            {"a": "1", "b": ""},
+            {"a": "2", "b": None},
+            {"a": "3", "b": "x,\\N"},
+        ]
+
+
+def test_copy_from_select_fails___error_is_raised():
+    with TemporaryDirectory() as p:
+        connector = create_connector(
+            p, "SELECT a FROM t", FakeConnection(error=ValueError())
+        )
+
+        with pytest.raises(DBQueryError):
+            list(connector.extract_batches())
+
+
+def test_consumer_stops_early___copy_is_stopped():
+    with TemporaryDirectory() as p:
+        connector = create_connector(
+            p, "SELECT a FROM t", FakeConnection("a\n" + "x\n" * 100000)
+        )
+        batches = iter(connector.extract_batches(10))
+        next(batches)
+        batches.close()
+
+        assert threading.active_count() == 1
@@ -0,0 +1,243 @@
+import os
+import sqlite3
+from tempfile import TemporaryDirectory
+
+import pandas as pd
+import pytest
+
+from converter.connector.db import SQLiteConnector
+from converter.connector.db.errors import DBQueryError
+from tests.config.fakes import fake_transformation_config
+
+
+class FetchCountingCursor:
+    def __init__(self, cur, fetches):
+        self.cur = cur
+        self.fetches = fetches
+
+    def execute(self, sql):
+        return self.cur.execute(sql)
+
+    def fetchmany(self, size):
+        rows = self.cur.fetchmany(size)
+        self.fetches.append(len(rows))
+        return rows
+
+
+class FetchCountingConnector(SQLiteConnector):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fetches = []
+
+    def _get_select_cursor(self, conn):
+        return FetchCountingCursor(
+            super()._get_select_cursor(conn), self.fetches
+        )
+
+
+def create_connector(p, connector_class=SQLiteConnector, **options):
+    database = os.path.join(p, "data.sqlite")
+    with sqlite3.connect(database) as conn:
+        conn.execute("CREATE TABLE data (a INTEGER, b TEXT)")
+        conn.executemany(
+            "INSERT INTO data VALUES (?, ?)", [(i, str(i)) for i in range(5)]
+        )
+    conn.close()
+
+    sql_statement = os.path.join(p, "select.sql")
+    with open(sql_statement, "w") as f:
+        f.write("SELECT a, b FROM data ORDER BY a")
+
+    return connector_class(
+        fake_transformation_config(),
+        database=database,
+        sql_statement=sql_statement,
+        **options,
+    )
+
+
+@pytest.mark.parametrize("fetch_size", [None, 1, 2, 5])
+def test_fetch_size_is_set___all_rows_are_extracted(fetch_size):
+    with TemporaryDirectory() as p:
+        connector = create_connector(p, fetch_size=fetch_size)
+
+        assert list(connector.extract()) == [
+            {"a": i, "b": str(i)} for i in range(5)
+        ]
+
+
+def test_rows_are_extracted___rows_are_yielded_as_they_are_fetched():
+    with TemporaryDirectory() as p:
+        connector = create_connector(p, FetchCountingConnector, fetch_size=2)
+        rows = connector.extract()
+
+        assert next(rows) == {"a": 0, "b": "0"}
+        assert connector.fetches == [2]
+
+        assert len(list(rows)) == 4
+        assert connector.fetches == [2, 2, 1, 0]
+
+
+def create_loader(
+    p, sql="INSERT INTO a VALUES (:a);\nINSERT INTO b VALUES (:b);", **options
+):
+    database = os.path.join(p, "output.sqlite")
+    with sqlite3.connect(database) as conn:
+        conn.execute("CREATE TABLE a (a INTEGER PRIMARY KEY)")
+        conn.execute("CREATE TABLE b (b TEXT)")
+    conn.close()
+
+    sql_statement = os.path.join(p, "insert.sql")
+    with open(sql_statement, "w") as f:
+        f.write(sql)
+
+    return (
+        SQLiteConnector(
+            fake_transformation_config(),
+            database=database,
+            sql_statement=sql_statement,
+            **options,
+        ),
+        database,
+    )
+
+
+def read_table(database, table):
+    with sqlite3.connect(database) as conn:
+        rows = [r[0] for r in conn.execute(f"SELECT * FROM {table}")]
+    conn.close()
+    return rows
+
+
+@pytest.mark.parametrize("insert_batch_size", [None, 1, 2, 10])
+@pytest.mark.parametrize("batches_per_commit", [None, 1, 2])
+def test_data_is_loaded___each_statement_inserts_all_rows(
+    insert_batch_size, batches_per_commit
+):
+    with TemporaryDirectory() as p:
+        connector, database = create_loader(
+            p,
+            insert_batch_size=insert_batch_size,
+            batches_per_commit=batches_per_commit,
+        )
+        connector.load({"a": i, "b": str(i)} for i in range(5))
+
+        assert read_table(database, "a") == list(range(5))
+        assert read_table(database, "b") == [str(i) for i in range(5)]
+
+
+@pytest.mark.parametrize(
+    "batches_per_commit,committed", [(None, []), (1, [0, 1]), (2, [])]
+)
+def test_insert_fails___batch_is_reported_and_committed_batches_are_kept(
+    batches_per_commit, committed
+):
+    with TemporaryDirectory() as p:
+        connector, database = create_loader(
+            p, insert_batch_size=2, batches_per_commit=batches_per_commit
+        )
+
+        with pytest.raises(DBQueryError) as e:
+            connector.load({"a": i % 3, "b": str(i)} for i in range(6))
+
+        assert e.value.batch == 2
+        assert e.value.data == [{"a": 2, "b": "2"}, {"a": 0, "b": "3"}]
+        assert read_table(database, "a") == committed
+
+
+def test_statements_without_parameters___statements_are_run_once():
+    with TemporaryDirectory() as p:
+        connector, database = create_loader(
+            p,
+            sql=(
+                "DELETE FROM b;\n"
+                "INSERT INTO a VALUES (:a);\n"
+                "UPDATE b SET b = b || '!';\n"
+                "INSERT INTO b VALUES (:b);"
+            ),
+            insert_batch_size=2,
+        )
+        connector.load([{"a": 0, "b": "0"}])
+        connector.load({"a": i, "b": str(i)} for i in range(1, 4))
+
+        assert read_table(database, "a") == [0, 1, 2, 3]
+        assert read_table(database, "b") == ["1!", "2!", "3!"]
+
+
+@pytest.mark.parametrize(
+    "fetch_size,batch_size", [(None, None), (2, 3), (3, 2)]
+)
+def test_batches_are_extracted___batches_are_fetched_rows(
+    fetch_size, batch_size
+):
+    with TemporaryDirectory() as p:
+        connector = create_connector(p, fetch_size=fetch_size)
+        batches = list(connector.extract_batches(batch_size))
+
+        assert [len(b) for b in batches] == (
+            [5] if fetch_size is None else [2, 2, 1]
+        )
+        assert all(b.dtypes.eq(object).all() for b in batches)
+        assert pd.concat(batches, ignore_index=True).to_dict("records") == [
+            {"a": i, "b": str(i)} for i in range(5)
+        ]
+
+
+def read_indexes(database):
+    with sqlite3.connect(database) as conn:
+        names = [
+            r[0]
+            for r in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' "
+                "AND sql IS NOT NULL ORDER BY name"
+            )
+        ]
+    conn.close()
+    return names
+
+
+@pytest.mark.parametrize("bulk_load", [False, True])
+def test_bulk_load_is_set___load_connection_uses_bulk_pragmas(bulk_load):
+    with TemporaryDirectory() as p:
+        connector, database = create_loader(p, bulk_load=bulk_load)
+        conn = connector._create_load_connection()
+
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == (
+            0 if bulk_load else 2
+        )
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == (
+            "memory" if bulk_load else "delete"
+        )
+        conn.close()
+
+        connector.load({"a": i, "b": str(i)} for i in range(3))
+        assert read_table(database, "a") == [0, 1, 2]
+
+
+@pytest.mark.parametrize("fail", [False, True])
+def test_defer_indexes_is_set___indexes_are_created_after_loading(fail):
+    with TemporaryDirectory() as p:
+        connector, database = create_loader(
+            p, defer_indexes=True, bulk_load=True
+        )
+        with sqlite3.connect(database) as conn:
+            conn.execute("CREATE INDEX b_index ON b (b)")
+            conn.execute("CREATE UNIQUE INDEX b_unique ON b (b)")
+        conn.close()
+
+        indexes_while_loading = []
+
+        def rows():
+            indexes_while_loading.extend(read_indexes(database))
+            yield {"a": 0, "b": "0"}
+            yield {"a": 0 if fail else 1, "b": "1"}
+
+        if fail:
+            with pytest.raises(DBQueryError):
+                connector.load(rows())
+        else:
+            connector.load(rows())
+
+        assert indexes_while_loading == ["b_unique"]
+        assert read_indexes(database) == ["b_index", "b_unique"]
+        assert read_table(database, "b") == ([] if fail else ["0", "1"])
@@ -1,7 +1,17 @@
+from functools import partial
+
 from hypothesis.strategies import sampled_from
 
 from converter.runner import DaskRunner, EagerRunner, ModinRunner, PandasRunner
 
 
 def runners():
-    return sampled_from([PandasRunner, ModinRunner, EagerRunner, DaskRunner])
+    return sampled_from(
+        [
+            PandasRunner,
+            partial(PandasRunner, chunk_size=2),
+            ModinRunner,
+            EagerRunner,
+            DaskRunner,
+        ]
+    )
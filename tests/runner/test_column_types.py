@@ -1,6 +1,8 @@
+import pandas as pd
 from hypothesis import given, settings
 
 from converter.mapping.base import ColumnConversion, TransformationEntry
+from converter.runner import PandasRunner
 from tests.config.fakes import fake_transformation_config
 from tests.connector.fakes import FakeConnector
 from tests.mapping.fakes import make_simple_mapping
@@ -103,3 +105,59 @@ def test_column_is_specified_as_string___values_are_changed_bad_are_excluded(
         {"b": None},
         {"b": "foo"},
     ]
+
+
+def test_row_is_bad_in_multiple_columns___error_is_logged_once(caplog):
+    input_df = pd.DataFrame(
+        {"a": ["1", "foo", "3"], "b": ["2", "bar", "baz"]}, dtype=object
+    )
+
+    coerced = PandasRunner(fake_transformation_config()).coerce_row_types(
+        input_df,
+        {
+            "a": ColumnConversion(type="int"),
+            "b": ColumnConversion(type="int"),
+        },
+    )
+
+    errors = [
+        r.getMessage()
+        for r in caplog.records
+        if r.funcName == "log_type_coercion_error"
+    ]
+    assert coerced.to_dict("list") == {"a": [1], "b": [2]}
+    assert errors == [
+        "Cannot coerce a (foo) to int. Reason: could not convert string to "
+        'float: \'foo\'. Row: {"a": "foo", "b": "bar"}.',
+        "Cannot coerce b (baz) to int. Reason: could not convert string to "
+        'float: \'baz\'. Row: {"a": "3", "b": "baz"}.',
+    ]
+
+
+def test_bad_values_in_input___errors_are_logged_once(caplog):
+    input_data = [
+        {"a": "1", "b": "2"},
+        {"a": "foo", "b": "bar"},
+        {"a": "3", "b": "baz"},
+    ]
+
+    mapping = make_simple_mapping(
+        {"c": [TransformationEntry(transformation="a + b")]},
+        types={
+            "a": ColumnConversion(type="int"),
+            "b": ColumnConversion(type="int"),
+        },
+    )
+
+    extractor = FakeConnector(data=input_data)
+    loader = FakeConnector()
+
+    PandasRunner(fake_transformation_config()).run(extractor, mapping, loader)
+
+    errors = [
+        r.getMessage()
+        for r in caplog.records
+        if r.funcName == "log_type_coercion_error"
+    ]
+    assert list(loader.data) == [{"c": 3}]
+    assert len(errors) == 2
@@ -1,11 +1,18 @@
 import os
 from tempfile import TemporaryDirectory
 
+import pandas as pd
+import pytest
+from hypothesis import given, settings
+
 from converter.files.yaml import write_yaml
 from converter.mapping import FileMapping
-from converter.runner import PandasRunner
+from converter.mapping.base import TransformationEntry
+from converter.runner import EagerRunner, PandasRunner, vectorized
+from converter.runner.pandas import ConstantColumn
 from converter.types.notset import NotSet
 from tests.config.fakes import fake_transformation_config
+from tests.runner.stategies import runners
 from tests.runner.test_base import FakeConnector
 
 
@@ -102,3 +109,359 @@ def test_runner_handles_when_secondary_cases_are_false():
             {"c": 10, "d": 9},
             {"c": 14, "d": 11},
         ]
+
+
+class RecordingPandasRunner(PandasRunner):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.evaluated_lengths = []
+
+    def evaluate_transformation_entry(self, input_df, entry):
+        self.evaluated_lengths.append(len(input_df))
+        return super().evaluate_transformation_entry(input_df, entry)
+
+
+def test_low_cardinality_column___expression_is_evaluated_per_value():
+    runner = RecordingPandasRunner(fake_transformation_config())
+    input_df = pd.DataFrame({"a": ["x", "y", "x", "x", "y", "z"] * 10})
+
+    result = runner.apply_transformation_entry(
+        input_df,
+        TransformationEntry(transformation="a + '!'", when="a is not 'z'"),
+    )
+
+    assert runner.evaluated_lengths == [3]
+    assert list(result.index) == list(input_df.index[input_df["a"] != "z"])
+    assert list(result) == [v + "!" for v in input_df["a"] if v != "z"]
+
+
+def test_low_cardinality_column_has_nulls___nulls_are_evaluated_directly():
+    runner = RecordingPandasRunner(fake_transformation_config())
+    input_df = pd.DataFrame({"a": ["x", None, "x", "y"] * 10}, dtype=object)
+
+    result = runner.apply_transformation_entry(
+        input_df, TransformationEntry(transformation="join('-', a, a)")
+    )
+
+    assert runner.evaluated_lengths == [2, 10]
+    assert list(result) == ["x-x", "None-None", "x-x", "y-y"] * 10
+
+
+def test_high_cardinality_column___expression_is_evaluated_per_row():
+    runner = RecordingPandasRunner(fake_transformation_config())
+    input_df = pd.DataFrame({"a": [str(i) for i in range(10)]})
+
+    result = runner.apply_transformation_entry(
+        input_df, TransformationEntry(transformation="a + '!'")
+    )
+
+    assert runner.evaluated_lengths == [10]
+    assert list(result) == [f"{i}!" for i in range(10)]
+
+
+def test_expression_uses_multiple_columns___expression_is_evaluated_per_row():
+    runner = RecordingPandasRunner(fake_transformation_config())
+    input_df = pd.DataFrame({"a": ["x"] * 10, "b": ["y"] * 10})
+
+    result = runner.apply_transformation_entry(
+        input_df, TransformationEntry(transformation="a + b")
+    )
+
+    assert runner.evaluated_lengths == [10]
+    assert list(result) == ["xy"] * 10
+
+
+def test_multiple_entries___first_matching_entry_is_used_for_each_row():
+    runner = PandasRunner(fake_transformation_config())
+    input_df = pd.DataFrame(
+        {"a": [1, 4, 7, 9, 1, 4], "b": ["x", "x", None, "x", "x", "x"]},
+        dtype=object,
+    )
+
+    result = runner.apply_column_transformation(
+        input_df,
+        [
+            TransformationEntry(transformation="a * 10", when="a lt 2"),
+            TransformationEntry(transformation="a * 100", when="a lt 5"),
+            TransformationEntry(transformation="a", when="a lt 5"),
+            TransformationEntry(transformation="b", when="a is 7"),
+            TransformationEntry(transformation="a + 1"),
+        ],
+    )
+
+    assert list(result.index) == list(input_df.index)
+    assert list(result[[0, 1, 3, 4, 5]]) == [10, 400, 10, 10, 400]
+    assert pd.isna(result[2])
+
+
+def test_transformation_is_constant___value_is_broadcast_to_every_row():
+    runner = PandasRunner(fake_transformation_config())
+    input_df = pd.DataFrame({"a": [1, 2, 3]}, dtype=object)
+
+    result = runner.apply_column_transformation(
+        input_df, [TransformationEntry(transformation="'1'")]
+    )
+
+    assert isinstance(result, ConstantColumn)
+    assert result.value == "1"
+    assert list(result.index) == list(input_df.index)
+
+
+def test_columns_cover_different_rows___missing_rows_are_not_set():
+    runner = PandasRunner(fake_transformation_config())
+    input_df = pd.DataFrame({"a": [1, 2, 3, 4]}, dtype=object)
+
+    result = runner.build_output(
+        input_df,
+        {
+            "b": pd.Series([10, 30], index=[0, 2]),
+            "c": ConstantColumn("x", input_df.index[1:]),
+            "d": NotSet,
+        },
+    )
+
+    assert list(result.index) == [0, 1, 2, 3]
+    assert result.to_dict("list") == {
+        "b": [10.0, NotSet, 30.0, NotSet],
+        "c": [NotSet, "x", "x", "x"],
+        "d": [NotSet] * 4,
+    }
+
+
+def test_numeric_column_has_nulls___nulls_match_object_implementation():
+    runner = PandasRunner(fake_transformation_config())
+    input_df = vectorized.to_typed_columns(
+        pd.DataFrame({"a": [1, None, 3, None]}, dtype=object)
+    )
+
+    assert vectorized.is_nullable(input_df["a"])
+
+    result = runner.apply_column_transformation(
+        input_df,
+        [
+            TransformationEntry(transformation="a * 2", when="a gt 1"),
+            TransformationEntry(transformation="a", when="a is not 1"),
+        ],
+    )
+
+    assert result.to_dict() == {1: None, 2: 6, 3: None}
+    assert type(result[2]) is int
+
+
+def test_chunk_size_is_set___chunks_are_indexed_by_row_position():
+    runner = PandasRunner(fake_transformation_config(), chunk_size=2)
+    extractor = FakeConnector(data=[{"a": i} for i in range(5)])
+
+    chunks = list(runner.get_dataframe_chunks(extractor))
+
+    assert [list(c.index) for c in chunks] == [[0, 1], [2, 3], [4]]
+    assert [list(c["a"]) for c in chunks] == [[0, 1], [2, 3], [4]]
+
+
+def test_chunk_size_is_set_no_data___no_chunks_are_generated():
+    runner = PandasRunner(fake_transformation_config(), chunk_size=2)
+
+    assert list(runner.get_dataframe_chunks(FakeConnector(data=[]))) == []
+
+
+def test_chunk_size_is_set_no_data___no_rows_are_loaded():
+    with TemporaryDirectory() as search:
+        write_yaml(
+            os.path.join(search, "A-B.yml"),
+            {
+                "file_type": "ACC",
+                "input_format": {"name": "A", "version": "1"},
+                "output_format": {"name": "B", "version": "1"},
+                "forward": {
+                    "types": {"a": {"type": "int"}},
+                    "transform": {"c": [{"transformation": "a * 2"}]},
+                },
+            },
+        )
+
+        mapping = FileMapping(
+            fake_transformation_config(),
+            "ACC",
+            standard_search_path=search,
+            search_working_dir=False,
+        )
+        loader = FakeConnector()
+
+        PandasRunner(fake_transformation_config(), chunk_size=2).run(
+            FakeConnector(data=[]), mapping, loader
+        )
+
+        assert list(loader.data) == []
+
+
+def test_chunk_size_is_set___output_matches_unchunked_run():
+    input_data = [{"a": i, "b": str(i % 3)} for i in range(7)]
+
+    with TemporaryDirectory() as search:
+        write_yaml(
+            os.path.join(search, "A-B.yml"),
+            {
+                "file_type": "ACC",
+                "input_format": {"name": "A", "version": "1"},
+                "output_format": {"name": "B", "version": "1"},
+                "forward": {
+                    "types": {"a": {"type": "int"}},
+                    "transform": {
+                        "c": [
+                            {"transformation": "a * 2", "when": "b is '1'"},
+                            {"transformation": "a"},
+                        ],
+                        "d": [{"transformation": "b"}],
+                    },
+                },
+            },
+        )
+
+        mapping = FileMapping(
+            fake_transformation_config(),
+            "ACC",
+            standard_search_path=search,
+            search_working_dir=False,
+        )
+
+        expected_loader = FakeConnector()
+        PandasRunner(fake_transformation_config()).run(
+            FakeConnector(data=input_data), mapping, expected_loader
+        )
+
+        chunked_loader = FakeConnector()
+        PandasRunner(fake_transformation_config(), chunk_size=3).run(
+            FakeConnector(data=input_data), mapping, chunked_loader
+        )
+
+        assert list(chunked_loader.data) == list(expected_loader.data)
+
+
+class FakeBatchConnector(FakeConnector):
+    def __init__(self, batches=None, **options):
+        super().__init__(**options)
+        self.batches = batches or []
+
+    def extract(self):
+        raise NotImplementedError()
+
+    def extract_batches(self, batch_size=None, columns=None):
+        self.columns = columns
+        return iter(self.batches)
+
+    def load_batches(self, batches):
+        self.batches = list(batches)
+
+
+def test_loader_accepts_batches___transformed_chunks_are_passed_to_loader():
+    input_data = [{"a": i} for i in range(7)]
+
+    with TemporaryDirectory() as search:
+        write_yaml(
+            os.path.join(search, "A-B.yml"),
+            {
+                "file_type": "ACC",
+                "input_format": {"name": "A", "version": "1"},
+                "output_format": {"name": "B", "version": "1"},
+                "forward": {
+                    "types": {"a": {"type": "int"}},
+                    "transform": {"c": [{"transformation": "a * 2"}]},
+                },
+            },
+        )
+
+        mapping = FileMapping(
+            fake_transformation_config(),
+            "ACC",
+            standard_search_path=search,
+            search_working_dir=False,
+        )
+        loader = FakeBatchConnector()
+
+        PandasRunner(fake_transformation_config(), chunk_size=3).run(
+            FakeConnector(data=input_data), mapping, loader
+        )
+
+        assert [list(b.index) for b in loader.batches] == [
+            [0, 1, 2],
+            [3, 4, 5],
+            [6],
+        ]
+        assert list(pd.concat(loader.batches)["c"]) == [
+            i * 2 for i in range(7)
+        ]
+
+
+@given(runner_class=runners().filter(lambda r: r is not EagerRunner))
+@settings(deadline=None, max_examples=10)
+def test_extractor_provides_batches___batches_are_transformed(runner_class):
+    batches = [
+        pd.DataFrame({"a": [0, 1, 2]}),
+        pd.DataFrame({"a": [3]}),
+        pd.DataFrame({"a": [4, 5]}),
+    ]
+
+    with TemporaryDirectory() as search:
+        write_yaml(
+            os.path.join(search, "A-B.yml"),
+            {
+                "file_type": "ACC",
+                "input_format": {"name": "A", "version": "1"},
+                "output_format": {"name": "B", "version": "1"},
+                "forward": {
+                    "types": {"a": {"type": "int"}},
+                    "transform": {"c": [{"transformation": "a * 2"}]},
+                },
+            },
+        )
+
+        mapping = FileMapping(
+            fake_transformation_config(),
+            "ACC",
+            standard_search_path=search,
+            search_working_dir=False,
+        )
+        loader = FakeConnector()
+
+        runner_class(fake_transformation_config()).run(
+            FakeBatchConnector(batches=batches), mapping, loader
+        )
+
+        assert loader.data == [{"c": i * 2} for i in range(6)]
+
+
+@pytest.mark.parametrize("chunk_size", [None, 2])
+def test_extractor_provides_batches___used_columns_are_requested(chunk_size):
+    with TemporaryDirectory() as search:
+        write_yaml(
+            os.path.join(search, "A-B.yml"),
+            {
+                "file_type": "ACC",
+                "input_format": {"name": "A", "version": "1"},
+                "output_format": {"name": "B", "version": "1"},
+                "forward": {
+                    "types": {"a": {"type": "int"}},
+                    "transform": {
+                        "c": [{"transformation": "b * 2", "when": "d is 1"}]
+                    },
+                },
+            },
+        )
+
+        mapping = FileMapping(
+            fake_transformation_config(),
+            "ACC",
+            standard_search_path=search,
+            search_working_dir=False,
+        )
+        extractor = FakeBatchConnector(
+            batches=[pd.DataFrame({"a": [1], "b": [2], "d": [1]})]
+        )
+        loader = FakeConnector()
+
+        PandasRunner(fake_transformation_config(), chunk_size=chunk_size).run(
+            extractor, mapping, loader
+        )
+
+        assert extractor.columns == ["a", "b", "d"]
+        assert loader.data == [{"c": 4}]
@@ -126,6 +126,46 @@ def test_transform_contains_replace_with_multiple_pairs(runner_class):
     ]
 
 
+@given(runner_class=runners())
+@settings(deadline=None)
+def test_transform_contains_replace_with_literal_code_pairs(runner_class):
+    input_data = [
+        {"a": "0300"},
+        {"a": "0301"},
+        {"a": "0300301"},
+        {"a": "x"},
+    ]
+
+    mapping = make_simple_mapping(
+        {
+            "c": [
+                TransformationEntry(
+                    transformation="""
+                        replace(
+                            a,
+                            '0300', '1000',
+                            '0301', '1050',
+                            'x', 'y'
+                        )
+                    """,
+                )
+            ],
+        }
+    )
+
+    extractor = FakeConnector(data=input_data)
+    loader = FakeConnector()
+
+    runner_class(fake_transformation_config()).run(extractor, mapping, loader)
+
+    assert list(loader.data) == [
+        {"c": "1000"},
+        {"c": "1050"},
+        {"c": "1001050"},
+        {"c": "y"},
+    ]
+
+
 @given(runner_class=runners())
 @settings(deadline=None)
 def test_when_contains_match(runner_class):
@@ -0,0 +1,224 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from converter.runner import vectorized
+from converter.runner.vectorized import (
+    is_in,
+    is_nullable,
+    null_mask,
+    operators,
+    reduce_stacked,
+    to_float_values,
+    to_int_values,
+    to_object_series,
+    to_typed_columns,
+    with_object_arguments,
+)
+
+
+def test_object_columns_are_all_ints_or_floats___columns_are_typed():
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, 3],
+            "b": [1.5, 2.5, np.nan],
+            "c": [1, 2.5, 3],
+            "d": [1, None, 3],
+            "e": ["1", "2", "3"],
+        },
+        dtype="object",
+    )
+
+    typed = to_typed_columns(df)
+
+    assert typed["a"].dtype == np.int64
+    assert typed["b"].dtype == np.float64
+    assert typed["c"].dtype == object
+    assert typed["d"].dtype == "Int64"
+    assert typed["e"].dtype == object
+
+
+def test_ints_are_too_large_for_numpy___column_is_left_as_object():
+    df = pd.DataFrame({"a": [2**64], "b": [1]}, dtype="object")
+
+    typed = to_typed_columns(df)
+
+    assert typed["a"].dtype == object
+    assert typed["b"].dtype == np.int64
+
+
+def test_columns_contain_none___none_entries_are_masked():
+    df = pd.DataFrame(
+        {
+            "a": [1, None, 3],
+            "b": [1.5, None, np.nan],
+            "c": [1, np.nan, None],
+            "d": [None, None, None],
+        },
+        dtype="object",
+    )
+
+    typed = to_typed_columns(df)
+
+    assert is_nullable(typed["a"])
+    assert list(typed["a"].isna()) == [False, True, False]
+    assert is_nullable(typed["b"])
+    assert list(typed["b"].isna()) == [False, True, False]
+    assert typed["c"].dtype == object
+    assert typed["d"].dtype == object
+
+
+def test_nullable_series_is_converted_back___nulls_are_none():
+    typed = to_typed_columns(
+        pd.DataFrame({"a": [1, None], "b": [np.nan, None]}, dtype="object")
+    )
+
+    a = to_object_series(typed["a"])
+    b = to_object_series(typed["b"])
+
+    assert a.dtype == object
+    assert list(a) == [1, None]
+    assert type(a[0]) is int
+    assert np.isnan(b[0])
+    assert b[1] is None
+
+
+def test_arithmetic_on_nullable_series___result_matches_object_series():
+    values = pd.Series([1, None, 3], dtype="object")
+    typed = to_typed_columns(pd.DataFrame({"a": values}))["a"]
+
+    for op, rhs in [("multiply", 2), ("divide", 2), ("add", 1.5)]:
+        res = operators[op].apply(typed, rhs)
+        expected = operators[op].apply(values, rhs)
+
+        assert [repr(v) for v in to_object_series(res)] == [
+            repr(v) for v in expected
+        ]
+
+
+def test_comparison_with_nullable_series___nulls_match_object_series():
+    values = pd.Series([1, None, 3], dtype="object")
+    typed = to_typed_columns(pd.DataFrame({"a": values}))["a"]
+
+    for op in ["eq", "not_eq", "gt", "lte"]:
+        res = operators[op].apply(typed, 1)
+
+        assert res.dtype == bool
+        assert list(res) == list(operators[op].apply(values, 1))
+
+
+def test_is_in_with_nullable_series___nulls_are_not_matched():
+    typed = to_typed_columns(
+        pd.DataFrame({"a": [1, None, 3]}, dtype="object")
+    )["a"]
+
+    assert list(is_in(typed, [1, 3])) == [True, False, True]
+
+
+def test_function_is_not_vectorized___typed_arguments_are_objects():
+    typed = to_typed_columns(
+        pd.DataFrame({"a": [1, None], "b": [1, 2]}, dtype="object")
+    )
+    fn = with_object_arguments(lambda row, a, b: (a, b))
+
+    a, (b,) = fn(None, typed["a"], [typed["b"]])
+
+    assert list(a) == [1, None]
+    assert b.dtype == object
+
+
+def test_typed_series_is_converted_back___values_are_python_objects():
+    res = to_object_series(pd.Series([1, 2]))
+
+    assert res.dtype == object
+    assert [type(v) for v in res] == [int, int]
+
+
+def test_arithmetic_on_typed_series___result_is_typed():
+    res = operators["multiply"].apply(pd.Series([1, 2, 3]), 2)
+
+    assert res.dtype == np.int64
+    assert list(res) == [2, 4, 6]
+
+
+def test_arithmetic_overflows___result_matches_python_ints():
+    res = operators["multiply"].apply(pd.Series([1, 4]), 2**62)
+
+    assert list(res) == [2**62, 2**64]
+
+
+def test_division_by_zero___error_is_raised():
+    with pytest.raises(ZeroDivisionError):
+        operators["divide"].apply(pd.Series([1, 2]), 0)
+
+
+def test_comparison_with_nan___matches_object_implementation():
+    series = pd.Series([1.5, np.nan])
+
+    assert list(operators["eq"].apply(series, 1.5)) == [True, False]
+    assert list(operators["not_eq"].apply(series, 1.5)) == [False, True]
+
+
+def test_operands_are_not_numeric___object_implementation_is_used():
+    res = operators["add"].apply(pd.Series(["a", "b"], dtype="object"), "c")
+
+    assert list(res) == ["ac", "bc"]
+
+
+def test_values_are_stacked___rows_are_reduced():
+    values = [pd.Series([True, False, False]), pd.Series([True, True, False])]
+
+    assert list(reduce_stacked(values, "any")) == [True, True, False]
+    assert list(reduce_stacked(values, "all")) == [True, False, False]
+
+
+def test_values_are_not_series___stacking_is_not_used():
+    assert reduce_stacked([True, False], "any") is None
+
+
+def test_is_in_with_null_values___nulls_are_not_matched():
+    series = pd.Series([1, None, 3], dtype="object")
+
+    assert list(is_in(series, [1, 3])) == [True, False, True]
+    assert list(is_in(series, [None, 3])) == [False, False, True]
+
+
+def test_values_are_parsed_as_floats___results_match_python_float():
+    values = np.array(["0.1", " 2 ", "1_000", "1e500", "foo", None], object)
+
+    result, failed = to_float_values(values)
+
+    assert list(result[:4]) == [0.1, 2.0, 1000.0, float("inf")]
+    assert list(failed) == [False, False, False, False, True, True]
+
+
+def test_bad_value_in_large_array___only_bad_value_fails(monkeypatch):
+    monkeypatch.setattr(vectorized, "CONVERSION_BLOCK_SIZE", 4)
+    values = np.array([str(i) for i in range(10)] + ["x"], dtype=object)
+
+    result, failed = to_float_values(values)
+
+    assert list(result[:10]) == list(range(10))
+    assert list(np.flatnonzero(failed)) == [10]
+
+
+def test_values_are_parsed_as_ints___floats_are_truncated():
+    values = np.array(["3.9", "-2.5", 1e20, "inf", "nan"], dtype=object)
+
+    result, failed = to_int_values(values)
+
+    assert list(result[:3]) == [3, -2, 10**20]
+    assert [type(v) for v in result[:3]] == [int, int, int]
+    assert list(failed) == [False, False, False, True, True]
+
+
+def test_null_values_are_given___values_and_nulls_are_masked():
+    values = np.array(["NULL", None, float("nan"), "1", 2], dtype=object)
+
+    assert list(null_mask(values, ["NULL"])) == [
+        True,
+        True,
+        True,
+        False,
+        False,
+    ]
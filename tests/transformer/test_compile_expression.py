@@ -0,0 +1,42 @@
+from converter.mapping.base import TransformationEntry
+from converter.transformers.transform import (
+    compile_expression,
+    get_transformer_mapping,
+)
+
+
+def test_compiled_expression_is_reused___each_row_gets_its_own_result():
+    fn = compile_expression("a * 2 + lookup('b c')")
+    mapping = get_transformer_mapping()
+
+    assert fn({"a": 1, "b c": 2}, mapping) == 4
+    assert fn({"a": 3, "b c": 4}, mapping) == 10
+
+
+def test_expression_is_not_a_string___value_is_returned_unchanged():
+    assert compile_expression(5)({}, get_transformer_mapping()) == 5
+
+
+def test_mapping_has_overrides___overrides_are_used_by_compiled_expression():
+    fn = compile_expression("a + b")
+    mapping = get_transformer_mapping({"lookup": lambda r, name: r[name] * 10})
+
+    assert fn({"a": 1, "b": 2}, mapping) == 30
+
+
+def test_compiled_array_is_modified___next_evaluation_is_unchanged():
+    fn = compile_expression("[1, 2, 3]")
+    mapping = get_transformer_mapping()
+
+    fn({}, mapping).append(4)
+
+    assert fn({}, mapping) == [1, 2, 3]
+
+
+def test_entry_is_parsed___when_and_transformation_are_compiled():
+    entry = TransformationEntry(transformation="a + 1", when="a gt 1")
+    entry.parse()
+    mapping = get_transformer_mapping()
+
+    assert entry.when_fn({"a": 2}, mapping) is True
+    assert entry.transformation_fn({"a": 2}, mapping) == 3
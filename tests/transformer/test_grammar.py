@@ -0,0 +1,68 @@
+import lark
+import pytest
+
+from converter.transformers.errors import ParserError, UnexpectedEnd
+from converter.transformers.grammar import _grammar, parser
+from converter.transformers.transform import parse
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "a * 2 + lookup('b c') - 1.5",
+        "a is 1 and b is not 2 or c gte 3",
+        "not any [a, b] is in [1, 2]",
+        "c or all [a, b] lte 4",
+        "replace(a, re'x', 'y', 'z', '')",
+        "join(', ', match(a, ire'b'), search(a, 'c'))",
+        "a is not in [True, False, Null]",
+    ],
+)
+def test_standalone_parser___matches_the_grammar(expression):
+    grammar_parser = lark.Lark(_grammar, parser="lalr")
+
+    assert repr(parser.parse(expression)) == repr(
+        grammar_parser.parse(expression)
+    )
+
+
+@pytest.mark.parametrize(
+    "expression,expected",
+    [
+        ("a is notional", "Tree(eq, [Tree(lookup, [Token(IDENT, 'a')]), "),
+        ("a is inner", "Tree(eq, [Tree(lookup, [Token(IDENT, 'a')]), "),
+        ("a gteb", "Tree(gt, [Tree(lookup, [Token(IDENT, 'a')]), "),
+        ("Trueish", "Tree(lookup, [Token(IDENT, 'Trueish')])"),
+        ("Nullable", "Tree(lookup, [Token(IDENT, 'Nullable')])"),
+    ],
+)
+def test_keyword_starts_identifier___identifier_is_not_split(
+    expression, expected
+):
+    assert repr(parse(expression)).startswith(expected)
+
+
+def test_expression_is_parsed_twice___cached_tree_is_returned():
+    assert parse("a + b") is parse("a + b")
+
+
+def test_expression_is_incomplete___unexpected_end_is_raised():
+    with pytest.raises(UnexpectedEnd):
+        parse("a is 1 and")
+
+
+@pytest.mark.parametrize(
+    "expression",
+    ["re + 1", "any is 1", "not is 1", "x + re", "all", "ire"],
+)
+def test_reserved_word_is_used_as_column___parser_error_is_raised(
+    expression,
+):
+    with pytest.raises(ParserError):
+        parse(expression)
+
+
+def test_reserved_word_is_looked_up___column_is_looked_up():
+    assert repr(parse("lookup('any') is 1")).startswith(
+        "Tree(eq, [Tree(lookup, [Tree(string, [Token(STRING, 'any')])]), "
+    )
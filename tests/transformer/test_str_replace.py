@@ -17,3 +17,25 @@ def test_pattern_is_regex_in_string___string_is_changed():
         run({}, r"replace('foo bar doo bash', re'(.)oo', '\1aa')")
         == "faa bar daa bash"
     )
+
+
+def test_replacement_contains_later_pattern___replacements_are_chained():
+    assert run({}, "replace('ab', 'a', 'b', 'b', 'c')") == "cc"
+
+
+def test_patterns_overlap___earlier_pattern_is_replaced_first():
+    assert run({}, "replace('abc', 'bc', 'x', 'ab', 'y')") == "ax"
+
+
+def test_value_is_a_pattern___value_is_replaced_by_whole_chain():
+    assert run({}, "replace('0300', '0300', '1000', '1000', '2000')") == (
+        "2000"
+    )
+
+
+def test_independent_literal_patterns___all_are_replaced():
+    assert run({}, "replace('a-b-c', 'a', 'x', 'b', 'y', 'c', 'z')") == "x-y-z"
+
+
+def test_replacement_is_not_a_string___replacement_is_applied():
+    assert run({"b": "y"}, "replace('abc', 'a', b, 'c', 'z')") == "ybz"
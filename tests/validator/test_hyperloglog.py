@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+from hypothesis import given
+from hypothesis import strategies as st
+
+from converter.validator.hyperloglog import (
+    HyperLogLog,
+    hash_values,
+    leading_zeros,
+)
+
+
+def sketch(values, precision=14):
+    hashes = hash_values(pd.Series(values, dtype=object))
+    return HyperLogLog.from_hashes(
+        hashes, np.zeros(len(hashes), dtype=np.intp), 1, precision
+    )[0]
+
+
+def test_leading_zeros___bits_are_counted():
+    values = np.array([1, 1 << 40, (1 << 64) - 1], dtype=np.uint64)
+
+    assert list(leading_zeros(values)) == [63, 23, 0]
+
+
+def test_no_values___estimate_is_zero():
+    assert sketch([]).estimate() == 0
+
+
+def test_many_values___estimate_is_within_error():
+    estimate = sketch(range(100000)).estimate()
+
+    assert abs(estimate - 100000) < 100000 * 0.03
+
+
+@given(
+    values=st.lists(st.integers(0, 1000), max_size=50),
+    split=st.integers(0, 50),
+)
+def test_sketches_are_merged___estimate_matches_single_sketch(values, split):
+    merged = sketch(values[:split], 8).merge(sketch(values[split:], 8))
+
+    assert (merged.registers == sketch(values, 8).registers).all()
+    assert merged.estimate() == sketch(values, 8).estimate()
+
+
+def test_groups_are_sketched_separately():
+    hashes = hash_values(pd.Series([1, 2, 3, 1, 1]))
+    sketches = HyperLogLog.from_hashes(
+        hashes, np.array([0, 0, 0, 1, 1]), 3, 10
+    )
+
+    assert [s.estimate() for s in sketches] == [3, 1, 0]
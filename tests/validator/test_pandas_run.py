@@ -5,7 +5,10 @@ import pandas as pd
 import yaml
 
 from converter.validator.base import ValidationResult, ValidationResultEntry
-from converter.validator.pandas import PandasValidator
+from converter.validator.pandas import (
+    PandasValidationCollector,
+    PandasValidator,
+)
 
 
 def test_invalid_operator():
@@ -526,3 +529,164 @@ def test_multi_grouped_sum():
                 ),
             ],
         )
+
+
+def test_data_is_collected_in_chunks___results_match_single_run():
+    val_config = {
+        "entries": {
+            "GroupedSum": {
+                "fields": ["a"],
+                "operator": "sum",
+                "group_by": ["g"],
+            },
+            "Sum": {
+                "fields": ["a", "b"],
+                "operator": "sum",
+            },
+            "Count": {
+                "operator": "count",
+                "group_by": ["g"],
+            },
+            "CountUnique": {
+                "fields": ["a"],
+                "operator": "count-unique",
+            },
+            "GroupedCountUnique": {
+                "fields": ["a", "b"],
+                "operator": "count-unique",
+                "group_by": ["g"],
+            },
+            "Invalid": {
+                "operator": "invalid",
+            },
+        }
+    }
+    data = pd.DataFrame(
+        {
+            "g": [1, 2, 1, 3, 2, None],
+            "a": [1, 3, 5, 7, 9, 2],
+            "b": [0.5, None, 1.5, 0.5, 2, 1],
+        }
+    ).astype(object)
+
+    with TemporaryDirectory() as search_dir:
+        validator = PandasValidator(search_paths=[search_dir])
+
+        with open(
+            os.path.join(search_dir, "validation_fmt_v1_ACC.yaml"), "w"
+        ) as f:
+            yaml.dump(val_config, f)
+
+        collector = PandasValidationCollector(validator, "fmt", "1", "ACC")
+        collector.add(data.iloc[:2])
+        collector.add(data.iloc[2:5])
+        collector.add(data.iloc[5:])
+
+        assert collector.run() == validator.run(data, "fmt", "1", "ACC")
+
+
+def test_collectors_are_merged___results_match_single_run():
+    val_config = {
+        "entries": {
+            "GroupedSum": {
+                "fields": ["a"],
+                "operator": "sum",
+                "group_by": ["g"],
+            },
+            "CountUnique": {
+                "fields": ["a"],
+                "operator": "count-unique",
+                "group_by": ["g"],
+            },
+        }
+    }
+    data = pd.DataFrame({"g": [1, 2, 1, 3, 2], "a": [1, 3, 5, 1, 3]})
+
+    with TemporaryDirectory() as search_dir:
+        validator = PandasValidator(search_paths=[search_dir])
+
+        with open(
+            os.path.join(search_dir, "validation_fmt_v1_ACC.yaml"), "w"
+        ) as f:
+            yaml.dump(val_config, f)
+
+        first = PandasValidationCollector(validator, "fmt", "1", "ACC")
+        first.add(data.iloc[:3])
+        second = PandasValidationCollector(validator, "fmt", "1", "ACC")
+        second.add(data.iloc[3:])
+        first.merge(second)
+
+        assert first.run() == validator.run(data, "fmt", "1", "ACC")
+
+
+def test_no_data_is_collected___results_match_empty_run():
+    val_config = {
+        "entries": {
+            "Sum": {
+                "fields": ["a"],
+                "operator": "sum",
+            },
+            "GroupedCount": {
+                "fields": ["a"],
+                "operator": "count",
+                "group_by": ["g"],
+            },
+        }
+    }
+
+    with TemporaryDirectory() as search_dir:
+        validator = PandasValidator(search_paths=[search_dir])
+
+        with open(
+            os.path.join(search_dir, "validation_fmt_v1_ACC.yaml"), "w"
+        ) as f:
+            yaml.dump(val_config, f)
+
+        collector = PandasValidationCollector(validator, "fmt", "1", "ACC")
+
+        assert collector.run() == validator.run(
+            pd.DataFrame(columns=["g", "a"]), "fmt", "1", "ACC"
+        )
+
+
+def test_approximate_count_unique___values_are_estimated():
+    val_config = {
+        "entries": {
+            "CountUnique": {
+                "fields": ["a"],
+                "operator": "count-unique",
+                "group_by": ["g"],
+                "approximate": True,
+            },
+        }
+    }
+    data = pd.DataFrame(
+        {
+            "g": [1] * 1000 + [2] * 10,
+            "a": list(range(1000)) + [None] + [1] * 9,
+        }
+    )
+
+    with TemporaryDirectory() as search_dir:
+        validator = PandasValidator(search_paths=[search_dir])
+
+        with open(
+            os.path.join(search_dir, "validation_fmt_v1_ACC.yaml"), "w"
+        ) as f:
+            yaml.dump(val_config, f)
+
+        result = validator.run(data, "fmt", "1", "ACC")["validations"][0]
+        estimates = [int(e["value"]) for e in result["entries"]]
+
+        assert [e["groups"] for e in result["entries"]] == [
+            {"g": "1"},
+            {"g": "2"},
+        ]
+        assert abs(estimates[0] - 1000) < 30
+        assert estimates[1] == 1
+
+        collector = PandasValidationCollector(validator, "fmt", "1", "ACC")
+        collector.add(data.iloc[:400])
+        collector.add(data.iloc[400:])
+
+        assert collector.run() == validator.run(data, "fmt", "1", "ACC")